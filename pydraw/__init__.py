@@ -6,4 +6,10 @@ from pydraw.location import Location
 from pydraw.screen import Screen
 from pydraw.scene import Scene
 from pydraw.objects import *
+from pydraw.layer import Layer
+from pydraw.tilemap import TileMap
+from pydraw.largeimage import LargeImage
+from pydraw.tween import Tween
+from pydraw.particles import ParticleSystem
+from pydraw.shapearray import ShapeArray
 # from pydraw.sound import Sound
\ No newline at end of file
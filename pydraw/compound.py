@@ -1,15 +1,21 @@
 from typing import Union, Tuple
 
-from pydraw import Object, Renderable, verify
-from pydraw import Location, Color
+from pydraw import Object, Renderable, CustomRenderable, Image, Text, Line, verify
+from pydraw import Screen, Location, Color
+from pydraw.screen import threadsafe
 from pydraw.errors import *
 
 import math
+import tkinter as tk
 
 
 class CompoundObject(Object):
     """
     A compound group of objects that can be moved or modified together.
+
+    The group keeps its own bounding box up to date as it is moved, so moving the group is a single canvas call
+    (the objects share a canvas tag) and a few additions, however many objects it holds. If you change one of the
+    objects directly, call update() so the group can recalculate its bounds.
     """
 
     def __init__(self, *args, **kwargs):
@@ -19,6 +25,11 @@ class CompoundObject(Object):
         :param kwargs: shapes/objects to use that along with identifiers
         """
         self._objects = {}
+        self._parent = None  # Set if this CompoundObject is itself part of another one
+        self._visible = True
+
+        # Every item in the group shares this canvas tag, so we can raise, lower or hide them all in one call.
+        self._tag = f'pydraw-group-{id(self)}'
 
         for arg in args:
             if not isinstance(arg, Object):
@@ -26,7 +37,7 @@ class CompoundObject(Object):
 
             self._objects[str(arg)] = arg
 
-        for (name, arg) in kwargs:
+        for (name, arg) in kwargs.items():
             if not isinstance(arg, Object):
                 raise InvalidArgumentError('Argument passed to CompoundObject was not an Object:', arg)
 
@@ -36,28 +47,15 @@ class CompoundObject(Object):
             raise InvalidArgumentError('You must pass at least one object to create a CompoundObject!')
 
         values = list(self._objects.values())
+        self._screen = values[0]._screen
 
-        x = values[0].x()
-        y = values[0].y()
-        endx = values[len(self._objects) - 1].x()
-        endy = values[len(self._objects) - 1].y()
-
-        self._location = Location(x, y)
-        self._end = Location(endx, endy)
+        for obj in values:
+            self._tag_object(obj)
 
         self._angle = 0
+        self.update()
 
-        for obj in self._objects.values():
-            if obj.x() < self._location.x():
-                self._location.x(obj.x())
-            elif obj.x() > self._location.x():
-                self._end.x(obj.x())
-
-            if obj.y() < self._location.y():
-                self._location.y(obj.y())
-            elif obj.y() > self._location.y():
-                self._end.y(obj.y())
-
+    @threadsafe
     def x(self, x: float = None) -> float:
         """
         Get the x coordinate of the compound system.
@@ -71,6 +69,7 @@ class CompoundObject(Object):
 
         return self._location.x()
 
+    @threadsafe
     def y(self, y: float = None) -> float:
         """
         Get the y coordinate of the compound system.
@@ -84,31 +83,46 @@ class CompoundObject(Object):
 
         return self._location.y()
 
+    @threadsafe
     def move(self, *args, **kwargs) -> None:
         """
         Move the compound shape by a certain distance (dx, dy)
         :return: None
         """
 
-        for obj in self._objects.values():
-            obj.move(*args, **kwargs)
-            self._location.move(*args, **kwargs)
-            self._end.move(*args, **kwargs)
+        diff = Location(0, 0)
+        diff.move(*args, **kwargs)
+
+        dx, dy = diff.x(), diff.y()
+        if dx == 0 and dy == 0:
+            return
+
+        # The objects only need their positions updated, the canvas moves all of them in one go.
+        self._translate(dx, dy)
+        zoom = self._screen._zoom
+        self._screen._canvas.move(self._tag, dx * zoom, dy * zoom)
 
+    @threadsafe
     def moveto(self, *args, **kwargs) -> None:
         """
         Move the compound shape to a new location (x, y)
         :return: None
         """
 
-        old = self._location.clone()
-        self._location.moveto(*args, **kwargs)
+        target = Location(self._location.x(), self._location.y())
+        target.moveto(*args, **kwargs)
 
-        dx = self._location.x() - old.x()
-        dy = self._location.y() - old.y()
-        self.move(dx, dy)
-        self.update()
+        self.move(target.x() - self._location.x(), target.y() - self._location.y())
+
+    def _translate(self, dx: float, dy: float) -> None:
+        for obj in self._objects.values():
+            obj._translate(dx, dy)
 
+        self._location.move(dx, dy)
+        self._end.move(dx, dy)
+        self._changed()
+
+    @threadsafe
     def width(self, width: float = None) -> float:
         """
         Get the width of the compound object
@@ -121,6 +135,7 @@ class CompoundObject(Object):
 
         return self._end.x() - self._location.x()
 
+    @threadsafe
     def height(self, height: float = None) -> float:
         """
         Get the height of the compound object
@@ -133,6 +148,7 @@ class CompoundObject(Object):
 
         return self._end.y() - self._location.y()
 
+    @threadsafe
     def rotate(self, angle_diff: float, pivot: Location = None) -> None:
         """
         Rotate the angle of the compound object by a difference, around a pivot point, in degrees
@@ -166,6 +182,7 @@ class CompoundObject(Object):
         # Update the values
         self.update()
 
+    @threadsafe
     def rotation(self, angle: float = None) -> float:
         """
         Get the rotation of the compound object
@@ -229,6 +246,10 @@ class CompoundObject(Object):
         else:
             raise InvalidArgumentError('You must pass in a tuple, Location, or two numbers (x, y)!')
 
+        # Nothing outside of our bounds can be inside of any of our objects.
+        if not (self._location.x() <= x <= self._end.x() and self._location.y() <= y <= self._end.y()):
+            return False
+
         for obj in self._objects.values():
             if not isinstance(obj, Renderable):
                 continue
@@ -248,6 +269,10 @@ class CompoundObject(Object):
         if not isinstance(other, Renderable):
             raise TypeError('Passed non-renderable into Renderable#overlaps(), which takes only Renderables!')
 
+        x1, y1, x2, y2 = other._extent()
+        if x2 < self._location.x() or x1 > self._end.x() or y2 < self._location.y() or y1 > self._end.y():
+            return False
+
         for obj in self._objects.values():
             if not isinstance(obj, Renderable):
                 continue
@@ -257,6 +282,7 @@ class CompoundObject(Object):
 
         return False
 
+    @threadsafe
     def front(self) -> None:
         """
         Brings the compound object to the front of the Screen
@@ -264,9 +290,9 @@ class CompoundObject(Object):
         :return: None
         """
 
-        for obj in self._objects:
-            obj.front()
+        self._screen._canvas.tag_raise(self._tag)  # Items keep their order within the group.
 
+    @threadsafe
     def back(self) -> None:
         """
         Brings the compound object to the back of the Screen
@@ -274,9 +300,65 @@ class CompoundObject(Object):
         :return: None
         """
 
-        for obj in self._objects:
-            obj.back()
+        self._screen._canvas.tag_lower(self._tag)
+
+    @threadsafe
+    @validate
+    def visible(self, visible: bool = None) -> bool:
+        """
+        Get or set the visibility of every object in the compound object
+        :param visible: whether the objects should be visible, if any
+        :return: the visibility of the compound object
+        """
+
+        if visible is not None:
+            self._visible = visible
+
+            self._set_visible(visible)
+            self._screen._canvas.itemconfigure(self._tag, state=tk.NORMAL if visible else tk.HIDDEN)
+
+        return self._visible
+
+    def _set_visible(self, visible: bool) -> None:
+        # Keeps the children's own state in step, the canvas is updated through our tag.
+        for obj in self._objects.values():
+            if isinstance(obj, CompoundObject):
+                obj._visible = visible
+                obj._set_visible(visible)
+            elif hasattr(obj, '_visible'):
+                obj._visible = visible
+
+                if visible and obj._state() == tk.HIDDEN:
+                    self._screen._canvas.itemconfigure(obj._ref, state=tk.HIDDEN)  # still culled or baked
+
+    def _extent(self) -> tuple:
+        return self._location.x(), self._location.y(), self._end.x(), self._end.y()
+
+    def _tags(self) -> list:
+        # Our tag, and those of every CompoundObject we are a part of.
+        return [self._tag] + (self._parent._tags() if self._parent is not None else [])
+
+    # noinspection PyProtectedMember
+    def _tag_object(self, obj: Object, tag: bool = True) -> None:
+        """
+        Adds (or removes) our tags to (or from) the canvas items of an object.
+        """
+
+        if isinstance(obj, CompoundObject):
+            obj._parent = self if tag else None
+            target = obj._tag
+        elif getattr(obj, '_ref', None) is not None:
+            target = obj._ref
+        else:
+            return
+
+        for group_tag in self._tags():
+            if tag:
+                self._screen._canvas.addtag_withtag(group_tag, target)
+            else:
+                self._screen._canvas.dtag(target, group_tag)
 
+    @threadsafe
     def add(self, obj: Object, name=None) -> None:
         """
         Add another Object to the CompoundObject
@@ -291,20 +373,15 @@ class CompoundObject(Object):
             name = str(obj)
 
         self._objects[name] = obj
+        self._tag_object(obj)
 
-        # Now we must check if x and y need to change
-        if obj.x() < self._location.x():
-            self._location.x(obj.x())
-
-        if obj.y() < self._location.y():
-            self._location.y(obj.y())
-
-        if obj.x() + obj.width() > self._end.x():
-            self._end.x(obj.x() + obj.width())
-
-        if obj.y() + obj.height() > self._end.y():
-            self._end.y(obj.y() + obj.height())
+        # Now we must check if our bounds need to grow
+        x1, y1, x2, y2 = obj._extent()
+        self._location = Location(min(self._location.x(), x1), min(self._location.y(), y1))
+        self._end = Location(max(self._end.x(), x2), max(self._end.y(), y2))
+        self._changed()
 
+    @threadsafe(getter=False)
     def remove(self, obj: Object = None, name=None) -> Object:
         """
         Remove an object from the Compound Object
@@ -320,6 +397,12 @@ class CompoundObject(Object):
         elif name is not None:
             removed_obj = self._objects.pop(name)
 
+        if removed_obj is not None:
+            self._tag_object(removed_obj, False)
+
+            if len(self._objects) > 0:
+                self.update()
+
         return removed_obj
 
     def object(self, name) -> Object:
@@ -339,6 +422,7 @@ class CompoundObject(Object):
 
         return tuple(self._objects.values())
 
+    @threadsafe
     def color(self, color: Color) -> Color:
         """Change the color of all the objects in the compound object."""
 
@@ -348,26 +432,473 @@ class CompoundObject(Object):
 
             obj.color(color)
 
+    @threadsafe
     def update(self):
-        """Updates values of the compound object."""
+        """Updates values of the compound object (recalculates the bounds from scratch)."""
 
-        values = list(self._objects.values())
+        bounds = [obj._extent() for obj in self._objects.values()]
 
-        x = values[0].x()
-        y = values[0].y()
-        endx = values[len(self._objects) - 1].x()
-        endy = values[len(self._objects) - 1].y()
+        self._location = Location(min(box[0] for box in bounds), min(box[1] for box in bounds))
+        self._end = Location(max(box[2] for box in bounds), max(box[3] for box in bounds))
+        self._changed()
 
-        self._location = Location(x, y)
-        self._end = Location(endx, endy)
 
-        for obj in self._objects.values():
-            if obj.x() < self._location.x():
-                self._location.x(obj.x())
-            elif obj.x() > self._location.x():
-                self._end.x(obj.x())
-
-            if obj.y() < self._location.y():
-                self._location.y(obj.y())
-            elif obj.y() > self._location.y():
-                self._end.y(obj.y())
+class Transform:
+    """
+    A 2D affine transform, which maps (x, y) to (a * x + c * y + tx, b * x + d * y + ty).
+    Rotations are in degrees and turn clockwise on the screen, just like Renderable#rotation().
+    """
+
+    __slots__ = ('a', 'b', 'c', 'd', 'tx', 'ty')
+
+    def __init__(self, a: float = 1, b: float = 0, c: float = 0, d: float = 1, tx: float = 0, ty: float = 0):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.tx = tx
+        self.ty = ty
+
+    @staticmethod
+    def compose(x: float = 0, y: float = 0, rotation: float = 0, scale: float = 1) -> 'Transform':
+        """
+        Creates a transform that scales, then rotates, then translates.
+        :param x: the x translation
+        :param y: the y translation
+        :param rotation: the rotation in degrees
+        :param scale: the uniform scale
+        :return: the Transform
+        """
+
+        theta = math.radians(rotation)
+        cosine = math.cos(theta) * scale
+        sine = math.sin(theta) * scale
+
+        return Transform(cosine, sine, -sine, cosine, x, y)
+
+    def apply(self, x: float, y: float) -> tuple:
+        """
+        Transforms a point.
+        :param x: the x-coordinate
+        :param y: the y-coordinate
+        :return: the transformed point as a tuple of (x, y)
+        """
+
+        return self.a * x + self.c * y + self.tx, self.b * x + self.d * y + self.ty
+
+    def inverse(self) -> 'Transform':
+        """
+        Returns the transform that undoes this one.
+        :return: the inverse Transform
+        """
+
+        determinant = self.a * self.d - self.b * self.c
+        if determinant == 0:
+            raise PydrawError('This transform cannot be inverted (it has a scale of 0)!')
+
+        a = self.d / determinant
+        b = -self.b / determinant
+        c = -self.c / determinant
+        d = self.a / determinant
+
+        return Transform(a, b, c, d, -(a * self.tx + c * self.ty), -(b * self.tx + d * self.ty))
+
+    def rotation(self) -> float:
+        """
+        The rotation of the transform, in degrees.
+        :return: the rotation
+        """
+
+        return math.degrees(math.atan2(self.b, self.a))
+
+    def scale(self) -> float:
+        """
+        The (uniform) scale of the transform.
+        :return: the scale
+        """
+
+        return math.hypot(self.a, self.b)
+
+    def __mul__(self, other: 'Transform') -> 'Transform':
+        # (self * other) applies other first, then self.
+        return Transform(self.a * other.a + self.c * other.b,
+                         self.b * other.a + self.d * other.b,
+                         self.a * other.c + self.c * other.d,
+                         self.b * other.c + self.d * other.d,
+                         self.a * other.tx + self.c * other.ty + self.tx,
+                         self.b * other.tx + self.d * other.ty + self.ty)
+
+    def __eq__(self, other) -> bool:
+        return type(other) is Transform and (self.a, self.b, self.c, self.d, self.tx, self.ty) == \
+            (other.a, other.b, other.c, other.d, other.tx, other.ty)
+
+    def __repr__(self):
+        return f'Transform(a={self.a}, b={self.b}, c={self.c}, d={self.d}, tx={self.tx}, ty={self.ty})'
+
+
+class Node:
+    """
+    A node in a scene graph: it has a position, rotation and scale relative to its parent node, and carries
+    objects (and other nodes) along with it. Rotating a node rotates everything below it around the node's
+    location, so a car is a node with its body, plus two wheel-nodes that spin on their own:
+
+        car = Node(screen, 200, 300)
+        car.add(Rectangle(screen, 140, 270, 120, 40))
+
+        wheel = car.add(Node(screen, -40, 20))  # relative to the car!
+        wheel.add(Oval(screen, 145, 305, 30, 30))
+
+        car.move(5, 0)    # the body and the wheels move
+        wheel.rotate(10)  # only the wheel spins
+
+    Objects keep the position they were added at (relative to the node). World transforms are cached, and a
+    change only marks the node and the branch below it as dirty; dirty branches are re-applied once, right
+    before the screen is next drawn (or immediately, via update()).
+    """
+
+    def __init__(self, screen: Screen, x: float = 0, y: float = 0, rotation: float = 0, scale: float = 1):
+        verify(screen, Screen, x, (float, int), y, (float, int), rotation, (float, int), scale, (float, int))
+
+        self._screen = screen
+        self._parent = None
+
+        self._x = x
+        self._y = y
+        self._angle = rotation
+        self._scale = scale
+
+        self._nodes = []  # child nodes
+        self._leaves = []  # pairs of [object, pose relative to this node]
+
+        self._world = None  # the cached world transform (None when it needs recalculating)
+        self._dirty = False  # our objects need to be placed again (if we're dirty, our whole branch is)
+        self._pending = False  # something at or below us is dirty
+        self._scheduled = False  # (roots only) whether a refresh has been scheduled
+
+    @threadsafe
+    @validate
+    def x(self, x: float = None) -> float:
+        """
+        Get or set the x-coordinate of the node, relative to its parent
+        :param x: the x-coordinate to set, if any
+        :return: the x-coordinate
+        """
+
+        if x is not None:
+            self._x = x
+            self._invalidate()
+
+        return self._x
+
+    @threadsafe
+    @validate
+    def y(self, y: float = None) -> float:
+        """
+        Get or set the y-coordinate of the node, relative to its parent
+        :param y: the y-coordinate to set, if any
+        :return: the y-coordinate
+        """
+
+        if y is not None:
+            self._y = y
+            self._invalidate()
+
+        return self._y
+
+    def location(self) -> Location:
+        """
+        Returns the location of the node, relative to its parent
+        :return: the Location
+        """
+
+        return Location(self._x, self._y)
+
+    @threadsafe
+    def move(self, *args, **kwargs) -> None:
+        """
+        Move the node (relative to its parent). Can take either a tuple, Location, or two numbers (dx, dy)
+        :return: None
+        """
+
+        location = self.location()
+        location.move(*args, **kwargs)
+
+        self._x, self._y = location.x(), location.y()
+        self._invalidate()
+
+    @threadsafe
+    def moveto(self, *args, **kwargs) -> None:
+        """
+        Move the node to a new location (relative to its parent). Takes a Location, tuple, or two numbers (x, y)
+        :return: None
+        """
+
+        location = self.location()
+        location.moveto(*args, **kwargs)
+
+        self._x, self._y = location.x(), location.y()
+        self._invalidate()
+
+    @threadsafe
+    @validate
+    def rotation(self, angle: float = None) -> float:
+        """
+        Get or set the rotation of the node (relative to its parent), in degrees
+        :param angle: the angle to set, if any
+        :return: the rotation
+        """
+
+        if angle is not None:
+            self._angle = angle
+            self._invalidate()
+
+        return self._angle
+
+    @threadsafe
+    @validate
+    def rotate(self, angle_diff: float) -> None:
+        """
+        Rotate the node (and everything below it) around its location
+        :param angle_diff: the angle to rotate by, in degrees
+        :return: None
+        """
+
+        if angle_diff != 0:
+            self._angle += angle_diff
+            self._invalidate()
+
+    @threadsafe
+    @validate
+    def scale(self, scale: float = None) -> float:
+        """
+        Get or set the scale of the node (relative to its parent)
+        :param scale: the scale to set, if any
+        :return: the scale
+        """
+
+        if scale is not None:
+            if scale == 0:
+                raise InvalidArgumentError('The scale of a Node cannot be 0!')
+
+            self._scale = scale
+            self._invalidate()
+
+        return self._scale
+
+    def parent(self) -> 'Node':
+        """
+        Returns the parent of the node (None if it is a root)
+        :return: the parent Node
+        """
+
+        return self._parent
+
+    def nodes(self) -> tuple:
+        """
+        Returns the child nodes of the node
+        :return: a tuple of Nodes
+        """
+
+        return tuple(self._nodes)
+
+    def objects(self) -> tuple:
+        """
+        Returns the objects carried by the node
+        :return: a tuple of Objects
+        """
+
+        return tuple(leaf[0] for leaf in self._leaves)
+
+    @threadsafe
+    def add(self, child: Union['Node', Object]) -> Union['Node', Object]:
+        """
+        Add a child node or an object to this node. Nodes keep their (local) transform, so they are now
+        relative to this node. Objects stay where they are on the screen and move with the node from now on.
+        :param child: the Node or Object to add
+        :return: the child that was added
+        """
+
+        if isinstance(child, Node):
+            ancestor = self
+            while ancestor is not None:
+                if ancestor is child:
+                    raise InvalidArgumentError('A Node cannot be added to itself or to one of its children!')
+                ancestor = ancestor._parent
+
+            if child._parent is not None:
+                child._parent.remove(child)
+
+            child._parent = self
+            self._nodes.append(child)
+            child._invalidate()
+        elif isinstance(child, Object):
+            self._leaves.append([child, self._pose(child, self.world_transform())])
+        else:
+            raise InvalidArgumentError('You can only add Nodes or Objects to a Node!')
+
+        return child
+
+    @threadsafe
+    def remove(self, child: Union['Node', Object]) -> None:
+        """
+        Remove a child node or object from this node (it stays where it is on the screen)
+        :param child: the Node or Object to remove
+        :return: None
+        """
+
+        if isinstance(child, Node):
+            if child in self._nodes:
+                self._nodes.remove(child)
+                child._parent = None
+                child._invalidate()
+            return
+
+        for leaf in self._leaves:
+            if leaf[0] is child:
+                self._leaves.remove(leaf)
+                return
+
+    def local_transform(self) -> Transform:
+        """
+        Returns the transform of the node relative to its parent
+        :return: the Transform
+        """
+
+        return Transform.compose(self._x, self._y, self._angle, self._scale)
+
+    def world_transform(self) -> Transform:
+        """
+        Returns the transform of the node relative to the screen (cached until something above it changes)
+        :return: the Transform
+        """
+
+        if self._world is None:
+            local = self.local_transform()
+            self._world = local if self._parent is None else self._parent.world_transform() * local
+
+        return self._world
+
+    @threadsafe
+    def update(self) -> None:
+        """
+        Places every object in a dirty branch of the graph right away, instead of waiting for the next frame.
+        :return: None
+        """
+
+        self._root()._flush()
+
+    def _root(self) -> 'Node':
+        node = self
+        while node._parent is not None:
+            node = node._parent
+
+        return node
+
+    def _invalidate(self) -> None:
+        self._mark_dirty()
+
+        # Let everything above us know that there is work to do down here.
+        node = self._parent
+        while node is not None and not node._pending:
+            node._pending = True
+            node = node._parent
+
+        root = self._root()
+        if not root._scheduled:
+            root._scheduled = True
+            try:
+                self._screen._root.after_idle(root._flush)
+            except tk.TclError:
+                root._scheduled = False
+
+    def _mark_dirty(self) -> None:
+        # If we are already dirty (and our cache is gone), so is everything below us.
+        if self._dirty and self._world is None:
+            return
+
+        self._dirty = True
+        self._pending = True
+        self._world = None
+
+        for node in self._nodes:
+            node._mark_dirty()
+
+    def _flush(self) -> None:
+        self._scheduled = False
+        self._refresh()
+
+    def _refresh(self) -> None:
+        if self._dirty:
+            world = self.world_transform()
+            for obj, pose in self._leaves:
+                self._place(obj, pose, world)
+
+            self._dirty = False
+            for node in self._nodes:
+                node._refresh()
+        elif self._pending:
+            for node in self._nodes:
+                if node._pending:
+                    node._refresh()
+
+        self._pending = False
+
+    @staticmethod
+    def _pose(obj: Object, world: Transform) -> tuple:
+        """
+        Captures an object's current placement, relative to a node's world transform.
+        """
+
+        inverse = world.inverse()
+
+        if isinstance(obj, Line):
+            return inverse.apply(obj.pos1().x(), obj.pos1().y()), inverse.apply(obj.pos2().x(), obj.pos2().y())
+
+        if isinstance(obj, Renderable):
+            width, height = obj.width(), obj.height()
+            center = inverse.apply(obj.x() + width / 2, obj.y() + height / 2)
+
+            scale = world.scale()
+            return center, obj.rotation() - world.rotation(), width / scale, height / scale
+
+        return inverse.apply(obj.x(), obj.y())
+
+    # noinspection PyProtectedMember
+    @staticmethod
+    def _place(obj: Object, pose: tuple, world: Transform) -> None:
+        """
+        Moves an object to where its pose puts it under a node's world transform.
+        """
+
+        if isinstance(obj, Line):
+            obj.moveto(world.apply(*pose[0]), world.apply(*pose[1]))
+            return
+
+        if not isinstance(obj, Renderable):
+            obj.moveto(*world.apply(*pose))
+            return
+
+        center, angle, width, height = pose
+        cx, cy = world.apply(*center)
+        angle += world.rotation()
+
+        scale = world.scale()
+        width, height = width * scale, height * scale
+
+        if not isinstance(obj, (CustomRenderable, Image)):
+            # Plain Renderables recompute everything from these fields, so we can set them all at once and
+            # send a single update to the canvas.
+            obj._location.moveto(cx - width / 2, cy - height / 2)
+            obj._width, obj._height, obj._angle = width, height, angle
+            obj._update_coords()
+            obj._pen_follow()
+            return
+
+        if not isinstance(obj, Text):  # Text is sized by its font, not by us
+            if obj.width() != width or obj.height() != height:
+                obj.width(width)
+                obj.height(height)
+        if obj.rotation() != angle:
+            obj.rotation(angle)
+
+        obj.moveto(cx - obj.width() / 2, cy - obj.height() / 2)
@@ -0,0 +1,14 @@
+"""
+Settings that change how pydraw behaves as a whole, e.g. `pydraw.config.validation = 'fast'`
+"""
+
+VALIDATION_MODES = ('full', 'fast', 'off')
+
+# How thoroughly the arguments passed to pydraw's methods are checked:
+#   'full' - everything is checked (the default, and the most helpful while writing a program)
+#   'fast' - only the checks compiled ahead of time from the methods' annotations, see util.validate(). These cover the
+#            get/set methods of objects, pens and nodes. Every verify() call is skipped, which means no checks in
+#            constructors, in the methods of the Screen, in methods that take *args (move(), moveto(), center(),
+#            contains()...), or of what's inside tuples (transform(), dashes())
+#   'off'  - nothing is checked, for loops that are already known to work and need every bit of speed
+validation = 'full'
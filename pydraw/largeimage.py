@@ -0,0 +1,404 @@
+"""
+LargeImages: images far too big to decode and draw in one go, shown a tile at a time.
+"""
+
+import math
+import os
+import shutil
+import tempfile
+import tkinter as tk
+import weakref
+from collections import OrderedDict
+
+from pydraw import Screen, Location
+from pydraw.errors import *
+from pydraw.util import *
+
+TILE_SIZE = 256  # The width and height (in pixels of the level they come from) of each tile
+DEFAULT_MEMORY = 128 * 1024 * 1024  # How much memory (in bytes) the tiles in use may take up by default
+
+
+class LargeImage:
+    """
+    An image that is far too big to be decoded and drawn all at once, like a huge map or a scan.
+    (REQUIRES: PIL or Pillow)
+
+    The image is split into tiles at several resolutions (a pyramid): every level is half the size of the one
+    before it. Only the tiles that are in view are drawn, at the level that matches how big the image currently
+    is on the screen, so zooming out on a 20,000x20,000 image never touches its full resolution:
+
+        scan = LargeImage(screen, 'scan.tif', 0, 0, 4000, 4000)
+        screen.camera.zoom(0.25)
+
+    The pyramid is written to a temporary directory as tiles the first time it's needed: the image is decoded
+    once, cut up, and let go (JPEGs are decoded straight at the smaller size of each level instead). From then on
+    tiles are read from disk one at a time, and kept in a least-recently-used cache that is trimmed to stay within
+    the memory budget. The directory is deleted when the image is removed.
+    """
+
+    def __init__(self, screen: Screen, image: str, x: float = 0, y: float = 0, width: float = None,
+                 height: float = None, memory: int = DEFAULT_MEMORY, visible: bool = True):
+        verify(screen, Screen, image, str, x, (float, int), y, (float, int), width, (float, int),
+               height, (float, int), memory, int, visible, bool)
+
+        if not os.path.isfile(image):
+            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
+
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            raise UnsupportedError('As PIL is not installed, LargeImages are not supported! '
+                                   'Install Pillow via: \'pip install pillow\'.')
+
+        self._screen = screen
+        self._filename = image
+
+        # Opening only reads the header, nothing is decoded until a tile needs it.
+        with PILImage.open(image) as source:
+            self._resolution = source.size
+
+        self._location = Location(x, y)
+        self._width = width if width is not None else self._resolution[0]
+        self._height = height if height is not None else self._resolution[1]
+        self._visible = visible
+
+        # The smallest level fits in a single tile.
+        self._levels = max(1, math.ceil(math.log2(max(self._resolution) / TILE_SIZE)) + 1) \
+            if max(self._resolution) > TILE_SIZE else 1
+
+        self._memory = memory
+        self._used = 0
+        self._cache = OrderedDict()  # tile key -> (PhotoImage, size in bytes), oldest first
+
+        self._directory = None  # where the pyramid's tiles are written, once we need them
+        self._cleanup = None
+        self._written = set()  # the levels that are on disk
+
+        self._items = {}  # tile key -> canvas item, for the tiles on the canvas right now
+        self._view = None  # what we drew last time, so we can skip frames where nothing changed
+
+        self._tag = f'pydraw-largeimage-{id(self)}'
+        self._marker = screen._canvas.create_line(0, 0, 0, 0, state=tk.HIDDEN, tags=self._tag)
+
+        # noinspection PyProtectedMember
+        screen._layers.append(self)
+
+    def filename(self) -> str:
+        """
+        Returns the filename of the image
+        :return: the filename
+        """
+
+        return self._filename
+
+    def resolution(self) -> tuple:
+        """
+        Returns the full size of the image in pixels
+        :return: a tuple of (width, height)
+        """
+
+        return self._resolution
+
+    def levels(self) -> int:
+        """
+        Returns the number of levels in the image's pyramid
+        :return: the number of levels
+        """
+
+        return self._levels
+
+    def x(self) -> float:
+        return self._location.x()
+
+    def y(self) -> float:
+        return self._location.y()
+
+    def location(self) -> Location:
+        """
+        Returns the location of the top-left corner of the image
+        :return: the Location
+        """
+
+        return self._location
+
+    def width(self, width: float = None) -> float:
+        """
+        Get or set the width of the image on the screen
+        :param width: the width to set to, if any
+        :return: the width
+        """
+
+        if width is not None:
+            verify(width, (float, int))
+            self._width = width
+            self._view = None
+
+        return self._width
+
+    def height(self, height: float = None) -> float:
+        """
+        Get or set the height of the image on the screen
+        :param height: the height to set to, if any
+        :return: the height
+        """
+
+        if height is not None:
+            verify(height, (float, int))
+            self._height = height
+            self._view = None
+
+        return self._height
+
+    def move(self, *args, **kwargs) -> None:
+        """
+        Move the image. Can take either a tuple, Location, or two numbers (dx, dy)
+        :return: None
+        """
+
+        self._location.move(*args, **kwargs)
+        self._view = None
+
+    def moveto(self, *args, **kwargs) -> None:
+        """
+        Move the top-left corner of the image to a new location. Takes a Location, tuple, or two numbers (x, y)
+        :return: None
+        """
+
+        self._location.moveto(*args, **kwargs)
+        self._view = None
+
+    def memory(self, memory: int = None) -> int:
+        """
+        Get or set how much memory (in bytes) the tiles of the image may take up
+        :param memory: the memory budget to set to, if any
+        :return: the memory budget
+        """
+
+        if memory is not None:
+            verify(memory, int)
+            self._memory = memory
+            self._trim()
+
+        return self._memory
+
+    def visible(self, visible: bool = None) -> bool:
+        """
+        Get or set the visibility of the image
+        :param visible: the new visibility, if any
+        :return: the visibility
+        """
+
+        if visible is not None:
+            verify(visible, bool)
+            self._visible = visible
+            self._view = None
+
+            if not visible:
+                self._clear()
+
+        return self._visible
+
+    def front(self) -> None:
+        """
+        Brings the image to the front of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_raise(self._tag)
+
+    def back(self) -> None:
+        """
+        Brings the image to the back of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_lower(self._tag)
+
+    def update(self) -> None:
+        """
+        Draws the tiles in view right away, instead of waiting for the next frame.
+        :return: None
+        """
+
+        self._refresh()
+
+    def remove(self) -> None:
+        """
+        Removes the image from the Screen (and frees everything it decoded, on disk too)
+        :return: None
+        """
+
+        self._screen._canvas.delete(self._tag)
+        self._items.clear()
+        self._cache.clear()
+        self._used = 0
+
+        if self._cleanup is not None:
+            self._cleanup()
+        self._written.clear()
+
+        if self in self._screen._layers:
+            self._screen._layers.remove(self)
+
+    def _level_for(self, zoom: float) -> int:
+        # The smallest level that still has at least one pixel for every pixel on the screen.
+        scale = (self._width / self._resolution[0]) * zoom
+        if scale <= 0:
+            return self._levels - 1
+
+        return min(self._levels - 1, max(0, int(math.floor(math.log2(1 / scale)))))
+
+    # noinspection PyProtectedMember
+    def _refresh(self) -> None:
+        # Called every frame by the Screen: makes sure exactly the tiles in view are on the canvas.
+        if not self._visible:
+            return
+
+        zoom = self._screen._zoom
+        camera, view_width, view_height = self._screen.camera.bounds()
+
+        level = self._level_for(zoom)
+        factor = 2 ** level
+        level_width, level_height = self._level_size(level)
+        columns = math.ceil(level_width / TILE_SIZE)
+        rows = math.ceil(level_height / TILE_SIZE)
+
+        # The size of a tile on the screen (before zooming).
+        tile_width = TILE_SIZE * factor * self._width / self._resolution[0]
+        tile_height = TILE_SIZE * factor * self._height / self._resolution[1]
+
+        first_column = max(0, int((camera.x() - self._location.x()) // tile_width))
+        first_row = max(0, int((camera.y() - self._location.y()) // tile_height))
+        last_column = min(columns - 1, int((camera.x() + view_width - self._location.x()) // tile_width))
+        last_row = min(rows - 1, int((camera.y() + view_height - self._location.y()) // tile_height))
+
+        view = (level, first_column, first_row, last_column, last_row, zoom, self._location.x(),
+                self._location.y(), self._width, self._height)
+        if view == self._view:
+            return
+        self._view = view
+
+        canvas = self._screen._canvas
+        wanted = {}
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                # Round the edges (not the sizes), so neighbouring tiles meet without gaps.
+                left = self._screen._canvas_x(self._location.x() + column * tile_width)
+                top = self._screen._canvas_y(self._location.y() + row * tile_height)
+                right = self._screen._canvas_x(self._location.x() + min((column + 1) * tile_width, self._width))
+                bottom = self._screen._canvas_y(self._location.y() + min((row + 1) * tile_height, self._height))
+
+                size = (max(1, round(right) - round(left)), max(1, round(bottom) - round(top)))
+                wanted[(level, column, row, size)] = (round(left), round(top))
+
+        for key in [key for key in self._items if key not in wanted]:
+            canvas.delete(self._items.pop(key))
+
+        for key, position in wanted.items():
+            if key in self._items:
+                canvas.coords(self._items[key], *position)
+                continue
+
+            photo = self._tile(*key)
+            ref = canvas.create_image(*position, image=photo, anchor=tk.NW, tags=self._tag)
+            canvas.tag_lower(ref, self._marker)
+            self._items[key] = ref
+
+        self._trim()
+
+    def _clear(self) -> None:
+        for ref in self._items.values():
+            self._screen._canvas.delete(ref)
+
+        self._items.clear()
+
+    def _tile(self, level: int, column: int, row: int, size: tuple):
+        key = (level, column, row, size)
+        photo = self._cached(key)
+        if photo is not None:
+            return photo
+
+        from PIL import Image as PILImage, ImageTk
+
+        with PILImage.open(self._tile_file(level, column, row)) as tile:
+            tile.load()
+            if tile.size != size:
+                tile = tile.resize(size, PILImage.BILINEAR)
+
+            photo = ImageTk.PhotoImage(tile)
+
+        self._store(key, photo, size[0] * size[1] * 4)
+        return photo
+
+    def _tile_file(self, level: int, column: int, row: int) -> str:
+        if level not in self._written:
+            self._write(level)
+
+        return os.path.join(self._directory, f'{level}-{column}-{row}.png')
+
+    def _level_size(self, level: int) -> tuple:
+        factor = 2 ** level
+        return max(1, math.ceil(self._resolution[0] / factor)), max(1, math.ceil(self._resolution[1] / factor))
+
+    def _write(self, level: int) -> None:
+        # Decodes the image once, cuts it into tiles on disk, and lets go of it again.
+        from PIL import Image as PILImage
+
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix='pydraw-largeimage-')
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self._directory, True)
+
+        with PILImage.open(self._filename) as image:
+            if image.format == 'JPEG' and level > 0:
+                # JPEGs can be decoded straight at (roughly) the size we need, which is far quicker and smaller.
+                image.draft(image.mode, self._level_size(level))
+                self._cut(image, level)
+                return
+
+            # Anything else has to be decoded in full, so we cut every level while we have it.
+            image.load()
+            for current in range(self._levels):
+                if current > 0:
+                    image = image.resize(self._level_size(current), PILImage.BILINEAR)
+                if current not in self._written:
+                    self._cut(image, current)
+
+    def _cut(self, image, level: int) -> None:
+        from PIL import Image as PILImage
+
+        width, height = self._level_size(level)
+        if image.size != (width, height):
+            image = image.resize((width, height), PILImage.BILINEAR)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+
+        for row in range(math.ceil(height / TILE_SIZE)):
+            for column in range(math.ceil(width / TILE_SIZE)):
+                box = (column * TILE_SIZE, row * TILE_SIZE,
+                       min((column + 1) * TILE_SIZE, width), min((row + 1) * TILE_SIZE, height))
+                image.crop(box).save(os.path.join(self._directory, f'{level}-{column}-{row}.png'), compress_level=1)
+
+        self._written.add(level)
+
+    def _cached(self, key: tuple):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        self._cache.move_to_end(key)
+        return entry[0]
+
+    def _store(self, key: tuple, value, size: int) -> None:
+        self._cache[key] = (value, size)
+        self._used += size
+
+    def _trim(self) -> None:
+        # Forget the least recently used tiles until we're within budget. Tiles on the canvas must stay alive (Tk
+        # can't draw a PhotoImage that has been collected), so those are never dropped.
+        for key in list(self._cache.keys()):
+            if self._used <= self._memory:
+                break
+            if key in self._items:
+                continue
+
+            self._used -= self._cache.pop(key)[1]
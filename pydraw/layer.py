@@ -0,0 +1,260 @@
+"""
+Layers: groups of objects that can be baked into a single image on the canvas.
+"""
+
+import tkinter as tk
+
+from pydraw import Screen, Color
+from pydraw.objects import Object, Renderable, Image, Text, Line
+from pydraw.errors import *
+from pydraw.util import *
+
+
+class Layer:
+    """
+    A group of objects on the Screen. Static layers are "baked": their objects are drawn once into a single image,
+    which replaces all of their canvas items. Backgrounds made of hundreds of objects (a board, a grid, a field of
+    stars) then cost Tk a single item to draw:
+
+        stars = Layer(screen, *[Oval(screen, x, y, 2, 2, Color('white')) for x, y in positions])
+
+    The objects are still there (and can still be modified), they just aren't drawn on their own. Whenever one of
+    them changes, the layer is baked again on the next frame, so layers are best for things that rarely change.
+
+    Text cannot be baked (Tk's fonts aren't available outside of the canvas), so it is drawn as usual.
+
+    Baking requires PIL.
+    """
+
+    def __init__(self, screen: Screen, *objects: Object, static: bool = True):
+        verify(screen, Screen, static, bool)
+
+        self._screen = screen
+        self._objects = []
+        self._static = False
+
+        self._ref = None  # The baked image item (and its PhotoImage, which must be kept alive)
+        self._photo = None
+        self._dirty = True  # Whether an object has changed since we last baked, see Object._changed()
+        self._zoom = None  # The zoom we last baked at
+
+        for obj in objects:
+            self.add(obj)
+
+        # noinspection PyProtectedMember
+        screen._layers.append(self)
+        self.static(static)
+
+    def add(self, obj: Object) -> Object:
+        """
+        Add an object to the layer
+        :param obj: the Object to add
+        :return: the Object
+        """
+
+        if not isinstance(obj, Object):
+            raise InvalidArgumentError('Only Objects can be added to a Layer!')
+        if obj._layer is not None:
+            raise InvalidArgumentError('That object is already part of a Layer!')
+
+        obj._layer = self
+        self._objects.append(obj)
+        self._dirty = True  # Bake again on the next frame.
+
+        if self._bakes(obj):
+            self._screen._canvas.itemconfigure(obj._ref, state=obj._state())
+
+        return obj
+
+    def remove(self, obj: Object) -> None:
+        """
+        Remove an object from the layer (it is drawn on its own again)
+        :param obj: the Object to remove
+        :return: None
+        """
+
+        if obj not in self._objects:
+            return
+
+        self._objects.remove(obj)
+        obj._layer = None
+        self._dirty = True
+
+        if self._screen.contains(obj):
+            self._screen._canvas.itemconfigure(obj._ref, state=obj._state())
+
+    def objects(self) -> tuple:
+        """
+        Returns the objects in the layer
+        :return: a tuple of Objects
+        """
+
+        return tuple(self._objects)
+
+    def static(self, static: bool = None) -> bool:
+        """
+        Get or set whether the layer is static (baked into a single image)
+        :param static: whether the layer should be static, if any
+        :return: whether the layer is static
+        """
+
+        if static is not None:
+            verify(static, bool)
+
+            if static:
+                try:
+                    import PIL
+                except ImportError:
+                    raise UnsupportedError('As PIL is not installed, layers cannot be baked! '
+                                           'Install Pillow via: \'pip install pillow\'.')
+
+            self._static = static
+            self._dirty = True
+
+            # Our objects' states depend on whether we're static, see Object._state()
+            for obj in self._objects:
+                self._screen._canvas.itemconfigure(obj._ref, state=obj._state())
+
+            if static:
+                self.bake()
+            else:
+                self._clear()
+
+        return self._static
+
+    def bake(self) -> None:
+        """
+        Bakes the layer right away, instead of waiting for the next frame.
+        :return: None
+        """
+
+        if not self._static:
+            raise PydrawError('Only static layers can be baked!')
+
+        self._dirty = False
+        self._zoom = self._screen._zoom
+        self._render()
+
+    def clear(self) -> None:
+        """
+        Removes the layer, drawing its objects on their own again.
+        :return: None
+        """
+
+        for obj in tuple(self._objects):
+            self.remove(obj)
+
+        self._clear()
+        if self in self._screen._layers:
+            self._screen._layers.remove(self)
+
+    def _refresh(self) -> None:
+        # Called every frame by the Screen: bake again, but only if something changed. Our objects tell us when they
+        # do (see Object._changed()), so a layer that hasn't changed costs nothing.
+        if self._static and (self._dirty or self._zoom != self._screen._zoom):
+            self.bake()
+
+    def _clear(self) -> None:
+        if self._ref is not None:
+            self._screen._canvas.delete(self._ref)
+
+        self._ref = None
+        self._photo = None
+
+    def _bakes(self, obj: Object) -> bool:
+        # Whether the object is drawn as part of our image (instead of by itself)
+        return self._static and self._bakeable(obj)
+
+    @staticmethod
+    def _bakeable(obj: Object) -> bool:
+        return not isinstance(obj, Text) and isinstance(obj, (Renderable, Line))
+
+    # noinspection PyProtectedMember
+    def _render(self) -> None:
+        from PIL import Image as PILImage, ImageDraw, ImageTk
+
+        canvas = self._screen._canvas
+        zoom = self._screen._zoom
+
+        # Draw in the same order as the canvas does.
+        order = {ref: index for index, ref in enumerate(canvas.find_all())}
+        objects = sorted((obj for obj in self._objects if self._bakeable(obj) and obj._visible),
+                         key=lambda obj: order.get(obj._ref, -1))
+
+        if len(objects) == 0:
+            self._clear()
+            return
+
+        extents = [obj._extent() for obj in objects]
+        pad = max(self._outline(obj) for obj in objects) + 1  # outlines are drawn around the edges
+        x0 = min(extent[0] for extent in extents) - pad
+        y0 = min(extent[1] for extent in extents) - pad
+        x1 = max(extent[2] for extent in extents) + pad
+        y1 = max(extent[3] for extent in extents) + pad
+
+        image = PILImage.new('RGBA', (max(1, int((x1 - x0) * zoom)), max(1, int((y1 - y0) * zoom))))
+        draw = ImageDraw.Draw(image)
+
+        def point(x, y):
+            return (x - x0) * zoom, (y - y0) * zoom
+
+        for obj in objects:
+            if isinstance(obj, Line):
+                draw.line([point(obj._pos1.x(), obj._pos1.y()), point(obj._pos2.x(), obj._pos2.y())],
+                          fill=self._rgb(obj._color), width=max(1, int(obj._thickness * zoom)))
+            elif isinstance(obj, Image):
+                self._paste(image, obj, point, zoom)
+            else:
+                fill = self._rgb(obj._color) if obj._fill else None
+                outline = self._rgb(obj._border)
+                width = max(1, int(obj._border_width * zoom)) if outline is not None else 0
+
+                item = obj._item  # the kind of canvas item the object uses, see Renderable._item_type()
+                if item == 'polygon':
+                    polygon = [point(vertex.x(), vertex.y()) for vertex in obj.vertices()]
+                    draw.polygon(polygon, fill=fill, outline=outline, width=width)
+                else:
+                    box = [point(obj._location.x(), obj._location.y()),
+                           point(obj._location.x() + obj._width, obj._location.y() + obj._height)]
+                    shape = draw.ellipse if item == 'oval' else draw.rectangle
+                    shape(box, fill=fill, outline=outline, width=width)
+
+        self._photo = ImageTk.PhotoImage(image)
+
+        if self._ref is not None:
+            canvas.delete(self._ref)
+
+        self._ref = canvas.create_image(self._screen._canvas_x(x0), self._screen._canvas_y(y0),
+                                        image=self._photo, anchor=tk.NW)
+        canvas.tag_lower(self._ref, objects[0]._ref)  # Take the place of our lowest object.
+
+    @staticmethod
+    def _paste(image, obj: Image, point, zoom: float) -> None:
+        from PIL import Image as PILImage
+
+        source = obj._original
+        if source is None:
+            if getattr(obj, '_image_name', None) is None:
+                return  # Still loading, we'll bake again once it's done.
+            source = PILImage.open(obj._image_name)
+
+        width, height, angle = obj._width, obj._height, obj._angle
+        state = (obj._frame, width * zoom, height * zoom, obj._color, obj._mask, obj._border, angle)
+        rendered = Image._render(source.copy(), state)
+
+        # Rotated images grow, so we line up their centers.
+        cx, cy = point(obj._location.x() + width / 2, obj._location.y() + height / 2)
+        image.paste(rendered, (int(cx - rendered.width / 2), int(cy - rendered.height / 2)), rendered)
+
+    @staticmethod
+    def _outline(obj: Object) -> float:
+        if isinstance(obj, Line):
+            return obj._thickness
+        return getattr(obj, '_border_width', 0)
+
+    @staticmethod
+    def _rgb(color: Color):
+        if color is None or color == Color.NONE:
+            return None
+
+        return color.rgb()
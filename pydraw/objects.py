@@ -14,15 +14,65 @@ from typing import Union, List
 from pydraw.util import *
 
 from pydraw import Screen
+from pydraw.screen import threadsafe
 from pydraw import Location
 from pydraw import Color
 
 from pydraw.overload import overload
 
 PIXEL_RATIO = 20
+PEN_CHUNK_SIZE = 256  # The most points a single canvas line of a Pen's trail will hold
+OVAL_TOLERANCE = 0.25  # How far (in pixels) an Oval's polygon may stray from a true ellipse
+OVAL_MIN_VERTICES = 8
+OVAL_MAX_VERTICES = 720
 NoneType = type(None)
 
 
+def _simplify(points: list, tolerance: float) -> list:
+    """
+    Ramer-Douglas-Peucker simplification: removes every point that lies within `tolerance` pixels of the
+    line between the points that are kept. The first and last points are always kept.
+    :param points: a list of Locations
+    :param tolerance: the largest distance (in pixels) a removed point may be from the simplified line
+    :return: the simplified list of Locations
+    """
+
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+
+    # We use a stack instead of recursion so long trails can't hit the recursion limit.
+    stack = [(0, len(points) - 1)]
+    while len(stack) > 0:
+        first, last = stack.pop()
+
+        x1, y1 = points[first].x(), points[first].y()
+        x2, y2 = points[last].x(), points[last].y()
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+
+        index, distance = -1, tolerance
+        for i in range(first + 1, last):
+            px, py = points[i].x(), points[i].y()
+
+            if length == 0:
+                current = math.hypot(px - x1, py - y1)
+            else:
+                current = abs(dy * px - dx * py + x2 * y1 - y2 * x1) / length
+
+            if current > distance:
+                index, distance = i, current
+
+        if index != -1:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
 class Pen:
     # Pen for drawing a line as an object moves around on the screen
     def __init__(self, screen: Screen, x: float, y: float, color: Color = Color('black'), width: int = 2, top: bool = False):
@@ -39,9 +89,22 @@ class Pen:
 
         self._drawing = False
 
+        # The trail is split into lines of at most PEN_CHUNK_SIZE points, so each move only has to
+        # resend the coordinates of the last line (the tail), no matter how long the trail gets.
         self._history = []  # stores old line _refs for clearing
-        self._ref = None  # currentLine
-        self._setup()
+        self._history_sizes = []  # how many points each line in the history holds
+        self._history_points = 0
+        self._chunks = []  # the lines of the current trail
+        self._chunk_start = 0  # index into _coordinates where the tail begins
+        self._drawn = 0  # how many coordinates have been sent to the canvas
+        self._ref = None  # currentLine (the tail)
+
+        # Every line the pen draws shares this canvas tag, so styling them all is a single call.
+        self._tag = f'pydraw-pen-{id(self)}'
+
+        # Optional bounds on how much of the trail we keep (see max_points() and simplify_tolerance())
+        self._max_points = None
+        self._tolerance = None
 
     def location(self) -> Location:
         return self._location
@@ -152,7 +215,7 @@ class Pen:
                 else:
                     raise InvalidArgumentError('coordinates() takes tuples/Locations only!')
 
-            self._update()
+            self._rebuild()
 
         return self._coordinates
 
@@ -160,14 +223,26 @@ class Pen:
         self._drawing = True
         self._coordinates = [Location(self._location)]
 
+        # The previous trail (if any) is finished, so it becomes history.
+        for i, line in enumerate(self._chunks):
+            size = PEN_CHUNK_SIZE if i < len(self._chunks) - 1 else self._drawn - self._chunk_start
+            self._history.append(line)
+            self._history_sizes.append(size)
+            self._history_points += size
+
+        self._chunks = []
+        self._chunk_start = 0
+        self._drawn = 0
+
+        self._bound_history()
         self._setup()
+        self._update()
 
     def stop(self):
         if len(self._coordinates) > 0:
             self._location = self._coordinates[-1]
             # don't clear coordinates in case they get altered after we are done drawing
 
-        self._history.append(self._ref)
         self._drawing = False
 
     def drawing(self, drawing: bool = None) -> bool:
@@ -197,76 +272,226 @@ class Pen:
             self._location = self._coordinates[-1]
         self._coordinates = []
 
-        # self._screen._canvas.itemconfigure(self._ref, style=tk.HIDDEN)
-        if self._ref is not None: self._screen._canvas.coords(self._ref, 0, 0, 0, 0)
-        for line in self._history:
-            self._screen._canvas.coords(line, 0, 0, 0, 0)
+        self._screen._canvas.delete(self._tag)
 
         self._history.clear()
+        self._history_sizes.clear()
+        self._history_points = 0
+        self._chunks = []
+        self._chunk_start = 0
+        self._drawn = 0
+        self._ref = None
+
+        if self._drawing:
+            # Keep drawing from where we left off.
+            self._coordinates = [Location(self._location)]
+            self._setup()
+            self._update()
 
+    @validate
     def color(self, color: Color = None) -> Color:
         if color is not None:
-            verify(color, Color)
             self._color = color
-            self._update()
+            self._style()
 
         return self._color
 
+    @validate
     def width(self, width: int = None) -> int:
         if width is not None:
-            verify(width, int)
             self._width = width
-            self._update()
+            self._style()
 
         return self._width
 
+    @validate
     def top(self, top: bool = None) -> bool:
         if top is not None:
-            verify(top, bool)
             self._top = top
-            self._update()
+            self._style()
 
         return self._top
 
+    @validate
+    def max_points(self, max_points: int = None) -> int:
+        """
+        Get or set the most points the pen will remember. Once the trail grows past this, its older part is
+        simplified (see simplify_tolerance()) and the oldest points are dropped, so memory and the number of
+        canvas lines stay bounded however long the pen draws for.
+        :param max_points: the most points to keep (at least 2), or None for no limit
+        :return: the most points that will be kept (None if unbounded)
+        """
+
+        if max_points is not None:
+            if max_points < 2:
+                raise InvalidArgumentError('A pen must be allowed to keep at least 2 points!')
+
+            self._max_points = max_points
+            if self._ref is not None:
+                self._bound()
+                self._bound_history()
+
+        return self._max_points
+
+    @validate
+    def simplify_tolerance(self, tolerance: float = None) -> float:
+        """
+        Get or set how far (in pixels) the older part of a bounded trail may be simplified from the original.
+        This only applies once the trail reaches max_points(); the most recent points are always kept as drawn.
+        :param tolerance: the tolerance in pixels, or None to never simplify
+        :return: the tolerance (None if the trail is never simplified)
+        """
+
+        if tolerance is not None:
+            if tolerance < 0:
+                raise InvalidArgumentError('The simplify tolerance cannot be negative!')
+
+            self._tolerance = tolerance
+
+        return self._tolerance
+
+    def _append(self, location: Location):
+        # Adds a point to the trail (used internally by objects with their pen down).
+        self._coordinates.append(Location(location.x(), location.y()))
+        self._update()
+
+    def _bound(self):
+        """
+        Keeps the trail within max_points. We let it overshoot by a quarter before trimming, so the cost of
+        redrawing the (bounded) trail is spread over many moves.
+        """
+
+        if self._max_points is None:
+            return
+
+        count = len(self._coordinates)
+        if count <= self._max_points + max(1, self._max_points // 4):
+            return
+
+        # The newest half is kept exactly as drawn, everything older is simplified.
+        split = count - self._max_points // 2
+        older = self._coordinates[:split]
+        newer = self._coordinates[split:]
+
+        if self._tolerance is not None and len(older) > 2:
+            # Include the first newer point, so the simplified part still joins up with it.
+            older = _simplify(older + newer[:1], self._tolerance)[:-1] if len(newer) > 0 \
+                else _simplify(older, self._tolerance)
+
+        coordinates = older + newer
+        if len(coordinates) > self._max_points:
+            # Simplifying wasn't enough (or isn't enabled), so the oldest points drop off the end.
+            coordinates = coordinates[len(coordinates) - self._max_points:]
+
+        self._coordinates = coordinates
+        self._rebuild()
+
+    # noinspection PyProtectedMember
+    def _bound_history(self):
+        # Old trails count towards max_points too, oldest lines are removed first.
+        if self._max_points is None:
+            return
+
+        while len(self._history) > 0 and self._history_points > self._max_points:
+            self._screen._canvas.delete(self._history.pop(0))
+            self._history_points -= self._history_sizes.pop(0)
+
     def _setup(self):
+        # Creates a new (empty) tail line, already styled.
+        fill = self._screen._colorstr(self._color) if self._color is not None else ''
+
         # noinspection PyProtectedMember
-        self._ref = self._screen._canvas.create_line(0, 0, 0, 0, fill="", width=2, capstyle=tk.ROUND)
+        self._ref = self._screen._canvas.create_line(0, 0, 0, 0, fill=fill, width=self._width, capstyle=tk.ROUND,
+                                                     tags=self._tag)
+        self._chunks.append(self._ref)
 
     # noinspection PyProtectedMember
     def _update(self):
         if self._ref is None:
             raise PydrawError('Pen has not been started yet!')
 
-        if self._coordinates is not None:
-            cl = []
-            for loc in self._coordinates:
-                x = loc[0]
-                y = loc[1]
+        self._bound()
 
-                cl.append(x - (self._screen.width() / 2))
-                cl.append(y - (self._screen.height() / 2))
+        count = len(self._coordinates)
+        if count == self._drawn:
+            return  # Nothing new to draw.
 
-            self._screen._canvas.coords(self._ref, *cl)
+        offset_x = self._screen.width() / 2
+        offset_y = self._screen.height() / 2
+        zoom = self._screen._zoom
+
+        while count - self._chunk_start > PEN_CHUNK_SIZE:
+            # The tail is full, so we finish it and start a new one. The lines share their end point so the
+            # trail stays connected.
+            end = self._chunk_start + PEN_CHUNK_SIZE
+            self._draw_chunk(self._ref, self._chunk_start, end, offset_x, offset_y, zoom)
+            self._chunk_start = end - 1
+            self._setup()
+
+        self._draw_chunk(self._ref, self._chunk_start, count, offset_x, offset_y, zoom)
+        self._drawn = count
 
-        if self._color is not None:
-            self._screen._canvas.itemconfigure(self._ref,
-                                               fill=self._screen._colorstr(self._color if self._color is not None else Color.NONE))
-            if len(self._history) > 0:
-                for line in self._history:
-                    self._screen._canvas.itemconfigure(line,
-                                                       fill=self._screen._colorstr(self._color if self._color is not None else Color.NONE))
-        if self._width is not None:
-            self._screen._canvas.itemconfigure(self._ref, width=self._width)
-
-            if len(self._history) > 0:
-                for line in self._history:
-                    self._screen._canvas.itemconfigure(line, width=self._width)
         if self._top:
-            self._screen._canvas.tag_raise(self._ref)
+            self._screen._canvas.tag_raise(self._tag)
+
+    # noinspection PyProtectedMember
+    def _draw_chunk(self, ref: int, start: int, end: int, offset_x: float, offset_y: float, zoom: float):
+        cl = []
+        for i in range(start, end):
+            location = self._coordinates[i]
+            cl.append((location.x() - offset_x) * zoom)
+            cl.append((location.y() - offset_y) * zoom)
+
+        if len(cl) == 2:
+            cl *= 2  # A line needs two points, so a single point is drawn as a dot.
+
+        if len(cl) > 0:
+            self._screen._canvas.coords(ref, *cl)
 
-            if len(self._history) > 0:
-                for line in self._history:
-                    self._screen._canvas.tag_raise(line)
+    # noinspection PyProtectedMember
+    def _rebuild(self):
+        # Draws the current trail again from scratch, reusing its lines so they keep their place in the z-order.
+        lines = self._chunks
+        count = len(self._coordinates)
+
+        self._chunks = []
+        self._chunk_start = 0
+
+        offset_x = self._screen.width() / 2
+        offset_y = self._screen.height() / 2
+        zoom = self._screen._zoom
+
+        index = 0
+        while True:
+            end = min(self._chunk_start + PEN_CHUNK_SIZE, count)
+
+            if index < len(lines):
+                self._ref = lines[index]
+                self._chunks.append(self._ref)
+            else:
+                self._setup()
+
+            self._draw_chunk(self._ref, self._chunk_start, end, offset_x, offset_y, zoom)
+            index += 1
+
+            if end >= count:
+                break
+            self._chunk_start = end - 1
+
+        for line in lines[index:]:
+            self._screen._canvas.delete(line)
+
+        self._drawn = count
+
+    # noinspection PyProtectedMember
+    def _style(self):
+        fill = self._screen._colorstr(self._color) if self._color is not None else ''
+
+        # One call each, no matter how many lines the pen has drawn.
+        self._screen._canvas.itemconfigure(self._tag, fill=fill, width=self._width)
+
+        if self._top:
+            self._screen._canvas.tag_raise(self._tag)
 
 
 class Object:
@@ -275,6 +500,12 @@ class Object:
     done with the root in the top left corner, and not at the center.
     """
 
+    _pen = None  # The Pen is only created once it is used, see pen()
+    _culled = False  # Hidden by the screen for being out of view (see Screen.culling())
+    _stale = False  # Its geometry was left alone while culled, and needs updating once it is back in view
+    _bounds = None  # Its _extent(), cached for culling until it changes
+    _layer = None  # The Layer the object is part of, if any
+
     def __init__(self, screen: Screen, x: float = 0, y: float = 0, location: Location = None):
         verify(screen, Screen, x, (float, int), y, (float, int), location, Location)
 
@@ -284,19 +515,18 @@ class Object:
         # noinspection PyProtectedMember
         self._screen._add(self)
 
-        self._pen = Pen(screen, self._location.x(), self._location.y())
-        self._pen._object = self
-
+    @threadsafe
+    @validate
     def x(self, x: float = None) -> float:
         if x is not None:
-            verify(x, (float, int))
             self.moveto(x, self.y())
 
         return self._location.x()
 
+    @threadsafe
+    @validate
     def y(self, y: float = None) -> float:
         if y is not None:
-            verify(y, (float, int))
             self.moveto(self.x(), y)
 
         return self._location.y()
@@ -304,6 +534,7 @@ class Object:
     def location(self) -> Location:
         return self._location
 
+    @threadsafe
     def move(self, *args, **kwargs) -> None:
         """
         Can take either a tuple, Location, or two numbers (dx, dy)
@@ -312,7 +543,9 @@ class Object:
 
         self._location.move(*args, **kwargs)
         self.update()
+        self._pen_follow()
 
+    @threadsafe
     def moveto(self, *args, **kwargs) -> None:
         """
         Move to a new location takes a Location, tuple, or two numbers (x, y)
@@ -321,6 +554,7 @@ class Object:
 
         self._location.moveto(*args, **kwargs)
         self.update()
+        self._pen_follow()
 
     def _get_real_location(self):
         # todo: move this to renderable
@@ -329,6 +563,7 @@ class Object:
 
         return real_x, real_y
 
+    @threadsafe
     def front(self) -> None:
         """
         Brings the object to the front of the Screen
@@ -339,6 +574,7 @@ class Object:
         # noinspection PyProtectedMember
         self._screen._front(self)
 
+    @threadsafe
     def back(self) -> None:
         """
         Brings the object to the back of the Screen
@@ -349,25 +585,145 @@ class Object:
         # noinspection PyProtectedMember
         self._screen._back(self)
 
+    @threadsafe
     def remove(self) -> None:
         self._screen.remove(self)
 
     # Pen methods
-    def pen(self, color: Color = Color('black'), width: int = 2, top: bool = False):
-        pass
+    @threadsafe
+    @validate
+    def pen(self, color: Color = Color('black'), width: int = 2, top: bool = False, max_points: int = None,
+            simplify_tolerance: float = None) -> Pen:
+        """
+        Puts the object's pen down, so it draws a trail behind the object as it moves.
 
-    def pen_clear(self):
-        pass
+        For objects that move for a long time, pass max_points to bound the trail: the most recent points are
+        kept as drawn, older ones are simplified to within simplify_tolerance pixels, and the oldest are dropped.
+        :param color: the color of the trail
+        :param width: the width of the trail
+        :param top: whether the trail should be drawn on top of other objects
+        :param max_points: the most points to keep, if any
+        :param simplify_tolerance: how far (in pixels) the older part of the trail may be simplified, if at all
+        :return: the Pen
+        """
 
-    def pen_stop(self):
-        pass
+        pen = self._get_pen()
+        pen.color(color)
+        pen.width(width)
+        pen.top(top)
+
+        if max_points is not None:
+            pen.max_points(max_points)
+        if simplify_tolerance is not None:
+            pen.simplify_tolerance(simplify_tolerance)
+
+        if not pen.drawing():
+            pen._location = self._pen_location()
+            pen.start()
+
+        return pen
+
+    @threadsafe
+    def pen_clear(self) -> None:
+        """
+        Clears everything the object's pen has drawn
+        :return: None
+        """
+
+        if self._pen is not None:
+            self._pen.clear()
+
+    @threadsafe
+    def pen_stop(self) -> None:
+        """
+        Lifts the object's pen, so it stops drawing (what has been drawn stays on the screen)
+        :return: None
+        """
 
+        if self._pen is not None:
+            self._pen.stop()
+
+    @threadsafe
     def pen_width(self, width: int = None) -> int:
-        pass
+        """
+        Get or set the width of the object's pen
+        :param width: the width to set to, if any
+        :return: the width
+        """
+
+        return self._get_pen().width(width)
 
+    @threadsafe
     def pen_top(self, top: bool = None) -> bool:
+        """
+        Get or set whether the object's pen draws on top of other objects
+        :param top: whether to draw on top, if any
+        :return: whether the pen draws on top
+        """
+
+        return self._get_pen().top(top)
+
+    def _get_pen(self) -> Pen:
+        if self._pen is None:
+            location = self._pen_location()
+            self._pen = Pen(self._screen, location.x(), location.y())
+            self._pen._object = self
+
+        return self._pen
+
+    def _pen_location(self) -> Location:
+        # Where the pen sits on the object.
+        return self._location
+
+    def _pen_follow(self) -> None:
+        # Called whenever the object moves, so its pen (if it is down) follows along.
+        if self._pen is not None and self._pen._drawing:
+            self._pen._append(self._pen_location())
+
+    def _translate(self, dx: float, dy: float) -> None:
+        """
+        Moves the object's own state by (dx, dy) without touching its canvas item. Used by groups, which move
+        all of their items on the canvas at once.
+        """
+
+        self._location.move(dx, dy)
+        self._pen_follow()
+        self._changed()
+
+    def _rezoom(self) -> None:
+        # Called by the Camera after it zooms, for whatever Tk doesn't scale by itself (outlines, images).
         pass
 
+    def _changed(self) -> None:
+        # Lets our Layer know it has to bake again (see Layer._refresh()), and the screen that it has to cull again.
+        self._bounds = None
+        self._screen._reshaped = True
+
+        if self._layer is not None:
+            self._layer._dirty = True
+
+    def _extent(self) -> tuple:
+        """
+        A (conservative) axis-aligned bounding box for the object, computed without touching the canvas.
+        :return: a tuple of (x1, y1, x2, y2)
+        """
+
+        return self._location.x(), self._location.y(), self._location.x(), self._location.y()
+
+    def _state(self) -> str:
+        # The tk state for the object's items: culled objects and those baked into a Layer aren't drawn themselves.
+        hidden = not self._visible or self._culled or (self._layer is not None and self._layer._bakes(self))
+        return tk.HIDDEN if hidden else tk.NORMAL
+
+    # noinspection PyProtectedMember
+    def _cull(self, culled: bool) -> None:
+        self._culled = culled
+        self._screen._canvas.itemconfigure(self._ref, state=self._state())
+
+        if not culled and self._stale:
+            self._stale = False
+            self._update_coords()
+
     # # noinspection PyProtectedMember
     # def add(self) -> None:
     #     """
@@ -392,11 +748,9 @@ class Object:
             return  # We don't want to mess with how stupid tk and turtle are.
 
         if not self._screen.contains(self):
-            if self in self._screen._gridlines or self in self._screen._helpers:
-                return
-
             raise PydrawError('Cannot update or draw object that is not on the Screen!')
 
+    @threadsafe
     def update(self) -> None:
         """
         To be overriden.
@@ -1150,6 +1504,9 @@ class Renderable(Object):
     the item to be remade)
     """
 
+    _native = None  # the Tk item used to draw the shape while unrotated ('rectangle' or 'oval'), if there is one
+    _item = 'polygon'  # the Tk item currently drawing the shape
+
     def __init__(self, screen: Screen, x: float = 0, y: float = 0, width: float = 10, height: float = 10,
                  color: Color = Color('black'),
                  border: Color = Color.NONE,
@@ -1170,16 +1527,18 @@ class Renderable(Object):
 
         self._setup()
 
+    @threadsafe
+    @validate
     def x(self, x: float = None) -> float:
         if x is not None:
-            verify(x, (float, int))
             self.moveto(x, self.y())
 
         return self._location.x()
 
+    @threadsafe
+    @validate
     def y(self, y: float = None) -> float:
         if y is not None:
-            verify(y, (float, int))
             self.moveto(self.x(), y)
 
         return self._location.y()
@@ -1187,6 +1546,7 @@ class Renderable(Object):
     def location(self) -> Location:
         return self._location
 
+    @threadsafe
     def move(self, *args, **kwargs) -> None:
         """
         Can take either a tuple, Location, or two numbers (dx, dy)
@@ -1195,11 +1555,14 @@ class Renderable(Object):
 
         self._location.move(*args, **kwargs)
 
-        new_location = self._screen.canvas_location(self._location.x(), self._location.y())
-        self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        if not self._culled:  # otherwise _update_coords() leaves the item for when it's back in view
+            new_location = self._screen.canvas_location(self._location.x(), self._location.y())
+            self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
         self._update_coords()
+        self._pen_follow()
         # self.update()
 
+    @threadsafe
     def moveto(self, *args, **kwargs) -> None:
         """
         Move to a new location takes a Location, tuple, or two numbers (x, y)
@@ -1208,11 +1571,39 @@ class Renderable(Object):
 
         self._location.moveto(*args, **kwargs)
 
-        new_location = self._screen.canvas_location(self._location.x(), self._location.y())
-        self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        if not self._culled:  # otherwise _update_coords() leaves the item for when it's back in view
+            new_location = self._screen.canvas_location(self._location.x(), self._location.y())
+            self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
         self._update_coords()
+        self._pen_follow()
         # self.update()
 
+    def _pen_location(self) -> Location:
+        # Renderables draw from their center.
+        return Location(self._location.x() + self.width() / 2, self._location.y() + self.height() / 2)
+
+    def _translate(self, dx: float, dy: float) -> None:
+        for vertex in getattr(self, '_vertices', None) or ():
+            vertex.move(dx, dy)
+
+        super()._translate(dx, dy)
+
+    def _rezoom(self) -> None:
+        self._screen._canvas.itemconfigure(self._ref, width=self._border_width * self._screen._zoom)
+
+    def _extent(self) -> tuple:
+        # Rotated objects are boxed by the circle they rotate within.
+        x, y, width, height = self._location.x(), self._location.y(), self._width, self._height
+
+        if self._angle % 360 != 0:
+            cx, cy = x + width / 2, y + height / 2
+            radius = math.hypot(width, height) / 2
+            return cx - radius, cy - radius, cx + radius, cy + radius
+
+        return x, y, x + width, y + height
+
+    @threadsafe
+    @validate
     def width(self, width: float = None) -> float:
         """
         Get or set the width of the object.
@@ -1221,7 +1612,6 @@ class Renderable(Object):
         """
 
         if width is not None:
-            verify(width, (float, int))
             self._width = width
             new_location = self._screen.canvas_location(self._location.x(), self._location.y())
             new_location2 = self._screen.canvas_location(self._location.x() + self._width,
@@ -1239,6 +1629,8 @@ class Renderable(Object):
 
         return self._width
 
+    @threadsafe
+    @validate
     def height(self, height: float = None) -> float:
         """
         Get or set the height of the object
@@ -1247,7 +1639,6 @@ class Renderable(Object):
         """
 
         if height is not None:
-            verify(height, (float, int))
             self._height = height
 
 
@@ -1266,6 +1657,7 @@ class Renderable(Object):
 
         return self._height
 
+    @threadsafe
     def center(self, *args, **kwargs) -> Location:
         """
         Returns the location of the center
@@ -1342,7 +1734,7 @@ class Renderable(Object):
         x_list = []
         y_list = []
 
-        for vertex in self._vertices:
+        for vertex in self.vertices():
             x_list.append(vertex.x())
             y_list.append(vertex.y())
 
@@ -1352,6 +1744,8 @@ class Renderable(Object):
 
         return Location(centroid_x, centroid_y)
 
+    @threadsafe
+    @validate
     def rotation(self, angle: float = None) -> float:
         """
         Get or set the rotation of the object.
@@ -1360,13 +1754,14 @@ class Renderable(Object):
         """
 
         if angle is not None:
-            verify(angle, (float, int))
             self._angle = angle
             self._update_coords()
             # self.update()
 
         return self._angle % 360
 
+    @threadsafe
+    @validate
     def rotate(self, angle_diff: float = 0) -> None:
         """
         Rotate the angle of the object by a difference, in degrees
@@ -1374,7 +1769,6 @@ class Renderable(Object):
         :return: None
         """
 
-        verify(angle_diff, (float, int))
         self.rotation(self._angle + angle_diff)
 
     def angleto(self, obj) -> float:
@@ -1397,6 +1791,7 @@ class Renderable(Object):
 
         return theta
 
+    @threadsafe
     def lookat(self, obj) -> None:
         """
         Look at another object (Objects or Locations)
@@ -1407,6 +1802,7 @@ class Renderable(Object):
         theta = self.angleto(obj)
         self.rotate(theta)
 
+    @threadsafe
     def forward(self, distance: float) -> None:
         """
         Move the Renderable forward by distance at its current heading (rotation/angle)
@@ -1419,6 +1815,7 @@ class Renderable(Object):
 
         self.move(dx, dy)
 
+    @threadsafe
     def backward(self, distance: float) -> None:
         """
         Move the Renderable backward by distance at its current heading (rotation/angle)
@@ -1428,6 +1825,8 @@ class Renderable(Object):
 
         self.forward(-distance)
 
+    @threadsafe
+    @validate
     def color(self, color: Color = None) -> Color:
         """
         Get or set the color of the object
@@ -1436,8 +1835,8 @@ class Renderable(Object):
         """
 
         if color is not None:
-            verify(color, Color)
             self._color = color
+            self._changed()
             # TODO: Can probably improve this speed with a custom _colorstr function on declaration
             color_state = self._color if self._fill else Color.NONE
             self._screen._canvas.itemconfigure(self._ref,
@@ -1446,6 +1845,8 @@ class Renderable(Object):
 
         return self._color
 
+    @threadsafe
+    @validate
     def border(self, color: Color = None, width: float = None, fill: bool = None) -> Color:
         """
         Add or get the border of the object
@@ -1458,27 +1859,27 @@ class Renderable(Object):
         update = False
 
         if color is not None:
-            verify(color, Color)
             self._border = color
             update = True
         if fill is not None:
-            verify(fill, bool)
             self._fill = fill
             update = True
         if width is not None:
-            verify(width, (float, int))
             self._border_width = width
             update = True
 
         if update:
+            self._changed()
             color_state = self._color if self._fill else Color.NONE
             self._screen._canvas.itemconfigure(self._ref, fill=self._screen._colorstr(color_state),
                                                outline=self._screen._screen._colorstr(self._border.__value__()),
-                                               width=self._border_width)
+                                               width=self._border_width * self._screen._zoom)
             # self.update()
 
         return self._border
 
+    @threadsafe
+    @validate
     def border_width(self, width: float = None) -> float:
         """
         Gets or sets the border width
@@ -1487,13 +1888,15 @@ class Renderable(Object):
         """
 
         if width is not None:
-            verify(width, (float, int))
             self._border_width = width
-            self._screen._canvas.itemconfigure(self._ref, width=self._border_width)
+            self._changed()
+            self._screen._canvas.itemconfigure(self._ref, width=self._border_width * self._screen._zoom)
             # self.update()
 
         return self._border_width
 
+    @threadsafe
+    @validate
     def fill(self, fill: bool = None) -> bool:
         """
         Returns or sets the current fill boolean
@@ -1502,8 +1905,8 @@ class Renderable(Object):
         """
 
         if fill is not None:
-            verify(fill, bool)
             self._fill = fill
+            self._changed()
 
             color_state = self._color if self._fill else Color.NONE
             self._screen._canvas.itemconfigure(self._ref, fill=self._screen._colorstr(color_state))
@@ -1526,6 +1929,8 @@ class Renderable(Object):
 
         return math.sqrt((location.x() - self.center().x()) ** 2 + (location.y() - self.center().y()) ** 2)
 
+    @threadsafe
+    @validate
     def visible(self, visible: bool = None) -> bool:
         """
         Get or set the visibility of the renderable.
@@ -1534,15 +1939,17 @@ class Renderable(Object):
         """
 
         if visible is not None:
-            verify(visible, bool)
             self._visible = visible
+            self._changed()
 
-            state = tk.NORMAL if self._visible else tk.HIDDEN
+            state = self._state()
             self._screen._canvas.itemconfigure(self._ref, state=state)
             # self.update()
 
         return self._visible
 
+    @threadsafe
+    @validate
     def transform(self, transform: tuple = None) -> tuple:
         """
         Get or set the transform of the Renderable.
@@ -1554,7 +1961,6 @@ class Renderable(Object):
         """
 
         if transform is not None:
-            verify(transform, tuple)
             if not len(transform) == 3:
                 raise InvalidArgumentError('Ensure you are passing in a Transform from another object or a '
                                            'tuple in the following order: (width, height, rotation)')
@@ -1611,7 +2017,6 @@ class Renderable(Object):
         count = 0
 
         if len(args) == 1:
-            verify(args, (tuple, Location))
             if type(args[0]) is Location:
                 x = args[0].x()
                 y = args[0].y()
@@ -1620,10 +2025,6 @@ class Renderable(Object):
                 y = args[0][1]
         elif len(args) == 2:
             verify(args[0], (float, int), args[1], (float, int))
-            if type(args[0]) is not float and type(args[0]) is not int \
-                    and type(args[1]) is not float and type(args[1]) is not int:
-                raise InvalidArgumentError('Passed arguments must be numbers (x, y), '
-                                           'or you may pass a location/tuple.')
             x = args[0]
             y = args[1]
         else:
@@ -1855,14 +2256,14 @@ class Renderable(Object):
         return False
 
     def _get_vertices(self):
+        if self._vertices is None:
+            # Native items don't need vertices to be drawn, so we only calculate them when asked.
+            self._vertices = self._calculate_vertices()
+
         real_shape = self._vertices
         return real_shape
 
-    def _setup(self):
-        if not hasattr(self, '_shape'):
-            raise AttributeError('An error occurred while initializing a Renderable: '
-                                 'Is _shape set? (Advanced Users Only)')
-
+    def _calculate_vertices(self) -> list:
         shape = self._shape  # List of normal vertices.
 
         width = self._width
@@ -1880,27 +2281,63 @@ class Renderable(Object):
 
             vertex.move(self.x() + width / 2, self.y() + height / 2)
 
-        self._vertices = vertices
+        if self._angle % 360 != 0:
+            vertices = self._rotate(vertices, self._angle)
 
-        self._vertices = self._rotate(self._vertices, self._angle)
+        return vertices
+
+    def _item_type(self) -> str:
+        # Unrotated shapes with a native Tk item only need two coordinates, which is much cheaper for Tk to draw.
+        if self._native is not None and self._angle % 360 == 0:
+            return self._native
+
+        return 'polygon'
+
+    def _item_coords(self, item: str) -> list:
+        if item != 'polygon':
+            self._vertices = None  # see _get_vertices()
+
+            x, y = self._location.x(), self._location.y()
+            return [self._screen._canvas_x(x), self._screen._canvas_y(y),
+                    self._screen._canvas_x(x + self._width), self._screen._canvas_y(y + self._height)]
+
+        self._vertices = self._calculate_vertices()
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append(self._screen._canvas_x(vertex.x()))
+            tk_vertices.append(self._screen._canvas_y(vertex.y()))
+
+        return tk_vertices
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+    def _create_item(self, item: str, coords: list, tags: tuple = ()) -> int:
+        state = self._state()
         color_state = self._color if self._fill else Color.NONE
 
+        options = {}
+        if item == 'polygon':
+            options['joinstyle'] = tk.MITER
+
+        self._item = item
+
         # noinspection PyProtectedMember
-        self._ref = self._screen._canvas.create_polygon(
-            tk_vertices,
+        return getattr(self._screen._canvas, 'create_' + item)(
+            coords,
             fill=self._screen._colorstr(color_state),
             outline=self._screen._screen._colorstr(self._border.__value__()),
-            width=self._border_width,
+            width=self._border_width * self._screen._zoom,
             state=state,
-            joinstyle=tk.MITER
+            tags=tags,
+            **options
         )
+
+    def _setup(self):
+        if not hasattr(self, '_shape'):
+            raise AttributeError('An error occurred while initializing a Renderable: '
+                                 'Is _shape set? (Advanced Users Only)')
+
+        item = self._item_type()
+        self._ref = self._create_item(item, self._item_coords(item))
         # self.update() # CustomPolygon(self._screen, vertices)
 
     def _rotate(self, vertices: list, angle: float, pivot: Location = None) -> list:
@@ -1932,78 +2369,39 @@ class Renderable(Object):
         return new_vertices
 
     def _update_coords(self):
-        shape = self._shape  # List of normal vertices.
-
-        width = self._width
-        height = self._height
+        self._changed()
 
-        scale_factor = (width / PIXEL_RATIO, height / PIXEL_RATIO)
-
-        cx = 0
-        cy = 0
-
-        vertices = [Location(vertex[0], vertex[1]) for vertex in shape]
-
-        for vertex in vertices:
-            vertex.moveto(scale_factor[0] * (vertex.x() - cx) + cx, -scale_factor[1] * (vertex.y() - cy) + cy)
-
-            vertex.move(self.x() + width / 2, self.y() + height / 2)
-
-        self._vertices = vertices
+        if self._culled:
+            # Nobody can see us, so we'll catch up once we're back in view (see Object._cull()).
+            self._vertices = None
+            self._stale = True
+            return
 
-        if self._angle % 360 != 0:
-            self._vertices = self._rotate(self._vertices, self._angle)
+        item = self._item_type()
+        coords = self._item_coords(item)
 
-        tk_vertices = []  # we need to convert to tk's coordinate system.
-        for vertex in self._vertices:
-            tk_vertices.append(vertex.x() - (self._screen.width() / 2))
-            tk_vertices.append((vertex.y() - (self._screen.height() / 2)))
+        if item != self._item:
+            # We've been rotated onto (or off of) a native item, so we have to switch to the other kind.
+            self._replace_item(item, coords)
+            return
 
-        self._screen._canvas.coords(self._ref, tk_vertices)
+        self._screen._canvas.coords(self._ref, coords)
 
+    @threadsafe
     def update(self):
         self._check()
-
-        old_ref = self._ref
-        shape = self._shape  # List of normal vertices.
-
-        width = self._width
-        height = self._height
-
-        scale_factor = (width / PIXEL_RATIO, height / PIXEL_RATIO)
-
-        cx = 0
-        cy = 0
-
-        vertices = [Location(vertex[0], vertex[1]) for vertex in shape]
-        self._vertices = vertices
-
-        for vertex in vertices:
-            vertex.moveto(scale_factor[0] * (vertex.x() - cx) + cx, -scale_factor[1] * (vertex.y() - cy) + cy)
-
-            vertex.move(self.x() + width / 2, self.y() + height / 2)
-
-        self._vertices = self._rotate(self._vertices, self._angle)
+        self._changed()
         self._last_angle = self._angle
 
-        tk_vertices = []  # we need to convert to tk's coordinate system.
-        for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+        item = self._item_type()
+        self._replace_item(item, self._item_coords(item))
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
-        color_state = self._color if self._fill else Color.NONE
+    def _replace_item(self, item: str, coords: list) -> None:
+        # The new item takes the old one's place in the stacking order (and its tags).
+        old_ref = self._ref
 
         try:
-            # noinspection PyProtectedMember
-            self._ref = self._screen._canvas.create_polygon(
-                tk_vertices,
-                fill=self._screen._colorstr(color_state),
-                outline=self._screen._screen._colorstr(self._border.__value__()),
-                width=self._border_width,
-                state=state,
-                joinstyle=tk.MITER
-            )
+            self._ref = self._create_item(item, coords, self._screen._canvas.gettags(old_ref))
 
             self._screen._canvas.tag_lower(self._ref, old_ref)  # noqa
             self._screen._canvas.delete(old_ref)  # noqa
@@ -2133,6 +2531,7 @@ class RoundedRectangle(CustomRenderable):
     #     raise NotImplemented("This method is not allowed for `Rounded` shapes.")
     border = property(doc='(!) Disallowed inherited')
 
+    @threadsafe
     def radius(self, radius: float = None) -> float:
         """
         Set the border radius of the rounded shape.
@@ -2174,10 +2573,9 @@ class RoundedRectangle(CustomRenderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
         color_state = self._color if self._fill else Color.NONE
 
         print(self._border_width)
@@ -2186,14 +2584,16 @@ class RoundedRectangle(CustomRenderable):
             tk_vertices,
             fill=self._screen._colorstr(color_state),
             outline=self._screen._colorstr(self._color),  # self._screen._screen._colorstr(self._border.__value__()),
-            width=self._border_width,
+            width=self._border_width * self._screen._zoom,
             state=state,
             joinstyle=tk.ROUND
         )
         # self.update() # CustomPolygon(self._screen, vertices)
 
+    @threadsafe
     def update(self):
         self._check()
+        self._changed()
 
         old_ref = self._ref
         shape = self._shape  # List of normal vertices.
@@ -2219,10 +2619,9 @@ class RoundedRectangle(CustomRenderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
         color_state = self._color if self._fill else Color.NONE
 
         try:
@@ -2231,8 +2630,9 @@ class RoundedRectangle(CustomRenderable):
                 tk_vertices,
                 fill=self._screen._colorstr(color_state),
                 outline=self._screen._screen._colorstr(self._border.__value__()),
-                width=self._border_width,
+                width=self._border_width * self._screen._zoom,
                 state=state,
+                tags=self._screen._canvas.gettags(old_ref),
                 joinstyle=tk.ROUND
             )
 
@@ -2299,21 +2699,18 @@ class CustomPolygon(CustomRenderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in real_vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
+        state = self._state()
 
         self._ref = self._screen._screen.cv.create_polygon(
             tk_vertices,
             fill=self._screen._colorstr(color_state),
             outline=self._screen._screen._colorstr(self._border.__value__()),
-            width=self._border_width,
+            width=self._border_width * self._screen._zoom,
             state=state
         )
 
-        self._pen = Pen(screen, self._location.x(), self._location.y())
-        self._pen._object = self
-
+    @threadsafe
     def move(self, *args, **kwargs):
         """
         Can take either a tuple, Location, or two numbers (dx, dy)
@@ -2322,8 +2719,11 @@ class CustomPolygon(CustomRenderable):
 
         self._location.move(*args, **kwargs)
 
+        self._changed()
+
         new_location = self._screen.canvas_location(self._location.x(), self._location.y())
         self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        self._pen_follow()
 
         # for vertice in self._vertices:
         #     vertice.move(*args, **kwargs)
@@ -2331,6 +2731,7 @@ class CustomPolygon(CustomRenderable):
         # self._location.move(*args, **kwargs)
         # self.update()
 
+    @threadsafe
     def moveto(self, *args, **kwargs):
         """
         Move to a new location takes a Location, tuple, or two numbers (x, y)
@@ -2339,9 +2740,14 @@ class CustomPolygon(CustomRenderable):
 
         self._location.moveto(*args, **kwargs)
 
+        self._changed()
+
         new_location = self._screen.canvas_location(self._location.x(), self._location.y())
         self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        self._pen_follow()
 
+    @threadsafe
+    @validate
     def width(self, width: float = None) -> float:
         """
         Get the width of the CustomPolygon
@@ -2350,7 +2756,6 @@ class CustomPolygon(CustomRenderable):
         """
 
         if width is not None:
-            verify(width, (float, int))
             # self._width = width
             print(f'updating coords')
             self._update_coords(width=width)
@@ -2360,6 +2765,8 @@ class CustomPolygon(CustomRenderable):
 
         return self._width
 
+    @threadsafe
+    @validate
     def height(self, height: float = None) -> float:
         """
         Get the height of the Polygon
@@ -2368,7 +2775,6 @@ class CustomPolygon(CustomRenderable):
         """
 
         if height is not None:
-            verify(height, (float, int))
             # self._height = height
             self._update_coords(height=height)
 
@@ -2377,9 +2783,9 @@ class CustomPolygon(CustomRenderable):
 
         return self._height
 
+    @threadsafe
+    @validate
     def rotate(self, angle_diff: float = 0) -> None:
-        verify(angle_diff, (float, int))
-
         self._angle += angle_diff
 
         if self._angle >= 360:
@@ -2387,14 +2793,16 @@ class CustomPolygon(CustomRenderable):
 
         self._update_coords()
 
+    @threadsafe
+    @validate
     def rotation(self, angle: float = None) -> float:
         if angle is not None:
-            verify(angle, (float, int))
             self._angle = angle
             self._update_coords()
 
         return self._angle
 
+    @threadsafe
     def center(self, *args, **kwargs) -> Location:
         """
         Returns the location of the center
@@ -2477,6 +2885,10 @@ class CustomPolygon(CustomRenderable):
         self._current_vertices = self._get_ref_vertices()  # update vertices during a non-intensive call, typically
         return self._current_vertices
 
+    def _translate(self, dx: float, dy: float) -> None:
+        # Our vertices are read back from the canvas, so only the location needs to move.
+        Object._translate(self, dx, dy)
+
     def clone(self):
         """
         Clone this CustomPolygon!
@@ -2485,6 +2897,7 @@ class CustomPolygon(CustomRenderable):
         return CustomPolygon(self._screen, self._vertices, self._color, self._border, self._fill, self._angle,
                              self._visible)
 
+    @threadsafe
     def transform(self, transform: tuple = None) -> tuple:
         if transform is not None:
             raise UnsupportedError('Setting Renderable#transform() is not supported for CustomPolygon!')
@@ -2524,10 +2937,11 @@ class CustomPolygon(CustomRenderable):
         for j in range(0, len(tk_coords), 2):
             x = tk_coords[j]
             y = tk_coords[j + 1]
-            new_vertices.append(Location(x + self._screen.width() / 2, y + self._screen.height() / 2))
+            new_vertices.append(self._screen.create_location(x, y, canvas=True))
         return new_vertices
 
     def _update_coords(self, width: float = None, height: float = None):
+        self._changed()
         width = width if width is not None else self._width
         height = height if height is not None else self._height
 
@@ -2552,14 +2966,16 @@ class CustomPolygon(CustomRenderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._current_vertices:
-            tk_vertices.append(vertex.x() - (self._screen.width() / 2))
-            tk_vertices.append((vertex.y() - (self._screen.height() / 2)))
+            tk_vertices.append(self._screen._canvas_x(vertex.x()))
+            tk_vertices.append(self._screen._canvas_y(vertex.y()))
 
         print('new coords', self._current_vertices)
         self._screen._canvas.coords(self._ref, tk_vertices)
 
+    @threadsafe
     def update(self):
         self._check()
+        self._changed()
 
         old_ref = self._ref
 
@@ -2601,19 +3017,19 @@ class CustomPolygon(CustomRenderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._current_vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
 
         color_state = self._color if self._fill else Color.NONE
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         self._ref = self._screen._screen.cv.create_polygon(
             tk_vertices,
             fill=self._screen._colorstr(color_state),
             outline=self._screen._screen._colorstr(self._border.__value__()),
-            width=self._border_width,
-            state=state
+            width=self._border_width * self._screen._zoom,
+            state=state,
+            tags=self._screen._screen.cv.gettags(old_ref)
         )
 
         self._screen._screen.cv.tag_lower(self._ref, old_ref)
@@ -2621,6 +3037,8 @@ class CustomPolygon(CustomRenderable):
 
 
 class Rectangle(Renderable):
+    _native = 'rectangle'
+
     # Full constructor for cloning
     @overload(Screen, (int, float), (int, float), (int, float), (int, float), Color, Color, bool, int, bool)
     def __init__(self, screen: Screen, x: float, y: float, width: float, height: float,
@@ -2722,6 +3140,9 @@ class Oval(Renderable):
                 (-9.51, -3.09), (-8.09, -5.88), (-5.88, -8.09),
                 (-3.09, -9.51), (-0.00, -10.00), (3.09, -9.51),
                 (5.88, -8.09), (8.09, -5.88), (9.51, -3.09))
+    _native = 'oval'
+    _tessellations = {}  # vertex count -> shape, shared by every Oval
+    _tessellated = True  # whether the vertex count follows the size of the Oval
 
     # Full constructor for cloning
     @overload(Screen, (int, float), (int, float), (int, float), (int, float), Color, Color, bool, int, bool)
@@ -2734,10 +3155,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, (int, float), (int, float), (int, float), (int, float))
@@ -2750,10 +3170,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, (int, float), (int, float), (int, float), (int, float), Color)
@@ -2766,10 +3185,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, (int, float), (int, float), (int, float), (int, float), Color, Color)
@@ -2782,10 +3200,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, Location, (int, float), (int, float))
@@ -2801,10 +3218,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, Location, (int, float), (int, float), Color)
@@ -2820,10 +3236,9 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
     @overload(Screen, Location, (int, float), (int, float), Color, Color)
@@ -2839,12 +3254,13 @@ class Oval(Renderable):
         self._width = width
         self._height = height
 
-        self._wedges = PIXEL_RATIO
-
-        vertices = self._convert_vertices()
+        vertices = self._convert_vertices(screen._zoom)
         self._shape = vertices
+        self._wedges = len(vertices)
         super().__init__(screen, x, y, width, height, color, border, fill, rotation, visible)
 
+    @threadsafe
+    @validate
     def width(self, width: float = None) -> float:
         """
         Get or set the width of the object.
@@ -2853,12 +3269,13 @@ class Oval(Renderable):
         """
 
         if width is not None:
-            verify(width, (float, int))
             self._width = width
             self._update_coords()
 
         return self._width
 
+    @threadsafe
+    @validate
     def height(self, height: float = None) -> float:
         """
         Get or set the height of the object.
@@ -2867,14 +3284,28 @@ class Oval(Renderable):
         """
 
         if height is not None:
-            verify(height, (float, int))
             self._height = height
             self._update_coords()
 
         return self._height
 
+    def _rezoom(self) -> None:
+        super()._rezoom()
+
+        # Looking bigger (or smaller) may take more (or fewer) vertices.
+        if self._tessellated and self._item == 'polygon' and self._convert_vertices() is not self._shape:
+            self._update_coords()
+
+    def _item_type(self) -> str:
+        # A rotated circle looks exactly like an unrotated one, so it can stay a native oval.
+        if self._native is not None and self._width == self._height:
+            return self._native
+
+        return super()._item_type()
+
+    @threadsafe
+    @validate
     def wedges(self, wedges: int = None) -> int:
-        verify(wedges, int)
         if wedges < 20:
             raise InvalidArgumentError('Ovals can be at least 20 wedges. If you need less, '
                                        'just multiply your desired amount by 2 until it is above 20!')
@@ -2882,6 +3313,8 @@ class Oval(Renderable):
         if wedges is not None:
             self._shape = self._generate_vertices(PIXEL_RATIO / 2, wedges=wedges)
             self._wedges = wedges
+            self._tessellated = False
+            self._native = None  # a specific number of wedges has to be drawn as a polygon
             self.update()
 
         return self._wedges
@@ -2909,12 +3342,38 @@ class Oval(Renderable):
             slices.append(slc)
         return slices
 
-    def _convert_vertices(self):
-        radius = ((self._width + self._height) / 2) / 2
-        angle = 18 if radius <= 150 else (radius * 9) / 300
-        shape_vertices = self._generate_vertices(PIXEL_RATIO / 2, angle)
+    def _convert_vertices(self, zoom: float = None):
+        # Use just enough vertices to stay within OVAL_TOLERANCE of the real outline, so tiny Ovals stay cheap
+        # and big ones stay smooth. Every size that needs the same count shares a single shape. The radius is measured
+        # on screen (zoom included), as that's where the outline has to look round. The constructors pass the zoom in,
+        # as they run before the Screen is attached.
+        if zoom is None:
+            zoom = self._screen._zoom
 
-        return shape_vertices
+        radius = max(abs(self._width), abs(self._height)) / 2 * zoom
+
+        if radius <= OVAL_TOLERANCE:
+            count = OVAL_MIN_VERTICES
+        else:
+            count = math.ceil(math.pi / math.acos(1 - OVAL_TOLERANCE / radius))
+            count = -(-count // 4) * 4  # keep the shape symmetrical on both axes
+            count = min(max(count, OVAL_MIN_VERTICES), OVAL_MAX_VERTICES)
+
+        shape = Oval._tessellations.get(count)
+        if shape is None:
+            radius = PIXEL_RATIO / 2
+            shape = tuple((radius * math.cos(2 * math.pi * i / count), radius * math.sin(2 * math.pi * i / count))
+                          for i in range(count))
+            Oval._tessellations[count] = shape
+
+        return shape
+
+    def _calculate_vertices(self) -> list:
+        if self._tessellated:
+            self._shape = self._convert_vertices()
+            self._wedges = len(self._shape)
+
+        return super()._calculate_vertices()
 
     @staticmethod
     def _generate_vertices(radius, angle: float = 18, wedges: int = None):
@@ -3183,23 +3642,24 @@ class Polygon(Renderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         # noinspection PyProtectedMember
         self._ref = self._screen._canvas.create_polygon(
             tk_vertices,
             fill=self._screen._colorstr(self._color),
             outline=self._screen._screen._colorstr(self._border.__value__()),
-            width=self._border_width,
+            width=self._border_width * self._screen._zoom,
             state=state
         )
 
     # noinspection PyProtectedMember
+    @threadsafe
     def update(self):
         self._check()
+        self._changed()
 
         old_ref = self._ref
         shape = self._shape  # List of normal vertices.
@@ -3236,10 +3696,9 @@ class Polygon(Renderable):
 
         tk_vertices = []  # we need to convert to tk's coordinate system.
         for vertex in self._vertices:
-            tk_vertices.append((vertex.x() - (self._screen.width() / 2),
-                                (vertex.y() - (self._screen.height() / 2))))
+            tk_vertices.append((self._screen._canvas_x(vertex.x()), self._screen._canvas_y(vertex.y())))
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
         color_state = self._color if self._fill else Color.NONE
 
         try:
@@ -3248,8 +3707,9 @@ class Polygon(Renderable):
                 tk_vertices,
                 fill=self._screen._colorstr(color_state),
                 outline=self._screen._screen._colorstr(self._border.__value__()),
-                width=self._border_width,
+                width=self._border_width * self._screen._zoom,
                 state=state,
+                tags=self._screen._canvas.gettags(old_ref),
                 joinstyle=tk.MITER
             )
 
@@ -3259,408 +3719,362 @@ class Polygon(Renderable):
             pass
 
 
-class Image(Renderable):
+class SpriteSheet:
     """
-    Image class. Supports basic formats: PNG, GIF, JPG, PPM, images.
+    A sprite sheet (or texture atlas): many images packed into a single file. (REQUIRES: PIL or Pillow)
 
-    NOTE: This class supports the basic displaying of images, but also supports much more,
-    such as image modification (width, height, color, etc) if you have PIL (Pillow) installed!
-    You can install PIL/Pillow by running: `pip install pillow` in a terminal!
-    """
-
-    TKINTER_TYPES = ['.png', '.gif', '.ppm']
-
-    # (x, y) INITIALIZERS
+    The file is read and decoded only once; sprites are sliced out of it lazily and cached, so an entire
+    set of assets costs a single read and decode.
 
-    @overload(Screen, str, (int, float), (int, float), (int, float), (int, float), Color, Color, int, bool)
-    def __init__(self, screen: Screen, image: str, x: float = 0, y: float = 0,
-                 width: float = None,
-                 height: float = None,
-                 color: Color = None,
-                 border: Color = Color.NONE,
-                 rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
+    Regions can be named explicitly, or the sheet can be cut into a grid of equally-sized cells:
+        atlas = SpriteSheet('pieces.png', {'knight_white': (0, 0, 64, 64), 'knight_black': (64, 0, 64, 64)})
+        atlas = SpriteSheet('pieces.png', cell=(64, 64), names=['king_white', 'queen_white', ...])
 
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
+    Indexing the sheet returns a Sprite, which can be passed to Image in place of a filename:
+        knight = Image(screen, atlas['knight_white'], 100, 100)
+    """
 
-        filetype = split[len(split) - 1]
+    def __init__(self, image: str, regions: dict = None, cell: tuple = None, names: list = None):
+        verify(image, str, regions, dict, cell, tuple, names, list)
 
         import os
         if not os.path.isfile(image):
             raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
 
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            raise UnsupportedError('As PIL is not installed, sprite sheets are not supported! '
+                                   'Install Pillow via: \'pip install pillow\'.')
 
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
+        self._filename = image
 
-        self._width = self._image.width()
-        self._height = self._image.height()
+        # Read and decode the whole sheet exactly once.
+        self._sheet = PILImage.open(image).convert('RGBA')
 
-        self._frame = -1
-        self._frames = -1
+        self._regions = {}
+        self._sprites = {}
+        self._crops = {}
+        self._photos = {}
 
-        self._mask = 123
+        if regions is not None:
+            for name, box in regions.items():
+                self.region(name, *box)
 
-        self._shape = ((-10, 10), (10, 10), (10, -10), (-10, -10))
+        if cell is not None:
+            if len(cell) != 2:
+                raise InvalidArgumentError('The cell must be a tuple of (width, height)!')
+            self.grid(cell[0], cell[1], names)
 
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
+    def filename(self) -> str:
+        """
+        Returns the filename of the sheet
+        :return: the filename
+        """
 
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
+        return self._filename
 
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
+    def width(self) -> int:
+        """
+        Returns the width of the entire sheet in pixels
+        :return: the width
+        """
 
-        if color is not None:
-            self.color(color)
+        return self._sheet.width
 
-        if border is not None:
-            self.border(border)
+    def height(self) -> int:
+        """
+        Returns the height of the entire sheet in pixels
+        :return: the height
+        """
 
-    @overload(Screen, str, (int, float), (int, float))
-    def __init__(self, screen: Screen, image: str, x: float = 0, y: float = 0,
-                 width: float = None,
-                 height: float = None,
-                 color: Color = None,
-                 border: Color = Color.NONE,
-                 rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
+        return self._sheet.height
 
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
+    @validate
+    def region(self, name, x: int, y: int, width: int, height: int) -> 'Sprite':
+        """
+        Define a named region of the sheet.
+        :param name: the name to refer to the region by
+        :param x: the x-coordinate of the region's top-left corner on the sheet
+        :param y: the y-coordinate of the region's top-left corner on the sheet
+        :param width: the width of the region
+        :param height: the height of the region
+        :return: the Sprite for the region
+        """
 
-        filetype = split[len(split) - 1]
+        if width <= 0 or height <= 0:
+            raise InvalidArgumentError(f'Sprite regions must have a positive size: {name}')
+        if x < 0 or y < 0 or x + width > self.width() or y + height > self.height():
+            raise InvalidArgumentError(f'Sprite region is outside of the sheet: {name}')
 
-        import os
-        if not os.path.isfile(image):
-            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
+        self._regions[name] = (x, y, width, height)
 
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
+        # Drop anything we had cached under this name, the region may have changed.
+        self._sprites.pop(name, None)
+        self._crops.pop(name, None)
+        self._photos.pop(name, None)
 
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
+        return self[name]
 
-        self._width = self._image.width()
-        self._height = self._image.height()
+    @validate
+    def grid(self, cell_width: int, cell_height: int, names: list = None) -> None:
+        """
+        Cut the sheet into a grid of equally-sized cells. Every cell can be retrieved by its (column, row),
+        and the cells can also be named in order (left-to-right, top-to-bottom).
+        :param cell_width: the width of each cell
+        :param cell_height: the height of each cell
+        :param names: the names to give the cells, if any
+        :return: None
+        """
 
-        self._frame = -1
-        self._frames = -1
+        if cell_width <= 0 or cell_height <= 0:
+            raise InvalidArgumentError('The cells of a sprite sheet must have a positive size!')
 
-        self._mask = 123
+        columns = self.width() // cell_width
+        rows = self.height() // cell_height
 
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
+        index = 0
+        for row in range(rows):
+            for column in range(columns):
+                x, y = column * cell_width, row * cell_height
 
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
+                self.region((column, row), x, y, cell_width, cell_height)
+                if names is not None and index < len(names):
+                    self.region(names[index], x, y, cell_width, cell_height)
 
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
+                index += 1
 
-        if color is not None:
-            self.color(color)
+    def names(self) -> list:
+        """
+        Returns the names of all regions on the sheet
+        :return: a list of region names
+        """
 
-        if border is not None:
-            self.border(border)
+        return list(self._regions.keys())
 
-    @overload(Screen, str, (int, float), (int, float), (int, float), (int, float))
-    def __init__(self, screen: Screen, image: str, x: float = 0, y: float = 0,
-                 width: float = None,
-                 height: float = None,
-                 color: Color = None,
-                 border: Color = Color.NONE,
-                 rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
+    def _crop(self, name):
+        # Slice lazily, and only ever once per region.
+        if name not in self._crops:
+            x, y, width, height = self._regions[name]
+            self._crops[name] = self._sheet.crop((x, y, x + width, y + height))
 
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
+        return self._crops[name]
 
-        filetype = split[len(split) - 1]
+    def _photo(self, name):
+        # Unmodified sprites can all share a single PhotoImage.
+        if name not in self._photos:
+            from PIL import ImageTk
+            self._photos[name] = ImageTk.PhotoImage(self._crop(name))
 
-        import os
-        if not os.path.isfile(image):
-            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
+        return self._photos[name]
 
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
+    def __getitem__(self, name) -> 'Sprite':
+        if name not in self._regions:
+            raise InvalidArgumentError(f'There is no region named {name} on sprite sheet: {self._filename}')
 
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
+        if name not in self._sprites:
+            self._sprites[name] = Sprite(self, name)
 
-        self._width = self._image.width()
-        self._height = self._image.height()
+        return self._sprites[name]
 
-        self._frame = -1
-        self._frames = -1
+    def __contains__(self, name) -> bool:
+        return name in self._regions
 
-        self._mask = 123
+    def __len__(self) -> int:
+        return len(self._regions)
 
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
+    def __iter__(self):
+        return iter(self._regions)
 
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
+    def __repr__(self):
+        return f'SpriteSheet({self._filename}, {len(self._regions)} regions)'
 
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
 
-        if color is not None:
-            self.color(color)
+class Sprite:
+    """
+    A single region of a SpriteSheet. Retrieve these by indexing a sheet: `sheet['name']` or `sheet[column, row]`,
+    and pass them to Image in place of a filename.
+    """
 
-        if border is not None:
-            self.border(border)
+    def __init__(self, sheet: SpriteSheet, name):
+        self._sheet = sheet
+        self._name = name
 
-    @overload(Screen, str, (int, float), (int, float), (int, float), (int, float), Color)
-    def __init__(self, screen: Screen, image: str, x: float = 0, y: float = 0,
-                 width: float = None,
-                 height: float = None,
-                 color: Color = None,
-                 border: Color = Color.NONE,
-                 rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
+    def sheet(self) -> SpriteSheet:
+        """
+        Returns the SpriteSheet this sprite belongs to
+        :return: the SpriteSheet
+        """
 
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
+        return self._sheet
 
-        filetype = split[len(split) - 1]
+    def name(self):
+        """
+        Returns the name of the sprite's region on the sheet
+        :return: the name
+        """
 
-        import os
-        if not os.path.isfile(image):
-            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
+        return self._name
 
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
+    def box(self) -> tuple:
+        """
+        Returns the region of the sheet the sprite occupies
+        :return: a tuple of (x, y, width, height) in pixels
+        """
 
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
+        return self._sheet._regions[self._name]
 
-        self._width = self._image.width()
-        self._height = self._image.height()
+    def width(self) -> int:
+        return self.box()[2]
 
-        self._frame = -1
-        self._frames = -1
+    def height(self) -> int:
+        return self.box()[3]
 
-        self._mask = 123
+    def image(self):
+        """
+        Returns the PIL image for the sprite (this is cached by the sheet, so copy it before modifying it!)
+        :return: a PIL Image
+        """
 
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
+        return self._sheet._crop(self._name)
 
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
+    def _photo(self):
+        return self._sheet._photo(self._name)
 
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
+    def __repr__(self):
+        return f'Sprite({self._sheet.filename()}, {self._name})'
 
-        if color is not None:
-            self.color(color)
 
-        if border is not None:
-            self.border(border)
+class Image(Renderable):
+    """
+    Image class. Supports basic formats: PNG, GIF, JPG, PPM, images.
 
-    # Location INITIALIZERS
+    NOTE: This class supports the basic displaying of images, but also supports much more,
+    such as image modification (width, height, color, etc) if you have PIL (Pillow) installed!
+    You can install PIL/Pillow by running: `pip install pillow` in a terminal!
 
-    @overload(Screen, str, Location)
-    def __init__(self, screen: Screen, image: str, location: Location,
+    Pass `async_load=True` to decode and transform the image on a background thread instead (REQUIRES: PIL).
+    A placeholder box is shown until the image is ready, and `screen.wait_for_assets()` waits for all of them.
+    """
+
+    TKINTER_TYPES = ['.png', '.gif', '.ppm']
+
+    # (x, y) INITIALIZERS
+
+    @overload(Screen, (str, Sprite), (int, float), (int, float), (int, float), (int, float), Color, Color, int, bool)
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], x: float = 0, y: float = 0,
                  width: float = None,
                  height: float = None,
                  color: Color = None,
                  border: Color = Color.NONE,
                  rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
-
-        x = location.x()
-        y = location.y()
-
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
-
-        filetype = split[len(split) - 1]
-
-        import os
-        if not os.path.isfile(image):
-            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
-
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
-
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
-
-        self._width = self._image.width()
-        self._height = self._image.height()
-
-        self._frame = -1
-        self._frames = -1
-
-        self._mask = 123
-
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
-
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
-
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
-
-        if color is not None:
-            self.color(color)
-
-        if border is not None:
-            self.border(border)
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, x, y, width, height, color, border, rotation, visible)
 
-    @overload(Screen, str, Location, (int, float), (int, float))
-    def __init__(self, screen: Screen, image: str, location: Location,
+    @overload(Screen, (str, Sprite), (int, float), (int, float))
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], x: float = 0, y: float = 0,
                  width: float = None,
                  height: float = None,
                  color: Color = None,
                  border: Color = Color.NONE,
                  rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
-        self._original = None
-
-        x = location.x()
-        y = location.y()
-
-        # Filetype Checking
-        split = image.split('.')
-        if len(split) <= 1:
-            raise PydrawError('File must have extension filetype:', self._image_name)
-
-        filetype = split[len(split) - 1]
-
-        import os
-        if not os.path.isfile(image):
-            raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
-
-        if filetype in self.TKINTER_TYPES:
-            self._image = tk.PhotoImage(name=image, file=image)
-        else:
-            try:
-                from PIL import Image, ImageTk
-                image = Image.open(self._image_name)
-                self._original = image  # We save the originally loaded image for easy modification
-
-                self._image = ImageTk.PhotoImage(image)
-            except:
-                raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
-                                       'Install Pillow via: \'pip install pillow\'.')
-
-        self._width = self._image.width()
-        self._height = self._image.height()
-
-        self._frame = -1
-        self._frames = -1
-
-        self._mask = 123
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, x, y, width, height, color, border, rotation, visible)
 
-        # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
-        self._patched = False
+    @overload(Screen, (str, Sprite), (int, float), (int, float), (int, float), (int, float))
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], x: float = 0, y: float = 0,
+                 width: float = None,
+                 height: float = None,
+                 color: Color = None,
+                 border: Color = Color.NONE,
+                 rotation: float = 0,
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, x, y, width, height, color, border, rotation, visible)
 
-        super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
-                         rotation=rotation, visible=visible)
-        self._setup()
+    @overload(Screen, (str, Sprite), (int, float), (int, float), (int, float), (int, float), Color)
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], x: float = 0, y: float = 0,
+                 width: float = None,
+                 height: float = None,
+                 color: Color = None,
+                 border: Color = Color.NONE,
+                 rotation: float = 0,
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, x, y, width, height, color, border, rotation, visible)
 
-        if width is not None and width != self._width:
-            self.width(width)
-        if height is not None and height != self._height:
-            self.height(height)
+    # Location INITIALIZERS
 
-        if color is not None:
-            self.color(color)
+    @overload(Screen, (str, Sprite), Location)
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], location: Location,
+                 width: float = None,
+                 height: float = None,
+                 color: Color = None,
+                 border: Color = Color.NONE,
+                 rotation: float = 0,
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, location.x(), location.y(), width, height, color, border, rotation, visible)
 
-        if border is not None:
-            self.border(border)
+    @overload(Screen, (str, Sprite), Location, (int, float), (int, float))
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], location: Location,
+                 width: float = None,
+                 height: float = None,
+                 color: Color = None,
+                 border: Color = Color.NONE,
+                 rotation: float = 0,
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, location.x(), location.y(), width, height, color, border, rotation, visible)
 
-    @overload(Screen, str, Location, (int, float), (int, float), Color)
-    def __init__(self, screen: Screen, image: str, location: Location,
+    @overload(Screen, (str, Sprite), Location, (int, float), (int, float), Color)
+    def __init__(self, screen: Screen, image: Union[str, 'Sprite'], location: Location,
                  width: float = None,
                  height: float = None,
                  color: Color = None,
                  border: Color = Color.NONE,
                  rotation: float = 0,
-                 visible: bool = True):
-        self._image_name = image
+                 visible: bool = True,
+                 async_load: bool = False):
+        self._load(image, async_load)
+        self._initialize(screen, location.x(), location.y(), width, height, color, border, rotation, visible)
+
+    def _load(self, image: Union[str, 'Sprite'], async_load: bool = False) -> None:
+        """
+        Reads the image into a PhotoImage, either from a file or from a Sprite of a SpriteSheet.
+        If async_load is True the image is only measured here, and the PhotoImage is left as None (loading) until
+        the background thread has decoded it.
+        :param image: the filename or Sprite to load
+        :param async_load: whether to decode the image on a background thread
+        :return: None
+        """
+
+        verify(async_load, bool)
+
+        self._source = image
         self._original = None
 
-        x = location.x()
-        y = location.y()
+        if type(image) is Sprite:
+            # The sheet has already been read and decoded, so we just take the (cached) slice.
+            self._image_name = f'{image.sheet().filename()}[{image.name()}]'
+            self._original = image.image()
+
+            if async_load:
+                self._image = None
+                self._size = (image.width(), image.height())
+            else:
+                self._image = image._photo()
+            return
+
+        self._image_name = image
 
         # Filetype Checking
         split = image.split('.')
@@ -3673,6 +4087,20 @@ class Image(Renderable):
         if not os.path.isfile(image):
             raise InvalidArgumentError(f'Image does not exist or is directory: {image}')
 
+        if async_load:
+            try:
+                from PIL import Image
+            except ImportError:
+                raise UnsupportedError('As PIL is not installed, images cannot be loaded asynchronously! '
+                                       'Install Pillow via: \'pip install pillow\'.')
+
+            # Opening only reads the header, the actual decoding happens in the background.
+            with Image.open(image) as header:
+                self._size = header.size
+
+            self._image = None
+            return
+
         if filetype in self.TKINTER_TYPES:
             self._image = tk.PhotoImage(name=image, file=image)
         else:
@@ -3686,20 +4114,27 @@ class Image(Renderable):
                 raise UnsupportedError('As PIL is not installed, only .png, .gif, and .ppm images are supported! '
                                        'Install Pillow via: \'pip install pillow\'.')
 
-        self._width = self._image.width()
-        self._height = self._image.height()
+    def _initialize(self, screen: Screen, x: float, y: float, width: float, height: float, color: Color,
+                    border: Color, rotation: float, visible: bool) -> None:
+        if self._image is not None:
+            self._width = self._image.width()
+            self._height = self._image.height()
+        else:
+            self._width, self._height = self._size
 
         self._frame = -1
         self._frames = -1
 
         self._mask = 123
 
+        self._shape = ((-10, 10), (10, 10), (10, -10), (-10, -10))
+
         # We have to monkey patch PIL if we modify the image, but we don't want to cause a RecursionError (call once)
         self._patched = False
 
+        # Renderable's constructor calls _setup() for us, which creates the canvas item.
         super().__init__(screen, x, y, self._width, self._height, color=Color.NONE, border=border,
                          rotation=rotation, visible=visible)
-        self._setup()
 
         if width is not None and width != self._width:
             self.width(width)
@@ -3712,14 +4147,27 @@ class Image(Renderable):
         if border is not None:
             self.border(border)
 
+        if self._image is None:
+            self._request()
+
     # noinspection PyProtectedMember
     def _setup(self):
         # Pre-register the vertices so we don't have issues with .center()
         self._vertices = self.vertices()
 
         real_location = self._screen.canvas_location(self.x(), self.y())
-        self._ref = self._screen._canvas.create_image(real_location.x() + self._width / 2,
-                                                      real_location.y() + self._height / 2, image=self._image)
+        width, height = self._width * self._screen._zoom, self._height * self._screen._zoom
+
+        if self._image is None:
+            # Still loading, so we show a placeholder box of the right size in the meantime.
+            self._ref = self._screen._canvas.create_rectangle(real_location.x(), real_location.y(),
+                                                              real_location.x() + width,
+                                                              real_location.y() + height,
+                                                              outline='gray', dash=(4, 4))
+            return
+
+        self._ref = self._screen._canvas.create_image(real_location.x() + width / 2,
+                                                      real_location.y() + height / 2, image=self._image)
 
     # def moveto(self, *args, **kwargs) -> None:
     #     """
@@ -3734,6 +4182,8 @@ class Image(Renderable):
     #     # self._update_coords()
     #     self.update()
 
+    @threadsafe
+    @validate
     def width(self, width: float = None) -> float:
         """
         Get or set the width of the image (REQUIRES: PIL or Pillow)
@@ -3742,12 +4192,13 @@ class Image(Renderable):
         """
 
         if width is not None:
-            verify(width, (float, int))
             self._width = width
             self.update(True)
 
         return self._width
 
+    @threadsafe
+    @validate
     def height(self, height: float = None) -> float:
         """
         Get or set the height of the image
@@ -3756,12 +4207,13 @@ class Image(Renderable):
         """
 
         if height is not None:
-            verify(height, (float, int))
             self._height = height
             self.update(True)
 
         return self._height
 
+    @threadsafe(getter=True)
+    @validate
     def color(self, color: Color = None, alpha: int = 123) -> Color:
         """
         Retrieves or applies a color-mask to the image
@@ -3771,13 +4223,14 @@ class Image(Renderable):
         """
 
         if color is not None:
-            verify(color, Color)
             self._color = color
             self._mask = alpha
             self.update(True)
 
         return self._color
 
+    @threadsafe
+    @validate
     def rotation(self, angle: float = None) -> float:
         """
         Get or set the rotation of the image.
@@ -3786,13 +4239,14 @@ class Image(Renderable):
         """
 
         if angle is not None:
-            verify(angle, (float, int))
             self._angle = angle
             self.update(True)
 
         return self._angle
 
     # noinspection PyMethodOverriding
+    @threadsafe
+    @validate
     def rotate(self, angle_diff: float) -> None:
         """
         Rotate the angle of the image by a difference, in degrees
@@ -3801,10 +4255,10 @@ class Image(Renderable):
         """
 
         if angle_diff != 0:
-            verify(angle_diff, (float, int))
             self._angle += angle_diff
             self.update(True)
 
+    @threadsafe
     def center(self, *args, **kwargs) -> Location:
         """
         Returns the location of the center
@@ -3859,6 +4313,8 @@ class Image(Renderable):
         return Location(self.x() + self.width() / 2, self.y() + self.height() / 2)
 
     # noinspection PyMethodOverriding
+    @threadsafe
+    @validate
     def border(self, color: Color = None) -> Color:
         """
         Add or get the border of the image
@@ -3867,12 +4323,12 @@ class Image(Renderable):
         """
 
         if color is not None:
-            verify(color, Color)
             self._border = color
             self.update(True)
 
         return self._border
 
+    @threadsafe
     def fill(self, fill: bool = None) -> bool:
         """
         Unsupported: This doesn't make sense for images.
@@ -3887,7 +4343,8 @@ class Image(Renderable):
         :return: a list of Locations representing the vertices
         """
 
-        vertices = [self.location(), Location(self.x() + self.width(), self.y()),
+        # A copy of our location, so moving the vertices (e.g. in a group) doesn't move us twice.
+        vertices = [Location(self.x(), self.y()), Location(self.x() + self.width(), self.y()),
                     Location(self.x() + self.width(), self.y() + self.height()),
                     Location(self.x(), self.y() + self.height())]
 
@@ -3915,16 +4372,21 @@ class Image(Renderable):
 
         return vertices
 
+    @threadsafe
     def flip(self, axis: str = 'y'):
         # TODO: Finish this noah
         pass
 
+    @threadsafe
     def load(self) -> None:
         """
         Load animated GIF (reads frames)
         :return: None
         """
 
+        if type(self._source) is Sprite:
+            raise PydrawError('Sprites cannot be animated, so they cannot be loaded!')
+
         from PIL import Image
         # from PIL import GifImagePlugin
 
@@ -3935,6 +4397,7 @@ class Image(Renderable):
         else:
             raise PydrawError('GIF is not animated, so it cannot be loaded!')
 
+    @threadsafe
     def next(self) -> None:
         """
         Changes frame to the next frame (Can only be used with animated GIFs)
@@ -3947,6 +4410,7 @@ class Image(Renderable):
 
         self.update(True)
 
+    @threadsafe
     def frame(self, frame: int = None) -> int:
         """
         Set the current frame.
@@ -3970,7 +4434,7 @@ class Image(Renderable):
 
     def clone(self) -> 'Image':
         constructor = type(self)
-        return constructor(self._screen, self._image_name, self.x(), self.y(), self.height(), self.width(),
+        return constructor(self._screen, self._source, self.x(), self.y(), self.width(), self.height(),
                            self.color(), self.border(), self.rotation(), self.visible())
 
     @staticmethod
@@ -3998,24 +4462,142 @@ class Image(Renderable):
             self._monkey_patch_del()  # If we do have PIL we need to monkey patch this immediately.
             self._patched = True
 
+    def _render_state(self) -> tuple:
+        """
+        A snapshot of everything that affects how the image is rendered, so it can be handed to another thread.
+        :return: a tuple of (frame, width, height, color, mask, border, rotation), with the size as shown on screen
+        """
+
+        zoom = self._screen._zoom
+        return self._frame, self._width * zoom, self._height * zoom, self._color, self._mask, self._border, self._angle
+
+    @staticmethod
+    def _render(image, state: tuple):
+        """
+        Applies the color-mask, border, size and rotation in state to a PIL image.
+        Only PIL is touched here (never Tkinter), so this is safe to run on a background thread.
+        :param image: the PIL image to render
+        :param state: the state to render, see _render_state()
+        :return: the rendered PIL image
+        """
+
+        from PIL import Image, ImageOps
+
+        frame, width, height, color, mask, border, angle = state
+
+        image = image.convert('RGBA')  # Convert so we can color-filter the image
+
+        if color is not None and color != Color.NONE:
+            r, g, b, alpha = image.split()
+            gray = ImageOps.grayscale(image)
+            result = ImageOps.colorize(gray, (0, 0, 0, 0), (color.red(), color.green(), color.blue(), mask))
+            result.putalpha(alpha)
+            image = result
+
+        if border is not None and border is not Color.NONE:
+            image = ImageOps.expand(image, border=10, fill=border.rgb())
+
+        # Do the resizing last, so we can make sure the other manipulations work properly
+        image = image.resize((int(width), int(height)), Image.LANCZOS)
+
+        if angle != 0:
+            image = image.rotate(-angle, resample=Image.BILINEAR, expand=1, fillcolor=None)
+
+        return image
+
+    @staticmethod
+    def _decode(source, state: tuple) -> tuple:
+        """
+        Runs on the asset thread-pool: decodes the source (if it's a file) and renders it.
+        :param source: a filename, or an already decoded PIL image
+        :param state: the state to render, see _render_state()
+        :return: a tuple of (original, rendered) PIL images
+        """
+
+        from PIL import Image as PILImage
+
+        original = PILImage.open(source) if type(source) is str else source
+        original.load()
+
+        frame, width, height, color, mask, border, angle = state
+        untouched = (int(width), int(height)) == original.size and frame == -1 and angle == 0 \
+            and (color is None or color == Color.NONE) and (border is None or border is Color.NONE)
+
+        return original, original if untouched else Image._render(original.copy(), state)
+
+    def _request(self) -> None:
+        # Hand the decode/render off to the screen's asset thread-pool.
+        source = self._original if self._original is not None else self._image_name
+        state = self._render_state()
+
+        self._screen._queue_asset(Image._decode, (source, state), (lambda future: self._loaded(future, state)))
+
+    def _loaded(self, future, state: tuple) -> None:
+        # Called on the Tk thread once the background thread is done.
+        if self not in self._screen._objects:
+            return  # We were removed while loading.
+
+        error = future.exception()
+        if error is not None:
+            # We keep our placeholder, and the screen hands the error to whoever waits for the assets.
+            raise PydrawError(f'Could not load image: {self._image_name}') from error
+
+        original, image = future.result()
+        self._original = original
+
+        if state != self._render_state():
+            # We were modified while loading, so render again with the latest state.
+            self._request()
+            return
+
+        from PIL import ImageTk
+
+        self._check_patch()
+        self._image = ImageTk.PhotoImage(image=image)
+        self.update()
+
     def _update_coords(self):
         """
         Usually used to update x/y or vertices, but in this case we just update our width and height
         """
         self._check()
-        self.update()
 
-        # self._width = true_width
-        # self._height = true_height * (self._text.count('\n') + 1)
+        if self._culled:
+            # Nobody can see us, so we'll catch up once we're back in view (see Object._cull()).
+            self._changed()
+            self._stale = True
+            return
 
+        self.update()
+
+    def _rezoom(self) -> None:
+        # Images are rendered at the size they're shown at, so we render again.
+        try:
+            self.update(True)
+        except UnsupportedError:
+            self.update()  # Without PIL we can't resize, but we can at least stay in place.
 
     # noinspection PyProtectedMember
+    @threadsafe
     def update(self, updated: bool = False):
         self._check()
+        self._changed()
+
+        if self._image is None:
+            # Still loading: we only keep the placeholder in step, the image picks up any changes once it arrives.
+            try:
+                real_location = self._screen.canvas_location(self.x(), self.y())
+                self._screen._canvas.coords(self._ref, real_location.x(), real_location.y(),
+                                            real_location.x() + self._width * self._screen._zoom,
+                                            real_location.y() + self._height * self._screen._zoom)
+                self._screen._canvas.itemconfigure(self._ref, state=self._state())
+            except tk.TclError:
+                pass
+            return
 
         if updated:
             try:
-                from PIL import Image, ImageTk, ImageOps
+                from PIL import Image, ImageTk
 
                 self._check_patch()
 
@@ -4035,26 +4617,7 @@ class Image(Renderable):
                     except EOFError:
                         raise PydrawError(f'No more frames in GIF: {self._image_name}!')
 
-                image = image.convert('RGBA')  # Convert so we can color-filter the image
-
-                if self._color is not None and self._color != Color.NONE:
-                    r, g, b, alpha = image.split()
-                    gray = ImageOps.grayscale(image)
-                    result = ImageOps.colorize(gray, (0, 0, 0, 0),
-                                               (
-                                                   self._color.red(), self._color.green(), self._color.blue(),
-                                                   self._mask))
-                    result.putalpha(alpha)
-                    image = result
-
-                if self._border is not None and self._border is not Color.NONE:
-                    image = ImageOps.expand(image, border=10, fill=self._border.rgb())
-
-                # Do the resizing last, so we can make sure the other manipulations work properly
-                image = image.resize((int(self.width()), int(self.height())), Image.LANCZOS)
-
-                if self._angle != 0:
-                    image = image.rotate(-self._angle, resample=Image.BILINEAR, expand=1, fillcolor=None)
+                image = self._render(image, self._render_state())
 
                 self._image = ImageTk.PhotoImage(image=image)
             except (RuntimeError, AttributeError) as e:
@@ -4068,11 +4631,13 @@ class Image(Renderable):
             old_ref = self._ref
             real_location = self._screen.canvas_location(self.x(), self.y())
 
-            state = tk.NORMAL if self._visible else tk.HIDDEN
+            state = self._state()
 
-            self._ref = self._screen._canvas.create_image(real_location.x() + self._width / 2,
-                                                          real_location.y() + self._height / 2, image=self._image,
-                                                          state=state)
+            zoom = self._screen._zoom
+            self._ref = self._screen._canvas.create_image(real_location.x() + self._width * zoom / 2,
+                                                          real_location.y() + self._height * zoom / 2,
+                                                          image=self._image, state=state,
+                                                          tags=self._screen._canvas.gettags(old_ref))
 
             self._screen._canvas.tag_lower(self._ref, old_ref)
             self._screen._canvas.delete(old_ref)
@@ -4123,7 +4688,7 @@ class Text(CustomRenderable):
         # we use negative font size to change from point font-size to pixel font-size.
         font_data = (self.font(), -self.size(), decorations)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         # import tkinter.font as tkfont
         #
@@ -4139,8 +4704,8 @@ class Text(CustomRenderable):
         dx = math.cos(radians) * hypotenuse
         dy = math.sin(radians) * hypotenuse
 
-        real_x = (self.x() + (true_width / 2) - ((self._screen.width() / 2) + 1)) - dx
-        real_y = (self.y() - (self._screen.height() / 2)) - dy
+        real_x = self._screen._canvas_x(self.x() + true_width / 2 - 1 - dx)
+        real_y = self._screen._canvas_y(self.y() - dy)
 
         self._ref = self._screen._screen.cv.create_text(real_x,
                                                         real_y,
@@ -4197,7 +4762,7 @@ class Text(CustomRenderable):
         # we use negative font size to change from point font-size to pixel font-size.
         font_data = (self.font(), -self.size(), decorations)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         # import tkinter.font as tkfont
         #
@@ -4213,8 +4778,8 @@ class Text(CustomRenderable):
         dx = math.cos(radians) * hypotenuse
         dy = math.sin(radians) * hypotenuse
 
-        real_x = (self.x() + (true_width / 2) - ((self._screen.width() / 2) + 1)) - dx
-        real_y = (self.y() - (self._screen.height() / 2)) - dy
+        real_x = self._screen._canvas_x(self.x() + true_width / 2 - 1 - dx)
+        real_y = self._screen._canvas_y(self.y() - dy)
 
         self._ref = self._screen._screen.cv.create_text(real_x,
                                                         real_y,
@@ -4274,7 +4839,7 @@ class Text(CustomRenderable):
         # we use negative font size to change from point font-size to pixel font-size.
         font_data = (self.font(), -self.size(), decorations)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         # import tkinter.font as tkfont
         #
@@ -4290,8 +4855,8 @@ class Text(CustomRenderable):
         dx = math.cos(radians) * hypotenuse
         dy = math.sin(radians) * hypotenuse
 
-        real_x = (self.x() + (true_width / 2) - ((self._screen.width() / 2) + 1)) - dx
-        real_y = (self.y() - (self._screen.height() / 2)) - dy
+        real_x = self._screen._canvas_x(self.x() + true_width / 2 - 1 - dx)
+        real_y = self._screen._canvas_y(self.y() - dy)
 
         self._ref = self._screen._screen.cv.create_text(real_x,
                                                         real_y,
@@ -4351,7 +4916,7 @@ class Text(CustomRenderable):
         # we use negative font size to change from point font-size to pixel font-size.
         font_data = (self.font(), -self.size(), decorations)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         # import tkinter.font as tkfont
         #
@@ -4367,8 +4932,8 @@ class Text(CustomRenderable):
         dx = math.cos(radians) * hypotenuse
         dy = math.sin(radians) * hypotenuse
 
-        real_x = (self.x() + (true_width / 2) - ((self._screen.width() / 2) + 1)) - dx
-        real_y = (self.y() - (self._screen.height() / 2)) - dy
+        real_x = self._screen._canvas_x(self.x() + true_width / 2 - 1 - dx)
+        real_y = self._screen._canvas_y(self.y() - dy)
 
         self._ref = self._screen._screen.cv.create_text(real_x,
                                                         real_y,
@@ -4387,6 +4952,8 @@ class Text(CustomRenderable):
         self._width = true_width
         self._height = true_height * (self._text.count('\n') + 1)
 
+    @threadsafe
+    @validate
     def text(self, text: str = None) -> str:
         """
         Get or set the text. Use '\n' to separate lines
@@ -4395,7 +4962,6 @@ class Text(CustomRenderable):
         """
 
         if text is not None:
-            verify(text, str)
             self._text = text
             try:
                 self._screen._canvas.itemconfigure(self._ref, text=self._text)
@@ -4406,6 +4972,7 @@ class Text(CustomRenderable):
 
         return self._text
 
+    @threadsafe
     def move(self, *args, **kwargs) -> None:
         """
         Can take either a tuple, Location, or two numbers (dx, dy)
@@ -4414,9 +4981,13 @@ class Text(CustomRenderable):
 
         self._location.move(*args, **kwargs)
 
+        self._changed()
+
         new_location = self._screen.canvas_location(self._location.x(), self._location.y())
         self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        self._pen_follow()
 
+    @threadsafe
     def moveto(self, *args, **kwargs) -> None:
         """
         Move to a new location takes a Location, tuple, or two numbers (x, y)
@@ -4425,8 +4996,11 @@ class Text(CustomRenderable):
 
         self._location.moveto(*args, **kwargs)
 
+        self._changed()
+
         new_location = self._screen.canvas_location(self._location.x(), self._location.y())
         self._screen._canvas.moveto(self._ref, new_location.x(), new_location.y())
+        self._pen_follow()
 
     # noinspection PyMethodOverriding
     def width(self) -> float:
@@ -4446,6 +5020,8 @@ class Text(CustomRenderable):
 
         return self._height
 
+    @threadsafe
+    @validate
     def color(self, color: Color = None) -> Color:
         """
         Get or set the color of the text
@@ -4454,13 +5030,14 @@ class Text(CustomRenderable):
         """
 
         if color is not None:
-            verify(color, Color)
             self._color = color
             self._screen._canvas.itemconfigure(self._ref, fill=self._screen._colorstr(self._color))
             # self.update()
 
         return self._color
 
+    @threadsafe
+    @validate
     def font(self, font: str = None) -> str:
         """
         Get or set the font of the text
@@ -4469,13 +5046,14 @@ class Text(CustomRenderable):
         """
 
         if font is not None:
-            verify(font, str)
             self._font = font
             self._update_font()
             # self.update()
 
         return self._font
 
+    @threadsafe
+    @validate
     def size(self, size: int = None) -> int:
         """
         Get or set the size of the text
@@ -4484,13 +5062,14 @@ class Text(CustomRenderable):
         """
 
         if size is not None:
-            verify(size, int)
             self._size = size
             self._update_font()
             # self.update()
 
         return self._size
 
+    @threadsafe
+    @validate
     def align(self, align: str = None) -> str:
         """
         Get or set the alignment of the text, if a new value is passed it must be 'left', 'center', or 'right'.
@@ -4499,7 +5078,6 @@ class Text(CustomRenderable):
         """
 
         if align is not None:
-            verify(align, str)
             if align.lower() not in self._aligns:
                 raise PydrawError(f'Passed alignment ("{align}") is not a valid alignment. Options: left, center, right')
 
@@ -4509,6 +5087,8 @@ class Text(CustomRenderable):
 
         return self._align
 
+    @threadsafe
+    @validate
     def bold(self, bold: bool = None) -> bool:
         """
         Get or set the bold status of the text
@@ -4517,13 +5097,14 @@ class Text(CustomRenderable):
         """
 
         if bold is not None:
-            verify(bold, bool)
             self._bold = bold
             self._update_font()
             # self.update()
 
         return self._bold
 
+    @threadsafe
+    @validate
     def italic(self, italic: bool = None) -> bool:
         """
         Get or set the italic status of the text
@@ -4532,13 +5113,14 @@ class Text(CustomRenderable):
         """
 
         if italic is not None:
-            verify(italic, bool)
             self._italic = italic
             self._update_font()
             # self.update()
 
         return self._italic
 
+    @threadsafe
+    @validate
     def underline(self, underline: bool = None) -> bool:
         """
         Get or set the underline status of the text
@@ -4547,13 +5129,14 @@ class Text(CustomRenderable):
         """
 
         if underline is not None:
-            verify(underline, bool)
             self._underline = underline
             self._update_font()
             # self.update()
 
         return self._underline
 
+    @threadsafe
+    @validate
     def strikethrough(self, strikethrough: bool = None) -> bool:
         """
         Get or set the strikethrough status of the text
@@ -4562,13 +5145,14 @@ class Text(CustomRenderable):
         """
 
         if strikethrough is not None:
-            verify(strikethrough, bool)
             self._strikethrough = strikethrough
             self._update_font()
             # self.update()
 
         return self._strikethrough
 
+    @threadsafe
+    @validate
     def rotation(self, rotation: float = None) -> float:
         """
         Get or set the rotation of the text
@@ -4577,13 +5161,15 @@ class Text(CustomRenderable):
         """
 
         if rotation is not None:
-            verify(rotation, (float, int))
             self._angle = rotation
+            self._changed()
             self._screen._canvas.itemconfigure(self._ref, angle=self._angle)
             # self.update()
 
         return self._angle
 
+    @threadsafe
+    @validate
     def rotate(self, angle_diff: float = 0) -> None:
         """
         Rotate the angle of the text by a difference, in degrees
@@ -4591,9 +5177,9 @@ class Text(CustomRenderable):
         :return: Nonea
         """
 
-        verify(angle_diff, (float, int))
         self.rotation(self._angle + angle_diff)
 
+    @threadsafe
     def lookat(self, obj):
         if isinstance(obj, Object):
             obj = obj.location()
@@ -4607,6 +5193,7 @@ class Text(CustomRenderable):
 
         self.rotate(theta)
 
+    @threadsafe
     def center(self, *args, **kwargs) -> Location:
         """
         Returns the location of the center
@@ -4691,6 +5278,8 @@ class Text(CustomRenderable):
 
         return vertices
 
+    @threadsafe
+    @validate
     def visible(self, visible: bool = None) -> bool:
         """
         Get or set the visibility of the text
@@ -4699,15 +5288,15 @@ class Text(CustomRenderable):
         """
 
         if visible is not None:
-            verify(visible, bool)
             self._visible = visible
 
-            state = tk.NORMAL if self._visible else tk.HIDDEN
+            state = self._state()
             self._screen._canvas.itemconfigure(self._ref, state=state)
             # self.update()
 
         return self._visible
 
+    @threadsafe
     def transform(self, transform: tuple = None) -> tuple:
         """
         Retrieve the transform of the text
@@ -4751,6 +5340,7 @@ class Text(CustomRenderable):
         Usually used to update x/y or vertices, but in this case we just update our width and height
         """
         self._check()
+        self._changed()
 
         # Handle font and decorations
         decorations = ''
@@ -4774,11 +5364,15 @@ class Text(CustomRenderable):
         self._width = true_width
         self._height = true_height * (self._text.count('\n') + 1)
 
-
+    def _rezoom(self) -> None:
+        # Text keeps its font size when zooming (and its item's width is how wide it wraps, not an outline).
+        pass
 
     # noinspection PyProtectedMember
+    @threadsafe
     def update(self) -> None:
         self._check()
+        self._changed()
         # super().update() | JUST FOR RENDERABLES - DO NOT USE
         # we are going to delete and re-add text to the screen. You cannot alter a text object.
         old_ref = self._ref
@@ -4797,7 +5391,7 @@ class Text(CustomRenderable):
         # we use negative font size to change from point font-size to pixel font-size.
         font_data = (self.font(), -self.size(), decorations)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         try:
             # import tkinter.font as tkfont
@@ -4817,8 +5411,8 @@ class Text(CustomRenderable):
             dx = math.cos(radians) * hypotenuse
             dy = math.sin(radians) * hypotenuse
 
-            real_x = (self.x() + (true_width / 2) - ((self._screen.width() / 2) + 1)) - dx
-            real_y = (self.y() - (self._screen.height() / 2)) - dy
+            real_x = self._screen._canvas_x(self.x() + true_width / 2 - 1 - dx)
+            real_y = self._screen._canvas_y(self.y() - dy)
 
             self._ref = self._screen._screen.cv.create_text(real_x,
                                                             real_y,
@@ -4828,6 +5422,7 @@ class Text(CustomRenderable):
                                                             fill=self._screen._colorstr(self._color),
                                                             font=font_data,
                                                             state=state,
+                                                            tags=self._screen._screen.cv.gettags(old_ref),
                                                             angle=-self._angle)
             self._screen._screen.cv.tag_lower(self._ref, old_ref)
             self._screen._screen.cv.delete(old_ref)
@@ -4896,24 +5491,26 @@ class Line(Object):
 
         verify(color, Color, thickness, int, dashes, (int, tuple), visible, bool)
 
-        state = tk.NORMAL if self._visible else tk.HIDDEN
+        state = self._state()
 
         if dashes is not None and type(dashes) is not tuple:
             self._dashes = (dashes, dashes)
 
         # noinspection PyProtectedMember
-        self._ref = self._screen._screen.cv.create_line(self._pos1.x() - screen.width() / 2,
-                                                        self._pos1.y() - screen.height() / 2,
-                                                        self._pos2.x() - screen.width() / 2,
-                                                        self._pos2.y() - screen.height() / 2,
+        self._ref = self._screen._screen.cv.create_line(self._screen._canvas_x(self._pos1.x()),
+                                                        self._screen._canvas_y(self._pos1.y()),
+                                                        self._screen._canvas_x(self._pos2.x()),
+                                                        self._screen._canvas_y(self._pos2.y()),
                                                         fill=self._screen._screen._colorstr(self._color.__value__()),
-                                                        width=self._thickness, dash=self._dashes, state=state)
+                                                        width=self._thickness * self._screen._zoom, dash=self._dashes,
+                                                        state=state)
 
         # Set angle
         theta = math.atan2(self.pos1().y() - self.pos2().y(), self.pos1().x() - self.pos2().x())
         theta = math.degrees(theta)
         self._angle = theta
 
+    @threadsafe
     def pos1(self, *args) -> Location:
         """
         Get or set the position of the first endpoint.
@@ -4929,13 +5526,16 @@ class Line(Object):
             else:
                 raise TypeError('Incorrect Argumentation: Requires either a location, tuple, or two numbers.')
 
-        self._screen._canvas.coords(self._ref, [self._pos1.x() - self._screen.width() / 2,
-                                                        self._pos1.y() - self._screen.height() / 2,
-                                                        self._pos2.x() - self._screen.width() / 2,
-                                                        self._pos2.y() - self._screen.height() / 2])
+            self._changed()
+
+        self._screen._canvas.coords(self._ref, [self._screen._canvas_x(self._pos1.x()),
+                                                        self._screen._canvas_y(self._pos1.y()),
+                                                        self._screen._canvas_x(self._pos2.x()),
+                                                        self._screen._canvas_y(self._pos2.y())])
         # self.update()
         return self._pos1
 
+    @threadsafe
     def pos2(self, *args) -> Location:
         """
         Get or set the position of the second endpoint.
@@ -4953,13 +5553,14 @@ class Line(Object):
             else:
                 raise TypeError('Incorrect Argumentation: Requires either a location, tuple, or two numbers.')
 
-        self._screen._canvas.coords(self._ref, [self._pos1.x() - self._screen.width() / 2,
-                                                self._pos1.y() - self._screen.height() / 2,
-                                                self._pos2.x() - self._screen.width() / 2,
-                                                self._pos2.y() - self._screen.height() / 2])
+        self._screen._canvas.coords(self._ref, [self._screen._canvas_x(self._pos1.x()),
+                                                self._screen._canvas_y(self._pos1.y()),
+                                                self._screen._canvas_x(self._pos2.x()),
+                                                self._screen._canvas_y(self._pos2.y())])
         # self.update()
         return self._pos2
 
+    @threadsafe
     def move(self, *args, **kwargs) -> None:
         """
         Move both endpoints by the same dx and dy
@@ -5007,12 +5608,15 @@ class Line(Object):
             self._pos1.move(diff[0], diff[1])
             self._pos2.move(diff[0], diff[1])
 
-        self._screen._canvas.coords(self._ref, [self._pos1.x() - self._screen.width() / 2,
-                                                self._pos1.y() - self._screen.height() / 2,
-                                                self._pos2.x() - self._screen.width() / 2,
-                                                self._pos2.y() - self._screen.height() / 2])
+        self._changed()
+        self._screen._canvas.coords(self._ref, [self._screen._canvas_x(self._pos1.x()),
+                                                self._screen._canvas_y(self._pos1.y()),
+                                                self._screen._canvas_x(self._pos2.x()),
+                                                self._screen._canvas_y(self._pos2.y())])
+        self._pen_follow()
         # self.update()
 
+    @threadsafe
     def moveto(self, *args, **kwargs) -> None:
         """
         Move both of the endpoints to new locations.
@@ -5052,14 +5656,17 @@ class Line(Object):
             raise TypeError('Incorrect Argumentation: Requires either two locations, tuples, or four numbers (x1, y1, '
                             'x2, y2)')
 
-        self._screen._canvas.coords(self._ref, [self._pos1.x() - self._screen.width() / 2,
-                                                self._pos1.y() - self._screen.height() / 2,
-                                                self._pos2.x() - self._screen.width() / 2,
-                                                self._pos2.y() - self._screen.height() / 2])
+        self._changed()
+        self._screen._canvas.coords(self._ref, [self._screen._canvas_x(self._pos1.x()),
+                                                self._screen._canvas_y(self._pos1.y()),
+                                                self._screen._canvas_x(self._pos2.x()),
+                                                self._screen._canvas_y(self._pos2.y())])
         # self.update()
+        self._pen_follow()
 
     # noinspection PyUnusedLocal
     # TODO: Allow for point specification (center)
+    @threadsafe
     def lookat(self, *args, **kwargs) -> None:
         """
         Make the line look at the given point by moving the second point.
@@ -5110,6 +5717,7 @@ class Line(Object):
 
         self.rotate(math.degrees(theta))
 
+    @threadsafe
     def rotation(self, angle: float = None):
         """
         Get or set the rotation of the line (works via pos2()).
@@ -5125,6 +5733,7 @@ class Line(Object):
 
         return self._angle
 
+    @threadsafe
     def rotate(self, angle_diff: float, point: int = 1) -> float:
         """
         Rotate the line around one of its vertices (1 by default)
@@ -5148,14 +5757,32 @@ class Line(Object):
         new_y = (old_x * sine + old_y * cosine) + origin.y()
 
         point.moveto(new_x, new_y)
-        self._screen._canvas.coords(self._ref, [self._pos1.x() - self._screen.width() / 2,
-                                                self._pos1.y() - self._screen.height() / 2,
-                                                self._pos2.x() - self._screen.width() / 2,
-                                                self._pos2.y() - self._screen.height() / 2])
+        self._changed()
+        self._screen._canvas.coords(self._ref, [self._screen._canvas_x(self._pos1.x()),
+                                                self._screen._canvas_y(self._pos1.y()),
+                                                self._screen._canvas_x(self._pos2.x()),
+                                                self._screen._canvas_y(self._pos2.y())])
 
         self._angle += angle_diff
         return self._angle
 
+    def _translate(self, dx: float, dy: float) -> None:
+        self._pos1.move(dx, dy)
+        self._pos2.move(dx, dy)
+        self._pen_follow()
+        self._changed()
+
+    def _rezoom(self) -> None:
+        self._screen._canvas.itemconfigure(self._ref, width=self._thickness * self._screen._zoom)
+
+    def _extent(self) -> tuple:
+        x1, y1, x2, y2 = self._pos1.x(), self._pos1.y(), self._pos2.x(), self._pos2.y()
+        return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+    def _pen_location(self) -> Location:
+        # Lines draw from their midpoint.
+        return Location((self._pos1.x() + self._pos2.x()) / 2, (self._pos1.y() + self._pos2.y()) / 2)
+
     def location(self) -> tuple:
         """
         Returns the locations of both the endpoints
@@ -5176,6 +5803,8 @@ class Line(Object):
     def _length(x1: float, x2: float, y1: float, y2: float) -> float:
         return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
+    @threadsafe
+    @validate
     def color(self, color: Color = None) -> Color:
         """
         Get or set the color of the line
@@ -5184,14 +5813,16 @@ class Line(Object):
         """
 
         if color is not None:
-            verify(color, Color)
             self._color = color
+            self._changed()
 
             self._screen._canvas.itemconfigure(self._ref, fill=self._screen._colorstr(self._color))
             # self.update()
 
         return self._color
 
+    @threadsafe
+    @validate
     def thickness(self, thickness: int = None) -> int:
         """
         Get or set the thickness of the line
@@ -5200,13 +5831,15 @@ class Line(Object):
         """
 
         if thickness is not None:
-            verify(thickness, int)
             self._thickness = thickness
-            self._screen._canvas.itemconfigure(self._ref, width=self._thickness)
+            self._changed()
+            self._screen._canvas.itemconfigure(self._ref, width=self._thickness * self._screen._zoom)
             # self.update()
 
         return self._thickness
 
+    @threadsafe
+    @validate
     def dashes(self, dashes: Union[int, tuple] = None) -> Union[int, tuple]:
         """
         Retrieve or enable/disable the dashes for the line
@@ -5220,8 +5853,6 @@ class Line(Object):
         """
 
         if dashes is not None:
-            verify(dashes, (int, tuple))
-
             if type(dashes) == tuple:
                 for dash in dashes:
                     verify(dash, int)
@@ -5232,6 +5863,8 @@ class Line(Object):
 
         return self._dashes
 
+    @threadsafe
+    @validate
     def visible(self, visible: bool = None) -> bool:
         """
         Get or set the visibility of the line
@@ -5240,15 +5873,16 @@ class Line(Object):
         """
 
         if visible is not None:
-            verify(visible, bool)
             self._visible = visible
+            self._changed()
 
-            state = tk.NORMAL if self._visible else tk.HIDDEN
+            state = self._state()
             self._screen._canvas.itemconfigure(self._ref, state=state)
             # self.update()
 
         return self._visible
 
+    @threadsafe
     def transform(self, transform: tuple = None):
         """
         Copy the line's length and angle!
@@ -5370,8 +6004,10 @@ class Line(Object):
         return False
 
     # noinspection PyProtectedMember
+    @threadsafe
     def update(self):
         self._check()
+        self._changed()
 
         try:
             old_ref = self._ref
@@ -5379,13 +6015,15 @@ class Line(Object):
             if self._dashes is not None and type(self._dashes) is not tuple:
                 self._dashes = (self._dashes, self._dashes)
 
-            state = tk.NORMAL if self._visible else tk.HIDDEN
-            self._ref = self._screen._screen.cv.create_line(self._pos1.x() - self._screen.width() / 2,
-                                                            self._pos1.y() - self._screen.height() / 2,
-                                                            self._pos2.x() - self._screen.width() / 2,
-                                                            self._pos2.y() - self._screen.height() / 2,
+            state = self._state()
+            self._ref = self._screen._screen.cv.create_line(self._screen._canvas_x(self._pos1.x()),
+                                                            self._screen._canvas_y(self._pos1.y()),
+                                                            self._screen._canvas_x(self._pos2.x()),
+                                                            self._screen._canvas_y(self._pos2.y()),
                                                             fill=self._screen._colorstr(self.color()),
-                                                            width=self._thickness, dash=self._dashes, state=state)
+                                                            width=self._thickness * self._screen._zoom,
+                                                            dash=self._dashes, state=state,
+                                                            tags=self._screen._screen.cv.gettags(old_ref))
 
             self._screen._screen.cv.tag_lower(self._ref, old_ref)
             self._screen._screen.cv.delete(old_ref)
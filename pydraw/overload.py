@@ -349,6 +349,7 @@ def ordering(signatures):
 
 # DISPATCHER
 from warnings import warn
+from types import MethodType
 import inspect
 import itertools as itl
 
@@ -572,6 +573,9 @@ class Dispatcher(object):
 
         self.funcs[tuple(new_signature)] = func
         self._cache.clear()
+        # Exact signatures are the common case, so they never have to go through dispatch().
+        self._cache.update((sig, f) for sig, f in self.funcs.items()
+                           if not any(isvariadic(typ) for typ in sig))
 
         try:
             del self._ordering
@@ -593,16 +597,11 @@ class Dispatcher(object):
         return od
 
     def __call__(self, *args, **kwargs):
-        types = tuple([type(arg) for arg in args])
+        types = tuple(map(type, args))
         try:
             func = self._cache[types]
         except KeyError:
-            func = self.dispatch(*types)
-            if not func:
-                raise NotImplementedError(
-                    'Could not find signature for %s: <%s>' %
-                    (self.name, str_signature(types)))
-            self._cache[types] = func
+            func = self._resolve(types)
         try:
             return func(*args, **kwargs)
 
@@ -622,6 +621,17 @@ class Dispatcher(object):
                 ),
             )
 
+    def _resolve(self, types):
+        """ Dispatch a signature that isn't cached yet, and cache it """
+        func = self.dispatch(*types)
+        if not func:
+            raise NotImplementedError(
+                'Could not find signature for %s: <%s>' %
+                (self.name, str_signature(types)))
+
+        self._cache[types] = func
+        return func
+
     def __str__(self):
         return "<dispatched %s>" % self.name
 
@@ -735,7 +745,7 @@ class MethodDispatcher(Dispatcher):
     See Also:
         Dispatcher
     """
-    __slots__ = ('obj', 'cls')
+    __slots__ = ()
 
     @classmethod
     def get_func_params(cls, func):
@@ -744,17 +754,20 @@ class MethodDispatcher(Dispatcher):
             return itl.islice(sig.parameters.values(), 1, None)
 
     def __get__(self, instance, owner):
-        self.obj = instance
-        self.cls = owner
-        return self
-
-    def __call__(self, *args, **kwargs):
-        types = tuple([type(arg) for arg in args])
-        func = self.dispatch(*types)
-        if not func:
-            raise NotImplementedError('Could not find signature for %s: <%s>' %
-                                      (self.name, str_signature(types)))
-        return func(self.obj, *args, **kwargs)
+        # A real bound method, like a plain function would give. The dispatcher itself stays shared and unchanged,
+        # so it is safe to use from several instances (and threads) at once.
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self, obj, *args, **kwargs):
+        # Dispatch on everything but `self`, through the same per-signature cache as plain functions.
+        types = tuple(map(type, args))
+        try:
+            func = self._cache[types]
+        except KeyError:
+            func = self._resolve(types)
+        return func(obj, *args, **kwargs)
 
 
 def str_signature(sig):
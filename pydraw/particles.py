@@ -0,0 +1,295 @@
+"""
+ParticleSystems: lots of small, short-lived particles (sparks, smoke, explosions) without creating any Objects.
+"""
+
+import math
+import random
+import time
+import tkinter as tk
+from array import array
+
+from pydraw import Screen, Color
+from pydraw.errors import *
+from pydraw.util import *
+
+SHAPES = ('oval', 'rectangle')
+MAX_STEP = 0.1  # The longest (in seconds) a single step may be, so a stalled frame doesn't fling particles away
+
+
+class ParticleSystem:
+    """
+    A fixed pool of particles. Every particle's canvas item is created up front, and particles that die are simply
+    hidden and reused by the next emit(), so explosions never create or delete anything:
+
+        sparks = ParticleSystem(screen, 500, size=3, color=Color('orange'), gravity=300)
+        sparks.emit(target.center(), 20, speed=200)
+
+    Particles move on their own as the screen updates. Positions, velocities and ages are kept in flat arrays
+    (numpy arrays if numpy is installed, so the whole pool moves in a handful of operations).
+    """
+
+    def __init__(self, screen: Screen, max_particles: int = 100, shape: str = 'oval', size: float = 4,
+                 color: Color = Color('black'), lifetime: float = 1, gravity: float = 0):
+        verify(screen, Screen, max_particles, int, shape, str, size, (float, int), color, Color,
+               lifetime, (float, int), gravity, (float, int))
+
+        if max_particles <= 0:
+            raise InvalidArgumentError('A ParticleSystem must have room for at least one particle!')
+        if shape not in SHAPES:
+            raise InvalidArgumentError(f'Unknown particle shape: {shape}, expected one of: {", ".join(SHAPES)}')
+
+        self._screen = screen
+        self._max = max_particles
+        self._size = size
+        self._color = color
+        self._lifetime = lifetime
+        self._gravity = gravity
+        self._visible = True
+
+        try:
+            import numpy
+            self._numpy = numpy
+            zeros = lambda: numpy.zeros(max_particles)
+            self._alive = numpy.zeros(max_particles, dtype=bool)
+        except ImportError:
+            self._numpy = None
+            zeros = lambda: array('d', bytes(8 * max_particles))
+            self._alive = bytearray(max_particles)
+
+        self._x, self._y = zeros(), zeros()
+        self._vx, self._vy = zeros(), zeros()
+        self._age, self._life = zeros(), zeros()
+
+        self._free = list(range(max_particles - 1, -1, -1))  # a stack of dead particles, ready to be reused
+        self._last = None  # when we last stepped (a time.perf_counter() value)
+
+        # The pool: one hidden item per particle, created once and never deleted until the system is removed.
+        self._tag = f'pydraw-particles-{id(self)}'
+        colorstr = screen._colorstr(color)
+        create = screen._canvas.create_oval if shape == 'oval' else screen._canvas.create_rectangle
+        self._items = [create(0, 0, 0, 0, fill=colorstr, outline='', state=tk.HIDDEN, tags=self._tag)
+                       for _ in range(max_particles)]
+        self._colors = [colorstr] * max_particles
+
+        # noinspection PyProtectedMember
+        screen._layers.append(self)
+
+    def emit(self, *args, count: int = 1, speed: float = 100, direction: float = 0, spread: float = 360,
+             lifetime: float = None, color: Color = None) -> int:
+        """
+        Sends out new particles from a point. Takes a Location, tuple, or two numbers (x, y) for the point.
+        If every particle is alive, no more are emitted until some of them die.
+        :param count: how many particles to emit
+        :param speed: how fast (in pixels per second) the particles start moving
+        :param direction: the direction (in degrees, 0 is up and it goes clockwise) to emit towards
+        :param spread: how wide (in degrees) around the direction the particles are spread out
+        :param lifetime: how long (in seconds) the particles live, defaults to the system's lifetime
+        :param color: the color of the particles, defaults to the system's color
+        :return: the number of particles that were emitted
+        """
+
+        if len(args) == 1 and hasattr(args[0], 'x'):
+            x, y = args[0].x(), args[0].y()
+        elif len(args) == 1 and type(args[0]) is tuple:
+            x, y = args[0]
+        elif len(args) == 2:
+            x, y = args
+        else:
+            raise InvalidArgumentError('emit() takes a Location, tuple, or two numbers (x, y)!')
+
+        verify(x, (float, int), y, (float, int), count, int, speed, (float, int), direction, (float, int),
+               spread, (float, int), lifetime, (float, int), color, Color)
+
+        lifetime = self._lifetime if lifetime is None else lifetime
+        colorstr = self._screen._colorstr(color if color is not None else self._color)
+
+        emitted = min(count, len(self._free))
+        for _ in range(emitted):
+            i = self._free.pop()
+
+            angle = math.radians(direction + (random.random() - 0.5) * spread)
+            self._x[i], self._y[i] = x, y
+            self._vx[i] = speed * math.sin(angle)
+            self._vy[i] = speed * -math.cos(angle)
+            self._age[i] = 0
+            self._life[i] = lifetime
+            self._alive[i] = True
+
+            if self._colors[i] != colorstr:
+                self._colors[i] = colorstr
+                self._screen._canvas.itemconfigure(self._items[i], fill=colorstr)
+
+            self._place(i)
+            if self._visible:
+                self._screen._canvas.itemconfigure(self._items[i], state=tk.NORMAL)
+
+        return emitted
+
+    def step(self, seconds: float) -> None:
+        """
+        Moves every particle forward in time. This happens on its own as the screen updates, so you'll only need it
+        to run the system at your own pace.
+        :param seconds: how much time passes
+        :return: None
+        """
+
+        verify(seconds, (float, int))
+
+        dead, living = self._integrate(seconds) if self._numpy is not None else self._integrate_python(seconds)
+
+        canvas = self._screen._canvas
+        for i in dead:
+            canvas.itemconfigure(self._items[i], state=tk.HIDDEN)
+            self._free.append(i)
+
+        if self._visible:
+            for i in living:
+                self._place(i)
+
+    def count(self) -> int:
+        """
+        Returns the number of particles that are alive
+        :return: the number of particles
+        """
+
+        return self._max - len(self._free)
+
+    def max_particles(self) -> int:
+        """
+        Returns the size of the pool (the most particles that can be alive at once)
+        :return: the number of particles
+        """
+
+        return self._max
+
+    def gravity(self, gravity: float = None) -> float:
+        """
+        Get or set the gravity (in pixels per second squared, downwards) that pulls on the particles
+        :param gravity: the gravity to set to, if any
+        :return: the gravity
+        """
+
+        if gravity is not None:
+            verify(gravity, (float, int))
+            self._gravity = gravity
+
+        return self._gravity
+
+    def clear(self) -> None:
+        """
+        Kills every particle
+        :return: None
+        """
+
+        for i in range(self._max):
+            self._alive[i] = False
+
+        self._free = list(range(self._max - 1, -1, -1))
+        self._screen._canvas.itemconfigure(self._tag, state=tk.HIDDEN)
+
+    def visible(self, visible: bool = None) -> bool:
+        """
+        Get or set the visibility of the particles
+        :param visible: the new visibility, if any
+        :return: the visibility
+        """
+
+        if visible is not None:
+            verify(visible, bool)
+            self._visible = visible
+
+            canvas = self._screen._canvas
+            for i in range(self._max):
+                if self._alive[i]:
+                    if visible:
+                        self._place(i)
+                    canvas.itemconfigure(self._items[i], state=tk.NORMAL if visible else tk.HIDDEN)
+
+        return self._visible
+
+    def front(self) -> None:
+        """
+        Brings the particles to the front of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_raise(self._tag)
+
+    def back(self) -> None:
+        """
+        Brings the particles to the back of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_lower(self._tag)
+
+    def remove(self) -> None:
+        """
+        Removes the ParticleSystem (and its pool) from the Screen. The system is left empty, and emits nothing more.
+        :return: None
+        """
+
+        self._screen._canvas.delete(self._tag)
+        for i in range(self._max):
+            self._alive[i] = False
+
+        # Without a pool there's nothing left to step, emit, or show.
+        self._max = 0
+        self._items = []
+        self._free = []
+
+        if self in self._screen._layers:
+            self._screen._layers.remove(self)
+
+    def _refresh(self) -> None:
+        # Called every frame by the Screen.
+        now = time.perf_counter()
+        if self._last is not None and self.count() > 0:
+            self.step(min(MAX_STEP, now - self._last))
+
+        self._last = now
+
+    def _integrate(self, dt: float) -> tuple:
+        # The whole pool at once, with numpy.
+        np = self._numpy
+        alive = self._alive
+
+        self._age[alive] += dt
+        dying = np.flatnonzero(alive & (self._age >= self._life))
+        alive[dying] = False
+
+        self._vy[alive] += self._gravity * dt
+        self._x[alive] += self._vx[alive] * dt
+        self._y[alive] += self._vy[alive] * dt
+
+        return dying.tolist(), np.flatnonzero(alive).tolist()
+
+    def _integrate_python(self, dt: float) -> tuple:
+        dying, living = [], []
+        alive, age, life = self._alive, self._age, self._life
+        x, y, vx, vy = self._x, self._y, self._vx, self._vy
+        pull = self._gravity * dt
+
+        for i in range(self._max):
+            if not alive[i]:
+                continue
+
+            age[i] += dt
+            if age[i] >= life[i]:
+                alive[i] = False
+                dying.append(i)
+                continue
+
+            vy[i] += pull
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            living.append(i)
+
+        return dying, living
+
+    def _place(self, i: int) -> None:
+        screen = self._screen
+        radius = self._size * screen._zoom / 2
+        cx, cy = screen._canvas_x(self._x[i]), screen._canvas_y(self._y[i])
+
+        screen._canvas.coords(self._items[i], cx - radius, cy - radius, cx + radius, cy + radius)
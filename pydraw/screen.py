@@ -2,6 +2,11 @@ import turtle
 import tkinter as tk
 import inspect
 import time
+import heapq
+import traceback
+import threading
+import functools
+import concurrent.futures
 
 from pydraw import Color
 from pydraw import Location
@@ -116,6 +121,70 @@ BUTTONS = [
 ]
 
 BORDER_CONSTANT = 10
+ASSET_POLL_INTERVAL = 10  # How often (in milliseconds) we check on assets being loaded in the background.
+GRID_TAG = 'pydraw-grid'  # Every item of the grid shares this canvas tag.
+CAMERA_REGION = 10 ** 7  # How far (in canvas pixels) from the origin the camera can scroll.
+DEFAULT_FPS = 60  # The frame rate next_frame() and run_async() aim for unless told otherwise.
+
+
+def threadsafe(method=None, getter: bool = None):
+    """
+    Decorates a method of an object that lives on a Screen (anything with a `_screen`), so that it may be called from
+    any thread. Tk must only ever be touched by the thread that created the Screen, so calls from other threads are
+    queued on the Screen and applied together at its next update().
+
+    A queued call returns a concurrent.futures.Future straight away, which holds the method's result (or the error
+    it raised) once it has run. Until then the object hasn't changed: `rect.x()` right after `rect.x(10)` still
+    returns the old x on a worker thread. Call `.result()` on the future to wait for the change.
+
+    Getter-style calls (no arguments, on a method whose parameters all default to None) don't touch Tk, so they run
+    right away on any thread, without checking which thread we're on. Pass `getter=False` for methods whose
+    no-argument call is not a getter.
+
+    If the method is decorated with util.validate() (below this), its arguments are checked here, in the calling
+    thread, so that the method isn't wrapped twice.
+
+    Code that runs every frame (culling, tweens, layers) should read an object's fields directly rather than go
+    through its decorated getters, as even the getter path is one more Python call.
+    """
+
+    if method is None:
+        return lambda function: threadsafe(function, getter)
+
+    check = getattr(method, '_check', None)
+    if check is not None:
+        method = method.__wrapped__
+
+    if getter is None:
+        parameters = list(inspect.signature(method).parameters.values())[1:]
+        variadic = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        getter = len(parameters) > 0 and \
+            all(parameter.default is None or parameter.kind in variadic for parameter in parameters)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not args and not kwargs and getter:
+            return method(self)
+
+        if check is not None:
+            check((self,) + args, kwargs)
+
+        screen = self._screen
+        if threading.get_ident() == screen._thread or \
+                (getter and all(arg is None for arg in args) and all(arg is None for arg in kwargs.values())):
+            return method(self, *args, **kwargs)
+
+        # noinspection PyProtectedMember
+        return screen._defer(method, (self,) + args, kwargs)
+
+    # Let the docs (and help()) say what a call from another thread returns.
+    doc = inspect.cleandoc(method.__doc__ or '')
+    wrapper.__doc__ = (doc + '\n\n' if doc else '') + \
+        'Called from a thread other than the Screen\'s, ' + \
+        ('any call that sets something' if getter else 'this') + \
+        ' returns a concurrent.futures.Future of the result instead (see pydraw.screen.threadsafe).'
+
+    return wrapper
 
 
 class Screen:
@@ -187,6 +256,45 @@ class Screen:
         self._root.protocol("WM_DELETE_WINDOW", onclose)
 
         self.registry = {}  # The input function registry (stores input callbacks)
+        self._handlers = {}  # input type -> (function, thunk), see _handler()
+
+        # Mouse movement and drags are coalesced: only the latest position is handled, once Tk is idle.
+        self._pending_move = None  # (x, y) in window coordinates
+        self._pending_drags = {}  # button -> (x, y) in turtle coordinates
+        self._flushing = False
+
+        # What is held down right now, see pressed() and buttons()
+        self._keys = {}  # physical key -> the name it was pressed as
+        self._buttons = set()
+
+        # Background asset loading (created lazily, most programs never load anything asynchronously)
+        self._executor = None
+        self._assets = []  # pairs of (future, callback)
+        self._asset_errors = []  # errors from finished assets, raised by wait_for_assets()
+        self._polling_assets = False
+
+        # Calls made from other threads, waiting to be applied on ours (see threadsafe and call())
+        from collections import deque
+        self._thread = threading.get_ident()
+        self._commands = deque()  # appending and popping from either end of a deque is thread-safe
+
+        # Every timer (see after() and every()), in a heap of (due, sequence, Timer) so the next one due is always first
+        self._timers = []
+        self._timer_sequence = 0
+        self._cancelled_timers = 0  # How many of the timers in the heap have been cancelled
+        self._tweens = []  # Animations that are playing, see animate()
+
+        self._last_frame = None  # When next_frame() last drew the screen (a time.perf_counter() value)
+
+        self._zoom = 1  # Owned by the camera, but every coordinate conversion needs it.
+        self.camera = Camera(self)
+
+        self._culling = False
+        self._culling_margin = 0
+        self._culled_view = None  # the view we culled against last frame
+        self._reshaped = False  # whether any object was added, moved or resized since then
+
+        self._layers = []  # Layers, TileMaps and the like, which redraw themselves at the start of each frame
 
     def title(self, title: str = None) -> str:
         """
@@ -330,8 +438,40 @@ class Screen:
         :return: the mouse-position in the form of a Location
         """
 
+        if self._pending_move is not None:
+            self._mouse = self._move_location(*self._pending_move)
+
         return self._mouse
 
+    def pressed(self, key=None):
+        """
+        Check whether a key is being held down right now, for polling input once per frame instead of
+        reacting to keydown events (which repeat at whatever rate the OS likes):
+
+            if screen.pressed('w'):
+                player.move(0, -5)
+
+        Keys are named the same way as in keydown (e.g. 'a', 'space', 'up', 'shift_l').
+        Input must have been enabled with `screen.listen()`.
+        :param key: the key to check, if any
+        :return: whether the key is held down, or a tuple of every key held down if no key was passed
+        """
+
+        if key is None:
+            return tuple(self._keys.values())
+
+        verify(key, (str, Screen.Key))
+        return str(key).lower() in self._keys.values()
+
+    def buttons(self) -> tuple:
+        """
+        Returns the mouse buttons that are being held down right now
+        Input must have been enabled with `screen.listen()`.
+        :return: a tuple of button numbers (1 is left, 2 is middle, 3 is right)
+        """
+
+        return tuple(sorted(self._buttons))
+
     # Direct Manipulation
     def alert(self, text: str, title: str = 'Alert', accept_text: str = 'Ok', cancel_text: str = 'Cancel') -> bool:
         """
@@ -370,16 +510,22 @@ class Screen:
         return text
 
     def grid(self, rows: int = None, cols: int = None, cellsize: tuple = (50, 50), helpers: bool = True):
-        from pydraw import Line, Text
+        """
+        Draws a grid over the screen (with labels for the coordinates of each line if helpers is True).
+        The grid is drawn directly onto the canvas under a single tag, so it costs no objects, and toggling it
+        is a single canvas call.
+        :param rows: the number of rows, if any (overrides the cell height)
+        :param cols: the number of columns, if any (overrides the cell width)
+        :param cellsize: the size of each cell as a tuple of (width, height)
+        :param helpers: whether to label the lines with their coordinates
+        :return: None
+        """
 
         verify(rows, int, cols, int, cellsize, tuple, helpers, bool)
 
-        if len(self._gridlines) > 0:
-            [line.remove() for line in self._gridlines]
-            self._gridlines.clear()
-        if len(self._helpers) > 0:
-            [helper.remove() for helper in self._helpers]
-            self._helpers.clear()
+        self._canvas.delete(GRID_TAG)
+        self._gridlines.clear()
+        self._helpers.clear()
         self._gridstate = True
 
         if rows is not None:
@@ -387,32 +533,17 @@ class Screen:
         if cols is not None:
             cellsize = (cellsize[0], self.width() / cols)
 
-        if helpers:
-            textsize = int((self.width() + self.height() / 2) / 70)  # Text size is proportionate to screensize.
-
         for row in range(int(cellsize[1]), int(self.height()), int(cellsize[1])):
-            line = Line(self, Location(0, row), Location(self.width(), row),
-                        color=Color('lightgray'))
-            self._gridlines.append(line)
-            self._objects.remove(line)  # Don't want this in our objects list :)
-
+            self._gridlines.append((Location(0, row), Location(self.width(), row)))
             if helpers:
-                helper = Text(self, str(row), 15, row, color=Color('gray'), size=textsize)
-                helper.move(-helper.width() / 2, -helper.height() / 2)
-                self._helpers.append(helper)
-                self._objects.remove(helper)
+                self._helpers.append((str(row), Location(15, row)))
 
         for col in range(int(cellsize[0]), int(self.width()), int(cellsize[0])):
-            line = Line(self, Location(col, 0), Location(col, self.height()),
-                        color=Color('lightgray'))
-            self._gridlines.append(line)
-            self._objects.remove(line)  # Don't want this in our objects list :)
-
+            self._gridlines.append((Location(col, 0), Location(col, self.height())))
             if helpers:
-                helper = Text(self, str(col), col, 10, color=Color('gray'), size=textsize)
-                helper.move(-helper.width() / 2, -helper.height() / 2)
-                self._helpers.append(helper)
-                self._objects.remove(helper)
+                self._helpers.append((str(col), Location(col, 10)))
+
+        self._draw_grid()
 
     def toggle_grid(self, value=None):
         if value is None:
@@ -421,42 +552,44 @@ class Screen:
         if len(self._gridlines) == 0:
             self.grid()  # Create a grid if one does not exist.
 
-        [line.visible(value) for line in self._gridlines]
-        [helper.visible(value) for helper in self._helpers]
+        self._gridstate = value
+        self._canvas.itemconfigure(GRID_TAG, state=tk.NORMAL if value else tk.HIDDEN)
 
     def gridlines(self) -> tuple:
         """
         Allows you to retrieve the lines of the grid, but note that you cannot modify them!
-        :return: a tuple (immutable list) of the gridlines.
+        :return: a tuple (immutable list) of the gridlines, each a tuple of the two Locations it runs between.
         """
 
         return tuple(self._gridlines)
 
-    def _redraw_grid(self):
+    def _draw_grid(self):
         """
-        An internal method to redraw the grid to the screen after screen.clear() is called.
+        An internal method which draws the grid onto the canvas (every item shares the grid's tag).
         """
-        from pydraw import Line, Text
 
-        new_lines = []
-        for line in self._gridlines:
-            new_line = Line(self, line.pos1(), line.pos2(), color=line.color())
-            line.remove()
-            self._objects.remove(new_line)  # Still don't want this in the main objects list.
-            new_lines.append(new_line)
+        state = tk.NORMAL if self._gridstate else tk.HIDDEN
 
-        new_helpers = []
-        for helper in self._helpers:
-            new_helper = Text(self, helper.text(), helper.x(), helper.y(), color=helper.color(), size=helper.size())
-            helper.remove()
-            self._objects.remove(new_helper)
-            new_helpers.append(new_helper)
+        line_color = self._colorstr(Color('lightgray'))
+        for start, end in self._gridlines:
+            self._canvas.create_line(self._canvas_x(start.x()), self._canvas_y(start.y()),
+                                     self._canvas_x(end.x()), self._canvas_y(end.y()),
+                                     fill=line_color, width=1, state=state, tags=GRID_TAG)
 
-        self._gridlines.clear()
-        self._gridlines = new_lines
+        # Text size is proportionate to screensize (negative sizes are in pixels).
+        font = ('Arial', -int((self.width() + self.height() / 2) / 70))
+        helper_color = self._colorstr(Color('gray'))
+        for text, location in self._helpers:
+            self._canvas.create_text(self._canvas_x(location.x()), self._canvas_y(location.y()), text=text,
+                                     fill=helper_color, font=font, state=state, tags=GRID_TAG)
 
-        self._helpers.clear()
-        self._helpers = new_helpers
+    def _redraw_grid(self):
+        """
+        An internal method to redraw the grid to the screen after screen.clear() is called.
+        """
+
+        self._canvas.delete(GRID_TAG)
+        self._draw_grid()
 
     def grab(self, filename: str = None) -> str:
         """
@@ -532,6 +665,7 @@ class Screen:
         """
 
         self._objects.append(obj)
+        self._reshaped = True
 
     def add(self, obj) -> None:
         """
@@ -547,8 +681,16 @@ class Screen:
 
     # noinspection PyProtectedMember
     def remove(self, obj):
+        # Animations of the object would only try to update it once it's gone.
+        for tween in self._tweens:
+            if tween._object is obj:
+                tween.cancel()
+
         # self._screen.cv.delete(obj._ref)
         try:
+            if obj._layer is not None:
+                obj._layer.remove(obj)
+
             self._canvas.delete(obj._ref)
             if obj in self._objects:
                 self._objects.remove(obj)
@@ -580,11 +722,18 @@ class Screen:
 
     def clear(self) -> None:
         """
-        Clears the screen.
+        Clears the screen, removing every object (and every Layer, TileMap, LargeImage, ParticleSystem and ShapeArray).
         :return: None
         """
 
+        from pydraw import Layer
+
         try:
+            for layer in self._layers[::-1]:
+                # A Layer's remove() takes one of its objects, clear() is what removes the Layer itself.
+                layer.clear() if isinstance(layer, Layer) else layer.remove()
+            self._layers.clear()
+
             for i in range(len(self._objects) - 1, -1, -1):
                 self._objects[i].remove()
             # if self._gridstate:
@@ -621,6 +770,7 @@ class Screen:
 
             self.registry[name.lower()] = function
 
+        self._compile_handlers()
         self._scene = scene
         scene.activate(self)
 
@@ -630,18 +780,23 @@ class Screen:
         :return: None
         """
 
-        self.toggle_grid(False)
+        self._canvas.delete(GRID_TAG)
         self._gridlines.clear()
-        for line in self._gridlines:
-            line.remove()
-
-        for obj in self._helpers:
-            obj.remove()
         self._helpers.clear()
+        self._gridstate = False
         self._helperstate = False
 
         self.clear()
         self.registry.clear()
+        self._handlers.clear()
+        for _, _, timer in self._timers:
+            timer._queued = False
+            timer._cancelled = True
+        self._timers.clear()
+        self._cancelled_timers = 0
+        self._tweens.clear()
+        self._pending_move = None
+        self._pending_drags.clear()
 
     # @staticmethod
     def sleep(self, delay: float, delta: bool = False) -> None:
@@ -673,11 +828,55 @@ class Screen:
 
         time.sleep(delay)
 
+    def bake(self, *objects) -> 'Layer':
+        """
+        Bakes objects into a single image on the canvas, which is much cheaper to draw than lots of separate
+        objects (great for backgrounds). The objects are baked again whenever one of them changes.
+        See Layer for more details.
+        :param objects: the Objects to bake (or a list of them)
+        :return: the static Layer containing the objects
+        """
+        from pydraw import Layer
+
+        if len(objects) == 1 and type(objects[0]) in (list, tuple):
+            objects = objects[0]
+
+        return Layer(self, *objects, static=True)
+
+    def culling(self, enabled: bool = None, margin: float = None) -> bool:
+        """
+        Get or set whether objects outside of the camera's view are culled. Culled objects are hidden, and skip
+        recalculating their shape until they come back into view, so large worlds only pay for what is visible.
+        Culling happens once per frame, in screen.update().
+        :param enabled: whether to cull objects, if any
+        :param margin: how far (in pixels) outside of the view objects may be before they are culled, if any
+        :return: whether culling is enabled
+        """
+
+        verify(enabled, bool, margin, (float, int))
+
+        if margin is not None:
+            self._culling_margin = margin
+
+        if enabled is not None and enabled != self._culling:
+            self._culling = enabled
+            self._culled_view = None
+
+            if not enabled:
+                for obj in self._objects:
+                    if obj._culled:
+                        obj._cull(False)
+
+        return self._culling
+
     def update(self) -> None:
         """
         Updates the screen.
         :return: None
         """
+        if not Screen._TERMINATING:
+            self._frame()
+
         try:
             # self._screen.update()
             self._canvas.update()
@@ -687,6 +886,53 @@ class Screen:
             print('Terminated.')
             exit(0)
 
+    def _frame(self) -> None:
+        """
+        Everything that happens once per frame, right before the screen is drawn.
+        """
+
+        self._run_commands()
+        self._run_timers()
+
+        if len(self._tweens) > 0:
+            from pydraw.tween import Tween
+            self._tweens = Tween._advance(self._tweens, time.perf_counter())
+
+        if self._culling:
+            self._cull()
+
+        for layer in self._layers:
+            layer._refresh()
+
+    # noinspection PyProtectedMember
+    def _cull(self) -> None:
+        location, width, height = self.camera.bounds()
+        margin = self._culling_margin
+
+        left, top = location.x() - margin, location.y() - margin
+        right, bottom = location.x() + width + margin, location.y() + height + margin
+
+        # Nothing moved in or out of view if neither the view nor any object changed.
+        view = (left, top, right, bottom)
+        if view == self._culled_view and not self._reshaped:
+            return
+
+        self._culled_view = view
+        self._reshaped = False
+
+        # Only objects that crossed the edge of the view since last frame are touched. Extents are cached on each
+        # object until it changes (see Object._changed()).
+        for obj in self._objects:
+            extent = obj._bounds
+            if extent is None:
+                extent = obj._bounds = obj._extent()
+
+            x1, y1, x2, y2 = extent
+            outside = x2 < left or x1 > right or y2 < top or y1 > bottom
+
+            if outside != obj._culled:
+                obj._cull(outside)
+
     def stop(self) -> None:
         """
         Deprecated. Use `screen.loop` instead.
@@ -705,8 +951,316 @@ class Screen:
         """
 
         self.update()
+        self._root.after(int(1000 / DEFAULT_FPS), self._poll_frame)
         self._turtle.done()
 
+    async def next_frame(self, fps: float = DEFAULT_FPS) -> float:
+        """
+        The asyncio version of `screen.update()` followed by `screen.sleep()`: draws the screen, then gives the rest
+        of the frame to other tasks (network requests, subprocesses, timers...) instead of blocking them.
+
+            async def main():
+                while True:
+                    player.move(1, 0)
+                    await screen.next_frame()
+
+            screen.run_async(main())
+
+        :param fps: the frame rate to aim for
+        :return: the time (in seconds) since the previous frame
+        """
+
+        verify(fps, (float, int))
+        if fps <= 0:
+            raise InvalidArgumentError('The frame rate must be greater than 0!')
+
+        import asyncio
+
+        start = time.perf_counter()
+        self.update()
+
+        # Sleep away whatever is left of this frame, letting every other task run meanwhile.
+        previous = self._last_frame
+        elapsed = time.perf_counter() - (previous if previous is not None else start)
+        await asyncio.sleep(max(0.0, 1 / fps - elapsed))
+
+        self._last_frame = time.perf_counter()
+        return self._last_frame - previous if previous is not None else 0.0
+
+    def run_async(self, main, fps: float = DEFAULT_FPS):
+        """
+        Runs a coroutine (usually your program's `main()`) alongside the screen, all on one thread. The screen keeps
+        responding to input and redrawing even while the coroutine is waiting on something other than next_frame().
+        Use this instead of `screen.loop()`.
+        :param main: the coroutine to run
+        :param fps: how often (per second) the screen is kept up to date while no frames are being drawn
+        :return: whatever the coroutine returns
+        """
+
+        import asyncio
+
+        if not asyncio.iscoroutine(main):
+            raise InvalidArgumentError('run_async() must be passed a coroutine, e.g. screen.run_async(main())')
+        verify(fps, (float, int))
+        if fps <= 0:
+            raise InvalidArgumentError('The frame rate must be greater than 0!')
+
+        async def run():
+            task = asyncio.ensure_future(main)
+            interval = 1 / fps
+
+            while not task.done():
+                # Only step in when the program hasn't drawn a frame itself in a while.
+                if self._last_frame is None or time.perf_counter() - self._last_frame >= interval:
+                    self.update()
+
+                await asyncio.wait((task,), timeout=interval)
+
+            return task.result()
+
+        # Not asyncio.run(), which needs Python 3.7.
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(run())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def after(self, seconds: float, function, *args) -> 'Timer':
+        """
+        Calls a function once, after a number of seconds:
+
+            screen.after(2, explosion.remove)
+
+        Timers are checked once per frame (in `screen.update()`), so they are as precise as your frame rate.
+        If the function raises, the error is printed and the rest of the frame goes on as usual.
+        :param seconds: how long to wait
+        :param function: the function to call
+        :param args: any arguments to pass to the function
+        :return: the Timer, which can be cancelled
+        """
+
+        verify(seconds, (float, int))
+        if seconds < 0:
+            raise InvalidArgumentError('A timer cannot go off in the past!')
+
+        return self._schedule(Timer(self, function, args, None), seconds)
+
+    def every(self, seconds: float, function, *args) -> 'Timer':
+        """
+        Calls a function repeatedly, every number of seconds (until the Timer is cancelled):
+
+            blink = screen.every(0.5, lambda: text.visible(not text.visible()))
+            ...
+            blink.cancel()
+
+        :param seconds: the time between calls
+        :param function: the function to call
+        :param args: any arguments to pass to the function
+        :return: the Timer, which can be cancelled
+        """
+
+        verify(seconds, (float, int))
+        if seconds <= 0:
+            raise InvalidArgumentError('A repeating timer must have an interval greater than 0!')
+
+        return self._schedule(Timer(self, function, args, seconds), seconds)
+
+    def animate(self, obj, duration: float = 1, easing='ease_in_out', callback=None, **properties) -> 'Tween':
+        """
+        Smoothly changes the properties of an object over time, instead of moving it yourself every frame:
+
+            screen.animate(ball, x=700, color=Color('red'), duration=2, easing='bounce')
+
+        Properties: x, y, width, height, rotation and color (as far as the object has them).
+        Easings: linear, ease_in, ease_out, ease_in_out, bounce and elastic, or a function from 0-1 to 0-1.
+
+        Animations are played as the screen updates, every animation at once, and each object is only redrawn once
+        per frame no matter how many of its properties are animated.
+        :param obj: the Object to animate
+        :param duration: how long the animation takes in seconds
+        :param easing: the easing to use
+        :param callback: a function to call once the animation is over, if any
+        :return: the Tween, which can be cancelled
+        """
+
+        from pydraw.tween import Tween
+
+        tween = Tween(self, obj, duration, easing, callback, properties)
+        self._tweens.append(tween)
+        return tween
+
+    def _schedule(self, timer: 'Timer', seconds: float) -> 'Timer':
+        timer._due = time.perf_counter() + seconds
+        timer._queued = True
+        self._timer_sequence += 1  # Keeps timers that are due at the same time in the order they were made.
+        heapq.heappush(self._timers, (timer._due, self._timer_sequence, timer))
+        return timer
+
+    def _timer_cancelled(self) -> None:
+        # Cancelled timers are left in the heap to be skipped, until they make up half of it.
+        self._cancelled_timers += 1
+
+        if self._cancelled_timers > len(self._timers) / 2:
+            for _, _, timer in self._timers:
+                if timer._cancelled:
+                    timer._queued = False
+
+            self._timers = [entry for entry in self._timers if not entry[2]._cancelled]
+            heapq.heapify(self._timers)
+            self._cancelled_timers = 0
+
+    def _run_timers(self) -> None:
+        now = time.perf_counter()
+
+        # self._timers is looked up every time, as a timer's function may cancel timers (and so compact the heap).
+        while len(self._timers) > 0 and self._timers[0][0] <= now:
+            timer = heapq.heappop(self._timers)[2]
+            timer._queued = False
+
+            if timer._cancelled:
+                self._cancelled_timers -= 1
+                continue
+
+            if timer._interval is None:
+                timer._cancelled = True  # It has gone off, so it's done.
+            else:
+                # Rescheduled before the call, so the timer keeps going even if the function raises. We don't try to
+                # catch up on calls we've missed (after a long frame), we just carry on from now.
+                delay = timer._due + timer._interval - now
+                self._schedule(timer, delay if delay > 0 else timer._interval)
+
+            # One timer failing shouldn't hold up the rest of the frame, so we report it and carry on.
+            try:
+                timer._function(*timer._args)
+            except Exception:
+                traceback.print_exc()
+
+    def call(self, function, *args, **kwargs):
+        """
+        Calls a function on the thread that runs the Screen, from any thread. Most methods of objects do this for you
+        already (so `player.moveto(x, y)` works from a worker thread), but creating objects does not:
+
+            future = screen.call(Rectangle, screen, 100, 100, 50, 50)
+            rect = future.result()  # only once the main thread calls screen.update()!
+
+        Called from the Screen's own thread, the function is run right away.
+        :param function: the function to call
+        :return: a concurrent.futures.Future holding the function's result
+        """
+
+        if threading.get_ident() == self._thread:
+            future = concurrent.futures.Future()
+            self._resolve(future, function, args, kwargs)
+            return future
+
+        return self._defer(function, args, kwargs)
+
+    def _defer(self, function, args: tuple, kwargs: dict):
+        # Queues a call from another thread, to be applied at the next update(). See threadsafe.
+        future = concurrent.futures.Future()
+        self._commands.append((function, args, kwargs, future))
+        return future
+
+    def _run_commands(self) -> None:
+        # Applies every queued call in one go, in the order they were made. Calls queued meanwhile wait for next time.
+        # Errors end up in each call's future, rather than in the middle of the main thread's update().
+        for i in range(len(self._commands)):
+            function, args, kwargs, future = self._commands.popleft()
+            self._resolve(future, function, args, kwargs)
+
+    def _poll_frame(self) -> None:
+        # Runs from Tk's event loop, for programs that use screen.loop() instead of calling update() themselves.
+        if Screen._TERMINATING:
+            return
+
+        self._frame()
+        self._root.after(int(1000 / DEFAULT_FPS), self._poll_frame)
+
+    @staticmethod
+    def _resolve(future, function, args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        # noinspection PyBroadException
+        try:
+            future.set_result(function(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    def wait_for_assets(self, timeout: float = None) -> bool:
+        """
+        Blocks until every Image that is being loaded asynchronously (`async_load=True`) has been loaded
+        and swapped onto the screen. If any of them failed to load (they keep their placeholder), the first error is
+        raised once the rest are done.
+        :param timeout: the maximum amount of seconds to wait, if any
+        :return: True if all assets finished loading, False if the timeout ran out first
+        """
+
+        verify(timeout, (float, int))
+
+        deadline = None if timeout is None else time.time() + timeout
+        while len(self._assets) > 0:
+            remaining = None if deadline is None else max(0, deadline - time.time())
+            concurrent.futures.wait([future for future, callback in self._assets], timeout=remaining)
+
+            # Finishing an asset can queue another one (if it was modified while loading), so we go again.
+            self._finish_assets()
+
+            if deadline is not None and time.time() >= deadline:
+                break
+
+        if len(self._asset_errors) > 0:
+            error = self._asset_errors[0]
+            self._asset_errors = []
+            raise error
+
+        return len(self._assets) == 0
+
+    def _queue_asset(self, function, args: tuple, callback) -> None:
+        """
+        Runs `function(*args)` on the asset thread-pool, and hands the resulting future to `callback` once it is
+        done. The callback is always called on the Tk thread, so it is free to touch the canvas.
+        :param function: the function to run in the background (must not touch Tkinter!)
+        :param args: the arguments to pass to the function
+        :param callback: the function to call with the finished future
+        :return: None
+        """
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='pydraw-assets')
+
+        self._assets.append((self._executor.submit(function, *args), callback))
+
+        if not self._polling_assets:
+            self._polling_assets = True
+            self._root.after(ASSET_POLL_INTERVAL, self._poll_assets)
+
+    def _poll_assets(self) -> None:
+        # Runs from Tk's event loop, so this works with both screen.update() loops and screen.loop()
+        try:
+            self._finish_assets()
+        finally:
+            if len(self._assets) > 0 and not Screen._TERMINATING:
+                self._root.after(ASSET_POLL_INTERVAL, self._poll_assets)
+            else:
+                self._polling_assets = False
+
+    def _finish_assets(self) -> None:
+        pending = []
+        finished = []
+        for asset in self._assets:
+            (finished if asset[0].done() else pending).append(asset)
+
+        self._assets = pending
+        for future, callback in finished:
+            # One asset failing shouldn't leave the rest of the batch unfinished, so we keep the error for later.
+            try:
+                callback(future)
+            except Exception as e:
+                self._asset_errors.append(e)
+
     def exit(self) -> None:
         """
         Called at the end of pydraw programs as an event for succesful program execution and termination.
@@ -714,6 +1268,10 @@ class Screen:
         :return: None
         """
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         self._screen.clear()
         self._root.destroy()
         exit(0)
@@ -760,6 +1318,7 @@ class Screen:
             self.registry[name.lower()] = function
             # print('Registered input-function:', name)
 
+        self._compile_handlers()
         self._listen()
 
     def _listen(self):
@@ -775,6 +1334,9 @@ class Screen:
         self._screen.cv.bind('<Key>', (lambda e: self._keyhandler(e)))
         self._screen.cv.bind('<KeyRelease>', (lambda e: self._keyuphandler(e)))
 
+        # Releases that happen while we don't have focus never reach us, so we forget everything we held.
+        self._screen.cv.bind('<FocusOut>', (lambda e: self._release_all()), add='+')
+
         # Mouse
         for btn in BUTTONS:
             self._screen.onclick(self._create_lambda('mousedown', btn), btn)  # mousedown
@@ -838,31 +1400,42 @@ class Screen:
         elif method == 'mouseup':
             return lambda x, y: (self._mouseup(key, self.create_location(x, y)))
         elif method == 'mousedrag':
-            return lambda x, y: (self._mousedrag(key, self.create_location(x, y)))
+            return lambda x, y: (self._queue_drag(key, x, y))
         elif method == 'mousemove':
-            return lambda event: (self._mousemove(Location(event.x, event.y)))
+            return lambda event: (self._queue_move(event.x, event.y))
         else:
             return None
 
     def _keyhandler(self, event) -> None:
+        key = self._key_name(event)
+        self._keys[self._key_code(event)] = key
+
         if 'keydown' not in self.registry:
             return
 
-        key = str(event.char)
-        if "\\" in str(event.char.encode('ascii')) or key.strip() == "":
-            key = event.keysym
-
-        self.registry['keydown'](self.Key(key.lower()))
+        self.registry['keydown'](self.Key(key))
 
     def _keyuphandler(self, event) -> None:
+        key = self._key_name(event)
+        self._keys.pop(self._key_code(event), None)
+
         if 'keyup' not in self.registry:
             return
 
+        self.registry['keyup'](self.Key(key))
+
+    @staticmethod
+    def _key_code(event):
+        # The physical key, so a release matches its press even if Shift or Caps Lock changed the character between.
+        return getattr(event, 'keycode', None) or str(event.keysym).lower()
+
+    @staticmethod
+    def _key_name(event) -> str:
         key = str(event.char)
         if "\\" in str(event.char.encode('ascii')) or key.strip() == "":
             key = event.keysym
 
-        self.registry['keyup'](self.Key(key.lower()))
+        return key.lower()
 
     def _keydown(self, key) -> None:
         if 'keydown' not in self.registry:
@@ -883,40 +1456,20 @@ class Screen:
         self.registry['keypress'](self.Key(key.lower()))
 
     def _mousedown(self, button, location) -> None:
-        if 'mousedown' not in self.registry:
-            return
-
-        signature = inspect.signature(self.registry['mousedown'])
-        keys = list(signature.parameters.keys())
-
-        if keys[0] == "button" and keys[1] == "location":
-            self.registry['mousedown'](button, location)
-            print("[WARNING] in `mousedown` | Argument Pattern: (button, location) has been deprecated, "
-                  "please use (location, button) instead.")
-            return
-        elif len(keys) == 1:
-            self.registry['mousedown'](location)
-            return
+        self._flush_input()  # Anything that happened before the click is handled before it.
+        self._buttons.add(button)
 
-        self.registry['mousedown'](location, button)
+        handler = self._handler('mousedown')
+        if handler is not None:
+            handler(location, button)
 
     def _mouseup(self, button, location) -> None:
-        if 'mouseup' not in self.registry:
-            return
-
-        signature = inspect.signature(self.registry['mouseup'])
-        keys = list(signature.parameters.keys())
-
-        if keys[0] == "button" and keys[1] == "location":
-            self.registry['mouseup'](button, location)
-            print("[WARNING] in `mouseup` | Argument Pattern: (button, location) has been deprecated, "
-                  "please use (location, button) instead.")
-            return
-        elif len(keys) == 1:
-            self.registry['mouseup'](location)
-            return
+        self._flush_input()
+        self._buttons.discard(button)
 
-        self.registry['mouseup'](location, button)
+        handler = self._handler('mouseup')
+        if handler is not None:
+            handler(location, button)
 
     def _mouseclick(self, button, location) -> None:
         if 'mouseclick' not in self.registry:
@@ -925,22 +1478,9 @@ class Screen:
         self.registry['mouseclick'](button, location)
 
     def _mousedrag(self, button, location) -> None:
-        if 'mousedrag' not in self.registry:
-            return
-
-        signature = inspect.signature(self.registry['mousedrag'])
-        keys = list(signature.parameters.keys())
-
-        if keys[0] == "button" and keys[1] == "location":
-            self.registry['mousedrag'](button, location)
-            print("[WARNING] in `mousedrag` | Argument Pattern: (button, location) has been deprecated, "
-                  "please use (location, button) instead.")
-            return
-        elif len(keys) == 1:
-            self.registry['mousedrag'](location)
-            return
-
-        self.registry['mousedrag'](location, button)
+        handler = self._handler('mousedrag')
+        if handler is not None:
+            handler(location, button)
 
     def _mousemove(self, location) -> None:
         # We will update our internal storage of the mouse-location no matter what
@@ -951,6 +1491,84 @@ class Screen:
 
         self.registry['mousemove'](location)
 
+    def _release_all(self) -> None:
+        self._keys.clear()
+        self._buttons.clear()
+
+    def _queue_move(self, x: int, y: int) -> None:
+        self._pending_move = (x, y)
+        self._schedule_input()
+
+    def _queue_drag(self, button: int, x: float, y: float) -> None:
+        self._pending_drags[button] = (x, y)
+        self._schedule_input()
+
+    def _schedule_input(self) -> None:
+        if not self._flushing:
+            self._flushing = True
+            self._canvas.after_idle(self._flush_input)
+
+    def _flush_input(self) -> None:
+        """
+        Handles the latest mouse movement and drags. Tk fires an event for every pixel the mouse moves, so
+        instead of calling the handlers for each of them we only remember the newest position, and call the
+        handlers once Tk has worked through its queue of events.
+        """
+
+        self._flushing = False
+
+        if self._pending_move is not None:
+            location = self._move_location(*self._pending_move)
+            self._pending_move = None
+            self._mousemove(location)
+
+        if len(self._pending_drags) > 0:
+            drags = self._pending_drags
+            self._pending_drags = {}
+
+            for button, (x, y) in drags.items():
+                self._mousedrag(button, self.create_location(x, y))
+
+    def _move_location(self, x: int, y: int) -> Location:
+        return self.create_location(self._canvas.canvasx(x), -self._canvas.canvasy(y))
+
+    def _handler(self, method: str):
+        """
+        Returns the registered handler for an input type, wrapped so that it can always be called with
+        (location, button). The handler's signature is only inspected when it is registered, not on every event.
+        """
+
+        function = self.registry.get(method)
+        if function is None:
+            return None
+
+        compiled = self._handlers.get(method)
+        if compiled is None or compiled[0] is not function:
+            compiled = (function, self._compile(method, function))
+            self._handlers[method] = compiled
+
+        return compiled[1]
+
+    def _compile_handlers(self) -> None:
+        for method in self.registry:
+            self._handler(method)
+
+    @staticmethod
+    def _compile(method: str, function):
+        if method not in ('mousedown', 'mouseup', 'mousedrag'):
+            return function
+
+        keys = list(inspect.signature(function).parameters.keys())
+
+        if len(keys) >= 2 and keys[0] == "button" and keys[1] == "location":
+            print(f"[WARNING] in `{method}` | Argument Pattern: (button, location) has been deprecated, "
+                  "please use (location, button) instead.")
+            return lambda location, button: function(button, location)
+        elif len(keys) == 1:
+            return lambda location, button: function(location)
+
+        return function
+
     # --- Helper Methods --- #
     def create_location(self, x, y, canvas: bool = False) -> Location:
         """
@@ -965,10 +1583,24 @@ class Screen:
         if canvas:
             y = -y
 
-        return Location(x + (self.width() / 2), -y + (self.height() / 2))
+        return Location(x / self._zoom + (self.width() / 2), -y / self._zoom + (self.height() / 2))
 
     def canvas_location(self, x, y) -> Location:
-        return Location(x - self.width() / 2, y - self.height() / 2)
+        return Location(self._canvas_x(x), self._canvas_y(y))
+
+    def _canvas_x(self, x: float) -> float:
+        """
+        Converts an x-coordinate on the screen to one on the tk canvas (which is centered, and zoomed by the camera)
+        """
+
+        return (x - self.width() / 2) * self._zoom
+
+    def _canvas_y(self, y: float) -> float:
+        """
+        Converts a y-coordinate on the screen to one on the tk canvas (which is centered, and zoomed by the camera)
+        """
+
+        return (y - self.height() / 2) * self._zoom
 
     # -- Internals -- #
     def _onrelease(self, fun, btn, add=None):
@@ -1009,3 +1641,216 @@ class Screen:
 
     def _onkeytype(self, fun, btn, add=None):
         pass
+
+
+class Timer:
+    """
+    A function that has been scheduled to be called later, returned by `screen.after()` and `screen.every()`.
+    """
+
+    def __init__(self, screen: Screen, function, args: tuple, interval: float = None):
+        if not callable(function):
+            raise InvalidArgumentError('Timers must be passed a function to call!')
+
+        self._screen = screen
+        self._function = function
+        self._args = args
+        self._interval = interval  # None for timers that only go off once
+        self._due = 0
+        self._cancelled = False
+        self._queued = False  # Whether we're in the Screen's heap
+
+    def cancel(self) -> None:
+        """
+        Stops the timer, so that it doesn't go off (anymore)
+        :return: None
+        """
+
+        if self._cancelled:
+            return
+
+        self._cancelled = True
+        if self._queued:
+            # noinspection PyProtectedMember
+            self._screen._timer_cancelled()
+
+    def active(self) -> bool:
+        """
+        Returns whether the timer is still going to go off
+        :return: True if the timer hasn't been cancelled (or gone off, for one-time timers)
+        """
+
+        return not self._cancelled
+
+    def remaining(self) -> float:
+        """
+        Returns the time left until the timer goes off next
+        :return: the time in seconds, or 0 if the timer isn't active
+        """
+
+        if self._cancelled:
+            return 0
+
+        return max(0.0, self._due - time.perf_counter())
+
+
+class Camera:
+    """
+    The view onto a Screen (available as `screen.camera`). Moving or zooming the camera never touches your objects,
+    they keep their coordinates, and the canvas is simply scrolled or scaled underneath the window. That means
+    scrolling around a huge world costs the same no matter how many objects are in it:
+
+        screen.camera.move(5, 0)  # look a little further to the right
+        screen.camera.zoom(2)  # everything looks twice as big
+
+    Zooming scales shapes, their outlines, Lines and Images (which are rendered again at their new size, so that
+    needs PIL), but Text keeps its font size.
+    """
+
+    def __init__(self, screen: Screen):
+        self._screen = screen
+        self._x = 0  # The world coordinates at the top-left of the window
+        self._y = 0
+        self._active = False  # We leave the canvas alone until the camera is first used.
+
+    def x(self, x: float = None) -> float:
+        """
+        Get or set the x-coordinate at the left edge of the window
+        :param x: the x-coordinate to set to, if any
+        :return: the x-coordinate
+        """
+
+        if x is not None:
+            verify(x, (float, int))
+            self.moveto(x, self._y)
+
+        return self._x
+
+    def y(self, y: float = None) -> float:
+        """
+        Get or set the y-coordinate at the top edge of the window
+        :param y: the y-coordinate to set to, if any
+        :return: the y-coordinate
+        """
+
+        if y is not None:
+            verify(y, (float, int))
+            self.moveto(self._x, y)
+
+        return self._y
+
+    def location(self) -> Location:
+        """
+        Returns the Location at the top-left of the window
+        :return: the Location
+        """
+
+        return Location(self._x, self._y)
+
+    def move(self, *args, **kwargs) -> None:
+        """
+        Move the camera by a difference. Can take either a tuple, Location, or two numbers (dx, dy)
+        :return: None
+        """
+
+        location = self.location()
+        location.move(*args, **kwargs)
+        self.moveto(location)
+
+    def moveto(self, *args, **kwargs) -> None:
+        """
+        Move the camera so the top-left of the window shows a new Location. Takes a Location, tuple,
+        or two numbers (x, y)
+        :return: None
+        """
+
+        location = self.location()
+        location.moveto(*args, **kwargs)
+
+        self._x, self._y = location.x(), location.y()
+        self._apply()
+
+    def center(self, *args, **kwargs) -> Location:
+        """
+        Get the Location in the middle of the window, or pass a Location (or tuple, or two numbers) to look at it.
+        :return: the Location in the middle of the window
+        """
+
+        width, height = self.size()
+
+        if len(args) > 0 or len(kwargs) > 0:
+            location = Location(*args, **kwargs)
+            self.moveto(location.x() - width / 2, location.y() - height / 2)
+
+        return Location(self._x + width / 2, self._y + height / 2)
+
+    def size(self) -> (float, float):
+        """
+        Returns how much of the world fits in the window at the current zoom
+        :return: a tuple containing the width and height
+        """
+
+        return self._screen.width() / self._screen._zoom, self._screen.height() / self._screen._zoom
+
+    def bounds(self) -> (Location, float, float):
+        """
+        Get the part of the world that is visible in the window.
+        :return: a tuple containing the top-left Location, the width, and the height.
+        """
+
+        width, height = self.size()
+        return self.location(), width, height
+
+    def zoom(self, zoom: float = None) -> float:
+        """
+        Get or set the zoom of the camera (2 shows everything twice as big). Zooming keeps the middle of the window
+        where it is.
+        :param zoom: the zoom to set to, if any
+        :return: the zoom
+        """
+
+        if zoom is not None:
+            verify(zoom, (float, int))
+            if zoom <= 0:
+                raise InvalidArgumentError('The zoom of the camera must be greater than 0!')
+
+            center = self.center()
+            factor = zoom / self._screen._zoom
+            self._screen._zoom = zoom
+
+            # Canvas coordinates are all relative to its origin, so scaling around it keeps them consistent with
+            # everything drawn from now on.
+            self._screen._canvas.scale('all', 0, 0, factor, factor)
+            self.center(center)
+
+            # Tk scales coordinates, but not the width of outlines or the size of images.
+            for obj in self._screen._objects:
+                obj._rezoom()
+
+        return self._screen._zoom
+
+    def reset(self) -> None:
+        """
+        Moves the camera back to the top-left of the world, without any zoom.
+        :return: None
+        """
+
+        self.zoom(1)
+        self.moveto(0, 0)
+
+    def _apply(self) -> None:
+        canvas = self._screen._canvas
+
+        if not self._active:
+            # We need the canvas to be scrollable well past the window in every direction.
+            self._active = True
+            canvas.config(scrollregion=(-CAMERA_REGION, -CAMERA_REGION, CAMERA_REGION, CAMERA_REGION))
+            canvas.bind('<Configure>', lambda event: self._apply(), add='+')  # tk resets the view on resizes
+
+        # The window has a small border, which sits just outside the top-left of the world.
+        zoom = self._screen._zoom
+        left = (self._x - self._screen.width() / 2) * zoom - BORDER_CONSTANT / 2
+        top = (self._y - self._screen.height() / 2) * zoom - BORDER_CONSTANT / 2
+
+        canvas.xview_moveto((left + CAMERA_REGION) / (2 * CAMERA_REGION))
+        canvas.yview_moveto((top + CAMERA_REGION) / (2 * CAMERA_REGION))
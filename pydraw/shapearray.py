@@ -0,0 +1,381 @@
+"""
+ShapeArrays: thousands of identical kinds of shape, stored as columns of numbers instead of as Objects.
+"""
+
+import math
+import tkinter as tk
+
+from pydraw import Screen, Color
+from pydraw.errors import *
+from pydraw.util import *
+
+SHAPES = ('rectangle', 'oval', 'triangle', 'polygon')
+OVAL_VERTICES = 24  # ShapeArrays draw ovals as polygons with this many vertices
+
+
+class ShapeArray:
+    """
+    Many shapes of the same kind (rectangles, ovals, triangles or regular polygons), stored as parallel arrays of x, y,
+    width, height, rotation and color instead of one Object each. Every method works on the whole array at once, or
+    on just some of its rows (pass an index, a list of indices, a slice, or an array of booleans as `rows`):
+
+        boids = ShapeArray(screen, 50000, 'triangle', x=xs, y=ys, width=4, height=6)
+        boids.move(dx, dy)  # numpy arrays, one entry per boid
+        hit = boids.contains(screen.mouse())
+
+    Only rows that have actually changed are redrawn, once per frame.
+    (REQUIRES: numpy)
+    """
+
+    def __init__(self, screen: Screen, count: int, shape: str = 'rectangle', x=0, y=0, width=10, height=10,
+                 rotation=0, color: Color = Color('black'), sides: int = 6):
+        verify(screen, Screen, count, int, shape, str, color, Color, sides, int)
+
+        try:
+            import numpy
+        except ImportError:
+            raise UnsupportedError('As numpy is not installed, ShapeArrays are not supported! '
+                                   'Install numpy via: \'pip install numpy\'.')
+
+        if count <= 0:
+            raise InvalidArgumentError('A ShapeArray must contain at least one shape!')
+        if shape not in SHAPES:
+            raise InvalidArgumentError(f'Unknown shape: {shape}, expected one of: {", ".join(SHAPES)}')
+        if shape == 'polygon' and sides < 3:
+            raise InvalidArgumentError('Polygons must have at least 3 sides!')
+
+        self._np = numpy
+        self._screen = screen
+        self._count = count
+        self._shape = shape
+        self._visible = True
+
+        # Accepts a number for every row, or an array with one number per row.
+        def column(values):
+            return numpy.array(numpy.broadcast_to(numpy.asarray(values, dtype=float), (count,)))
+
+        self._x, self._y = column(x), column(y)
+        self._width, self._height = column(width), column(height)
+        self._angle = column(rotation)
+        self._colors = numpy.full(count, self._pack(color), dtype=numpy.uint32)
+
+        self._template = self._make_template(shape, sides)
+
+        self._moved = numpy.zeros(count, dtype=bool)  # rows whose geometry changed since the last redraw
+        self._recolored = numpy.zeros(count, dtype=bool)
+
+        self._tag = f'pydraw-shapes-{id(self)}'
+        canvas = screen._canvas
+        colorstr = screen._colorstr(color)
+        self._items = numpy.array([canvas.create_polygon(flat, fill=colorstr, outline='', tags=self._tag)
+                                   for flat in self._canvas_coords(numpy.arange(count)).tolist()])
+
+        # noinspection PyProtectedMember
+        screen._layers.append(self)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def shape(self) -> str:
+        """
+        Returns the kind of shape stored in the array
+        :return: 'rectangle', 'oval', 'triangle' or 'polygon'
+        """
+
+        return self._shape
+
+    def x(self, rows=None):
+        """
+        Returns the x-coordinates (of the top-left corners) of the shapes
+        :param rows: the rows to get, if not all of them
+        :return: a numpy array (a copy, use move() or moveto() to change it)
+        """
+
+        return self._x[self._rows(rows)].copy()
+
+    def y(self, rows=None):
+        """
+        Returns the y-coordinates (of the top-left corners) of the shapes
+        :param rows: the rows to get, if not all of them
+        :return: a numpy array (a copy, use move() or moveto() to change it)
+        """
+
+        return self._y[self._rows(rows)].copy()
+
+    def width(self, rows=None):
+        """
+        Returns the widths of the shapes
+        :param rows: the rows to get, if not all of them
+        :return: a numpy array (a copy, use resize() to change it)
+        """
+
+        return self._width[self._rows(rows)].copy()
+
+    def height(self, rows=None):
+        """
+        Returns the heights of the shapes
+        :param rows: the rows to get, if not all of them
+        :return: a numpy array (a copy, use resize() to change it)
+        """
+
+        return self._height[self._rows(rows)].copy()
+
+    def rotation(self, rows=None):
+        """
+        Returns the rotations (in degrees) of the shapes
+        :param rows: the rows to get, if not all of them
+        :return: a numpy array (a copy, use rotate() to change it)
+        """
+
+        return self._angle[self._rows(rows)] % 360
+
+    def move(self, dx=0, dy=0, rows=None) -> None:
+        """
+        Moves the shapes by an amount, which can be a number or an array with one number per row
+        :param dx: the distance to move along the x-axis
+        :param dy: the distance to move along the y-axis
+        :param rows: the rows to move, if not all of them
+        :return: None
+        """
+
+        rows = self._rows(rows)
+        self._x[rows] += dx
+        self._y[rows] += dy
+        self._moved[rows] = True
+
+    def moveto(self, x=None, y=None, rows=None) -> None:
+        """
+        Moves the shapes (their top-left corners) to new coordinates, which can be numbers or arrays
+        :param x: the new x-coordinates, if any
+        :param y: the new y-coordinates, if any
+        :param rows: the rows to move, if not all of them
+        :return: None
+        """
+
+        rows = self._rows(rows)
+        if x is not None:
+            self._x[rows] = x
+        if y is not None:
+            self._y[rows] = y
+        self._moved[rows] = True
+
+    def resize(self, width=None, height=None, rows=None) -> None:
+        """
+        Changes the sizes of the shapes, which can be numbers or arrays
+        :param width: the new widths, if any
+        :param height: the new heights, if any
+        :param rows: the rows to resize, if not all of them
+        :return: None
+        """
+
+        rows = self._rows(rows)
+        if width is not None:
+            self._width[rows] = width
+        if height is not None:
+            self._height[rows] = height
+        self._moved[rows] = True
+
+    def rotate(self, angle_diff=0, rows=None) -> None:
+        """
+        Rotates the shapes (around their centers) by an amount in degrees, which can be a number or an array
+        :param angle_diff: the amount to rotate by
+        :param rows: the rows to rotate, if not all of them
+        :return: None
+        """
+
+        rows = self._rows(rows)
+        self._angle[rows] += angle_diff
+        self._moved[rows] = True
+
+    def color(self, color: Color = None, rows=None):
+        """
+        Get or set the colors of the shapes
+        :param color: the Color to set to, if any
+        :param rows: the rows to color, if not all of them
+        :return: a list of the Colors of the rows
+        """
+
+        rows = self._rows(rows)
+        if color is not None:
+            verify(color, Color)
+            self._colors[rows] = self._pack(color)
+            self._recolored[rows] = True
+
+        return [Color(int(value) >> 16, (int(value) >> 8) & 0xFF, int(value) & 0xFF)
+                for value in self._np.atleast_1d(self._colors[rows])]
+
+    def contains(self, *args):
+        """
+        Finds the shapes that contain a point. Takes a Location, tuple, or two numbers (x, y)
+        :return: a numpy array of booleans, one per row
+        """
+
+        px, py = self._point(args)
+        np = self._np
+
+        # Move the point into every shape's own (unrotated, unit-sized) space.
+        radians = np.radians(self._angle)
+        cos, sin = np.cos(radians), np.sin(radians)
+        dx = px - (self._x + self._width / 2)
+        dy = py - (self._y + self._height / 2)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ux = (dx * cos + dy * sin) / self._width
+            uy = (-dx * sin + dy * cos) / self._height
+
+        if self._shape == 'oval':
+            return ux * ux + uy * uy <= 0.25
+
+        # Inside a convex shape means being on the inner side of every one of its edges.
+        template = self._template
+        edges = np.roll(template, -1, axis=0) - template
+        cross = edges[:, 0] * (uy[:, None] - template[:, 1]) - edges[:, 1] * (ux[:, None] - template[:, 0])
+        return np.all(cross >= 0, axis=1)
+
+    def overlaps(self, *args):
+        """
+        Finds the shapes whose bounding boxes overlap a box, or the bounding box of an Object.
+        Takes an Object, or four numbers (x, y, width, height)
+        :return: a numpy array of booleans, one per row
+        """
+
+        if len(args) == 1 and hasattr(args[0], '_extent'):
+            # noinspection PyProtectedMember
+            left, top, right, bottom = args[0]._extent()
+        elif len(args) == 4:
+            verify(args[0], (float, int), args[1], (float, int), args[2], (float, int), args[3], (float, int))
+            left, top, right, bottom = args[0], args[1], args[0] + args[2], args[1] + args[3]
+        else:
+            raise InvalidArgumentError('overlaps() takes an Object, or four numbers (x, y, width, height)!')
+
+        x0, y0, x1, y1 = self._bounds()
+        return (x0 <= right) & (x1 >= left) & (y0 <= bottom) & (y1 >= top)
+
+    def visible(self, visible: bool = None) -> bool:
+        """
+        Get or set the visibility of the shapes
+        :param visible: the new visibility, if any
+        :return: the visibility
+        """
+
+        if visible is not None:
+            verify(visible, bool)
+            self._visible = visible
+            self._screen._canvas.itemconfigure(self._tag, state=tk.NORMAL if visible else tk.HIDDEN)
+
+        return self._visible
+
+    def front(self) -> None:
+        """
+        Brings the shapes to the front of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_raise(self._tag)
+
+    def back(self) -> None:
+        """
+        Brings the shapes to the back of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_lower(self._tag)
+
+    def update(self) -> None:
+        """
+        Redraws the rows that changed right away, instead of waiting for the next frame.
+        :return: None
+        """
+
+        np = self._np
+        canvas = self._screen._canvas
+
+        moved = np.flatnonzero(self._moved)
+        if moved.size > 0:
+            self._moved[moved] = False
+            for item, flat in zip(self._items[moved].tolist(), self._canvas_coords(moved).tolist()):
+                canvas.coords(item, flat)
+
+        recolored = np.flatnonzero(self._recolored)
+        if recolored.size > 0:
+            self._recolored[recolored] = False
+            for item, value in zip(self._items[recolored].tolist(), self._colors[recolored].tolist()):
+                canvas.itemconfigure(item, fill=f'#{value:06x}')
+
+    def remove(self) -> None:
+        """
+        Removes every shape in the array from the Screen
+        :return: None
+        """
+
+        self._screen._canvas.delete(self._tag)
+
+        if self in self._screen._layers:
+            self._screen._layers.remove(self)
+
+    def _refresh(self) -> None:
+        # Called every frame by the Screen.
+        self.update()
+
+    def _rows(self, rows):
+        return slice(None) if rows is None else rows
+
+    def _bounds(self) -> tuple:
+        # The axis-aligned boxes around every (rotated) shape
+        np = self._np
+        radians = np.radians(self._angle)
+        cos, sin = np.abs(np.cos(radians)), np.abs(np.sin(radians))
+
+        half_width = (self._width * cos + self._height * sin) / 2
+        half_height = (self._width * sin + self._height * cos) / 2
+        cx, cy = self._x + self._width / 2, self._y + self._height / 2
+
+        return cx - half_width, cy - half_height, cx + half_width, cy + half_height
+
+    def _canvas_coords(self, rows):
+        # The flattened (x0, y0, x1, y1...) canvas coordinates of every vertex of the given rows
+        np = self._np
+        screen = self._screen
+
+        width, height = self._width[rows, None], self._height[rows, None]
+        radians = np.radians(self._angle[rows])[:, None]
+        cos, sin = np.cos(radians), np.sin(radians)
+
+        vx = self._template[:, 0] * width
+        vy = self._template[:, 1] * height
+        x = vx * cos - vy * sin + (self._x[rows, None] + width / 2)
+        y = vx * sin + vy * cos + (self._y[rows, None] + height / 2)
+
+        zoom = screen._zoom
+        coords = np.empty((len(x), self._template.shape[0] * 2))
+        coords[:, 0::2] = (x - screen.width() / 2) * zoom
+        coords[:, 1::2] = (y - screen.height() / 2) * zoom
+        return coords
+
+    def _make_template(self, shape: str, sides: int):
+        # The shape's vertices around its center, as if it were 1x1 (clockwise on the screen)
+        if shape == 'rectangle':
+            vertices = [(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)]
+        elif shape == 'triangle':
+            vertices = [(0, -0.5), (0.5, 0.5), (-0.5, 0.5)]
+        else:
+            count = OVAL_VERTICES if shape == 'oval' else sides
+            vertices = [(0.5 * math.sin(2 * math.pi * i / count), -0.5 * math.cos(2 * math.pi * i / count))
+                        for i in range(count)]
+
+        return self._np.array(vertices, dtype=float)
+
+    def _point(self, args) -> tuple:
+        if len(args) == 1 and hasattr(args[0], 'x'):
+            return args[0].x(), args[0].y()
+        elif len(args) == 1 and type(args[0]) is tuple:
+            return args[0]
+        elif len(args) == 2:
+            return args
+
+        raise InvalidArgumentError('Expected a Location, tuple, or two numbers (x, y)!')
+
+    @staticmethod
+    def _pack(color: Color) -> int:
+        red, green, blue = color.rgb()
+        return (red << 16) | (green << 8) | blue
@@ -0,0 +1,447 @@
+"""
+TileMaps: large grids of tiles, drawn a chunk at a time.
+"""
+
+import tkinter as tk
+from array import array
+
+from pydraw import Screen, Location, Color
+from pydraw.objects import Sprite
+from pydraw.errors import *
+from pydraw.util import *
+
+EMPTY = 0  # The tile id of an empty cell
+CHUNK_SIZE = 16  # The width and height (in tiles) of each chunk
+
+
+class TileMap:
+    """
+    A grid of tiles, for tile-based worlds. (REQUIRES: PIL or Pillow)
+
+    Rather than an object per cell, the map stores a single number (a tile id) per cell and draws whole chunks of
+    cells into one image each, so a 200x200 map costs a few dozen canvas items instead of 40,000 objects:
+
+        world = TileMap(screen, 200, 200, 32)
+        world.tile(1, Color('green'))
+        world.tile(2, 'water.png')
+        world.fill(1)
+        world.set(10, 4, 2)
+
+    Tiles can be a Color, an image file or a Sprite. Changing cells only marks their chunks as dirty, and
+    only dirty chunks that are in view are drawn again (once per frame, in screen.update()).
+    """
+
+    def __init__(self, screen: Screen, columns: int, rows: int, tile_size: int = 32, x: float = 0, y: float = 0,
+                 visible: bool = True):
+        verify(screen, Screen, columns, int, rows, int, tile_size, int, x, (float, int), y, (float, int),
+               visible, bool)
+
+        if columns <= 0 or rows <= 0 or tile_size <= 0:
+            raise InvalidArgumentError('A TileMap must have at least one column and row, and a positive tile size!')
+
+        try:
+            import PIL
+        except ImportError:
+            raise UnsupportedError('As PIL is not installed, TileMaps are not supported! '
+                                   'Install Pillow via: \'pip install pillow\'.')
+
+        self._screen = screen
+        self._columns = columns
+        self._rows = rows
+        self._tile_size = tile_size
+        self._location = Location(x, y)
+        self._visible = visible
+
+        self._cells = array('H', [EMPTY]) * (columns * rows)  # row-major tile ids
+
+        self._tiles = {}  # tile id -> appearance
+        self._images = {}  # (tile id, width, height) -> PIL image at the current (zoomed) tile size
+
+        self._chunk_columns = -(-columns // CHUNK_SIZE)
+        self._chunk_rows = -(-rows // CHUNK_SIZE)
+        self._chunks = {}  # chunk index -> (canvas item, PhotoImage)
+        self._dirty = set(range(self._chunk_columns * self._chunk_rows))
+        self._zoom = screen._zoom
+
+        # Chunks are drawn just below this (invisible) marker, so the map stays where it was created in the
+        # stacking order, however late its chunks are drawn.
+        self._tag = f'pydraw-tilemap-{id(self)}'
+        self._marker = screen._canvas.create_line(0, 0, 0, 0, state=tk.HIDDEN, tags=self._tag)
+
+        # noinspection PyProtectedMember
+        screen._layers.append(self)
+
+    def columns(self) -> int:
+        """
+        Returns the number of columns in the map
+        :return: the number of columns
+        """
+
+        return self._columns
+
+    def rows(self) -> int:
+        """
+        Returns the number of rows in the map
+        :return: the number of rows
+        """
+
+        return self._rows
+
+    def tile_size(self) -> int:
+        """
+        Returns the width and height of each tile in pixels
+        :return: the tile size
+        """
+
+        return self._tile_size
+
+    def width(self) -> int:
+        """
+        Returns the width of the map in pixels
+        :return: the width
+        """
+
+        return self._columns * self._tile_size
+
+    def height(self) -> int:
+        """
+        Returns the height of the map in pixels
+        :return: the height
+        """
+
+        return self._rows * self._tile_size
+
+    def x(self) -> float:
+        return self._location.x()
+
+    def y(self) -> float:
+        return self._location.y()
+
+    def location(self) -> Location:
+        """
+        Returns the location of the top-left corner of the map
+        :return: the Location
+        """
+
+        return self._location
+
+    def move(self, *args, **kwargs) -> None:
+        """
+        Move the map. Can take either a tuple, Location, or two numbers (dx, dy)
+        :return: None
+        """
+
+        diff = Location(0, 0)
+        diff.move(*args, **kwargs)
+
+        self._location.move(diff)
+
+        zoom = self._screen._zoom
+        self._screen._canvas.move(self._tag, diff.x() * zoom, diff.y() * zoom)
+
+    def moveto(self, *args, **kwargs) -> None:
+        """
+        Move the top-left corner of the map to a new location. Takes a Location, tuple, or two numbers (x, y)
+        :return: None
+        """
+
+        location = Location(*args, **kwargs)
+        self.move(location.x() - self._location.x(), location.y() - self._location.y())
+
+    def tile(self, tile_id: int, appearance=None):
+        """
+        Get or set what a tile looks like. Tile ids start at 1 (0 is an empty cell).
+        :param tile_id: the id of the tile
+        :param appearance: a Color, image filename, or Sprite, if any
+        :return: the appearance of the tile
+        """
+
+        verify(tile_id, int)
+        self._check_id(tile_id)
+
+        if appearance is not None:
+            if tile_id == EMPTY:
+                raise InvalidArgumentError('The empty tile (0) cannot be given an appearance!')
+            if not isinstance(appearance, (Color, str, Sprite)):
+                raise InvalidArgumentError('A tile must look like a Color, an image filename, or a Sprite!')
+
+            self._tiles[tile_id] = appearance
+            self._images = {key: image for key, image in self._images.items() if key[0] != tile_id}
+
+            # Only the chunks using this tile have to be drawn again.
+            self._dirty.update(self._chunks_with(tile_id))
+
+        return self._tiles.get(tile_id)
+
+    def get(self, column: int, row: int) -> int:
+        """
+        Get the tile id of a cell
+        :param column: the column of the cell
+        :param row: the row of the cell
+        :return: the tile id
+        """
+
+        return self._cells[self._index(column, row)]
+
+    def set(self, column: int, row: int, tile_id: int) -> None:
+        """
+        Set the tile of a cell
+        :param column: the column of the cell
+        :param row: the row of the cell
+        :param tile_id: the tile id to set (0 to empty the cell)
+        :return: None
+        """
+
+        self._check_id(tile_id)
+
+        index = self._index(column, row)
+        if self._cells[index] != tile_id:
+            self._cells[index] = tile_id
+            self._dirty.add((row // CHUNK_SIZE) * self._chunk_columns + column // CHUNK_SIZE)
+
+    def fill(self, tile_id: int, column: int = 0, row: int = 0, columns: int = None, rows: int = None) -> None:
+        """
+        Fill a rectangle of cells (by default the entire map) with a tile
+        :param tile_id: the tile id to fill with
+        :param column: the first column to fill
+        :param row: the first row to fill
+        :param columns: how many columns to fill, if not all of the rest
+        :param rows: how many rows to fill, if not all of the rest
+        :return: None
+        """
+
+        verify(tile_id, int, column, int, row, int, columns, int, rows, int)
+        self._check_id(tile_id)
+
+        end_column = self._columns if columns is None else min(self._columns, column + columns)
+        end_row = self._rows if rows is None else min(self._rows, row + rows)
+        column, row = max(0, column), max(0, row)
+
+        if column >= end_column or row >= end_row:
+            return
+
+        span = array('H', [tile_id]) * (end_column - column)
+        for r in range(row, end_row):
+            start = r * self._columns + column
+            self._cells[start:start + len(span)] = span
+
+        for chunk_row in range(row // CHUNK_SIZE, (end_row - 1) // CHUNK_SIZE + 1):
+            for chunk_column in range(column // CHUNK_SIZE, (end_column - 1) // CHUNK_SIZE + 1):
+                self._dirty.add(chunk_row * self._chunk_columns + chunk_column)
+
+    def load(self, cells: list) -> None:
+        """
+        Set every cell from a list of rows (each a list of tile ids)
+        :param cells: the rows of tile ids
+        :return: None
+        """
+
+        verify(cells, list)
+        if len(cells) != self._rows or any(len(row) != self._columns for row in cells):
+            raise InvalidArgumentError(f'Expected {self._rows} rows of {self._columns} tile ids!')
+
+        for row in cells:
+            for tile_id in row:
+                self._check_id(tile_id)
+
+        self._cells = array('H', [tile_id for row in cells for tile_id in row])
+        self._dirty.update(range(self._chunk_columns * self._chunk_rows))
+
+    def cell_at(self, *args) -> tuple:
+        """
+        Returns the cell at a location on the screen. Takes a Location, tuple, or two numbers (x, y)
+        :return: a tuple of (column, row), or None if the location is outside of the map
+        """
+
+        location = Location(*args)
+        column = int((location.x() - self._location.x()) // self._tile_size)
+        row = int((location.y() - self._location.y()) // self._tile_size)
+
+        if 0 <= column < self._columns and 0 <= row < self._rows:
+            return column, row
+
+        return None
+
+    def tile_at(self, *args) -> int:
+        """
+        Returns the tile id at a location on the screen. Takes a Location, tuple, or two numbers (x, y)
+        :return: the tile id (0 if the location is empty or outside of the map)
+        """
+
+        cell = self.cell_at(*args)
+        if cell is None:
+            return EMPTY
+
+        return self._cells[cell[1] * self._columns + cell[0]]
+
+    def visible(self, visible: bool = None) -> bool:
+        """
+        Get or set the visibility of the map
+        :param visible: the new visibility, if any
+        :return: the visibility
+        """
+
+        if visible is not None:
+            verify(visible, bool)
+            self._visible = visible
+            self._screen._canvas.itemconfigure(self._tag, state=tk.NORMAL if visible else tk.HIDDEN)
+            self._screen._canvas.itemconfigure(self._marker, state=tk.HIDDEN)
+
+        return self._visible
+
+    def front(self) -> None:
+        """
+        Brings the map to the front of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_raise(self._tag)
+
+    def back(self) -> None:
+        """
+        Brings the map to the back of the Screen
+        :return: None
+        """
+
+        self._screen._canvas.tag_lower(self._tag)
+
+    def update(self) -> None:
+        """
+        Draws the dirty chunks that are in view right away, instead of waiting for the next frame.
+        :return: None
+        """
+
+        self._refresh()
+
+    def remove(self) -> None:
+        """
+        Removes the map from the Screen
+        :return: None
+        """
+
+        self._screen._canvas.delete(self._tag)
+        self._chunks.clear()
+
+        if self in self._screen._layers:
+            self._screen._layers.remove(self)
+
+    def _index(self, column: int, row: int) -> int:
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            raise InvalidArgumentError(f'The cell ({column}, {row}) is outside of the TileMap!')
+
+        return row * self._columns + column
+
+    def _chunks_with(self, tile_id: int) -> set:
+        # The chunks with at least one cell of this tile. Whole rows are searched first (which happens in C).
+        chunks = set()
+        for row in range(self._rows):
+            start = row * self._columns
+            cells = self._cells[start:start + self._columns]
+            if tile_id not in cells:
+                continue
+
+            chunk_row = row // CHUNK_SIZE
+            for chunk_column in range(self._chunk_columns):
+                if tile_id in cells[chunk_column * CHUNK_SIZE:(chunk_column + 1) * CHUNK_SIZE]:
+                    chunks.add(chunk_row * self._chunk_columns + chunk_column)
+
+        return chunks
+
+    @staticmethod
+    def _check_id(tile_id: int) -> None:
+        if type(tile_id) is not int or not 0 <= tile_id <= 65535:
+            raise InvalidArgumentError('Tile ids must be whole numbers from 0 to 65535!')
+
+    # noinspection PyProtectedMember
+    def _refresh(self) -> None:
+        # Called every frame by the Screen: draws the dirty chunks that are in view.
+        zoom = self._screen._zoom
+        if zoom != self._zoom:
+            # Zooming moved our chunks, but couldn't resize them, so everything has to be drawn again.
+            self._zoom = zoom
+            self._images.clear()
+            for ref, photo in self._chunks.values():
+                self._screen._canvas.delete(ref)
+            self._chunks.clear()
+            self._dirty.update(range(self._chunk_columns * self._chunk_rows))
+
+        if len(self._dirty) == 0:
+            return
+
+        location, width, height = self._screen.camera.bounds()
+        span = self._tile_size * CHUNK_SIZE
+
+        first_column = max(0, int((location.x() - self._location.x()) // span))
+        first_row = max(0, int((location.y() - self._location.y()) // span))
+        last_column = min(self._chunk_columns - 1, int((location.x() + width - self._location.x()) // span))
+        last_row = min(self._chunk_rows - 1, int((location.y() + height - self._location.y()) // span))
+
+        for chunk_row in range(first_row, last_row + 1):
+            for chunk_column in range(first_column, last_column + 1):
+                chunk = chunk_row * self._chunk_columns + chunk_column
+                if chunk in self._dirty:
+                    self._dirty.discard(chunk)
+                    self._draw_chunk(chunk_column, chunk_row)
+
+    # noinspection PyProtectedMember
+    def _draw_chunk(self, chunk_column: int, chunk_row: int) -> None:
+        from PIL import Image as PILImage, ImageTk
+
+        canvas = self._screen._canvas
+        chunk = chunk_row * self._chunk_columns + chunk_column
+
+        if chunk in self._chunks:
+            canvas.delete(self._chunks.pop(chunk)[0])
+
+        first_column, first_row = chunk_column * CHUNK_SIZE, chunk_row * CHUNK_SIZE
+        columns = min(CHUNK_SIZE, self._columns - first_column)
+        rows = min(CHUNK_SIZE, self._rows - first_row)
+
+        # The edges of the tiles on the canvas. These are rounded where they fall (rather than rounding the size of a
+        # tile), so that tiles and chunks always meet without seams, whatever the zoom. Tiles may differ by a pixel.
+        left, top = self._screen._canvas_x(self._location.x()), self._screen._canvas_y(self._location.y())
+        step = self._tile_size * self._zoom
+        xs = [round(left + (first_column + i) * step) for i in range(columns + 1)]
+        ys = [round(top + (first_row + i) * step) for i in range(rows + 1)]
+
+        image = None
+
+        for row in range(rows):
+            height = ys[row + 1] - ys[row]
+            start = (first_row + row) * self._columns + first_column
+            for column, tile_id in enumerate(self._cells[start:start + columns]):
+                width = xs[column + 1] - xs[column]
+                if tile_id == EMPTY or tile_id not in self._tiles or width <= 0 or height <= 0:
+                    continue
+
+                if image is None:
+                    image = PILImage.new('RGBA', (max(1, xs[-1] - xs[0]), max(1, ys[-1] - ys[0])))
+                image.paste(self._tile_image(tile_id, width, height), (xs[column] - xs[0], ys[row] - ys[0]))
+
+        if image is None:
+            return  # Nothing but empty cells.
+
+        photo = ImageTk.PhotoImage(image)
+        ref = canvas.create_image(xs[0], ys[0], image=photo, anchor=tk.NW, tags=self._tag,
+                                  state=tk.NORMAL if self._visible else tk.HIDDEN)
+        canvas.tag_lower(ref, self._marker)
+
+        self._chunks[chunk] = (ref, photo)
+
+    def _tile_image(self, tile_id: int, width: int, height: int):
+        key = (tile_id, width, height)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        from PIL import Image as PILImage
+
+        appearance = self._tiles[tile_id]
+        if isinstance(appearance, Color):
+            image = PILImage.new('RGBA', (width, height), appearance.rgb() + (255,))
+        else:
+            source = appearance.image() if isinstance(appearance, Sprite) else PILImage.open(appearance)
+            image = source.convert('RGBA').resize((width, height), PILImage.LANCZOS)
+
+        self._images[key] = image
+        return image
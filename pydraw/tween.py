@@ -0,0 +1,203 @@
+"""
+Tweens: smoothly animating the properties of objects over time, see `screen.animate()`.
+"""
+
+import math
+import time
+
+from pydraw import Screen, Color
+from pydraw.objects import Object, Rectangle, Oval, Triangle, Polygon
+from pydraw.errors import *
+from pydraw.util import *
+
+PROPERTIES = ('x', 'y', 'width', 'height', 'rotation', 'color')
+
+
+def _ease_in_out(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+def _bounce(t: float) -> float:
+    if t < 1 / 2.75:
+        return 7.5625 * t * t
+    elif t < 2 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+    elif t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+
+def _elastic(t: float) -> float:
+    if t == 0 or t == 1:
+        return t
+
+    return 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * (2 * math.pi / 3)) + 1
+
+
+# Easing functions take the fraction of time that has passed (0 to 1) and return how far along the tween should be.
+EASINGS = {
+    'linear': lambda t: t,
+    'ease_in': lambda t: t * t,
+    'ease_out': lambda t: 1 - (1 - t) * (1 - t),
+    'ease_in_out': _ease_in_out,
+    'bounce': _bounce,
+    'elastic': _elastic,
+}
+
+# For these classes, setting the position, size and rotation all at once only means updating the canvas once.
+_BATCHED = (Rectangle, Oval, Triangle, Polygon)
+
+
+class Tween:
+    """
+    A change of one or more properties of an object over time, created with `screen.animate()`.
+    """
+
+    def __init__(self, screen: Screen, obj: Object, duration: float, easing, callback, properties: dict):
+        verify(screen, Screen, duration, (float, int))
+
+        if not isinstance(obj, Object):
+            raise InvalidArgumentError('Only Objects can be animated!')
+        if duration < 0:
+            raise InvalidArgumentError('The duration of an animation cannot be negative!')
+        if len(properties) == 0:
+            raise InvalidArgumentError(f'Nothing to animate! Pass any of: {", ".join(PROPERTIES)}')
+
+        if isinstance(easing, str):
+            if easing not in EASINGS:
+                raise InvalidArgumentError(f'Unknown easing: {easing}, expected one of: {", ".join(EASINGS)}')
+            easing = EASINGS[easing]
+        elif not callable(easing):
+            raise InvalidArgumentError('The easing must be the name of an easing, or a function!')
+
+        self._screen = screen
+        self._object = obj
+        self._duration = duration
+        self._easing = easing
+        self._callback = callback
+        self._start = time.perf_counter()
+        self._finished = False
+
+        # Each property is stored as (name, start, end), colors as rgb tuples so we can interpolate them.
+        self._properties = []
+        for name, end in properties.items():
+            if name not in PROPERTIES or not callable(getattr(obj, name, None)):
+                raise InvalidArgumentError(f'{type(obj).__name__}s cannot animate \'{name}\'!')
+
+            if name == 'color':
+                verify(end, Color)
+                self._properties.append((name, obj.color().rgb(), end.rgb()))
+            else:
+                verify(end, (float, int))
+                self._properties.append((name, getattr(obj, name)(), end))
+
+    def object(self) -> Object:
+        """
+        Returns the object being animated
+        :return: the Object
+        """
+
+        return self._object
+
+    def progress(self) -> float:
+        """
+        Returns how much of the animation has been played, from 0 to 1
+        :return: the progress
+        """
+
+        if self._finished or self._duration == 0:
+            return 1.0
+
+        return min(1.0, (time.perf_counter() - self._start) / self._duration)
+
+    def done(self) -> bool:
+        """
+        Returns whether the animation has finished (or was cancelled)
+        :return: True if the animation is over
+        """
+
+        return self._finished
+
+    def cancel(self) -> None:
+        """
+        Stops the animation, leaving the object wherever it is right now
+        :return: None
+        """
+
+        self._finished = True
+
+    # noinspection PyProtectedMember
+    @staticmethod
+    def _advance(tweens: list, now: float) -> list:
+        """
+        Moves every tween forward to `now`, all in one pass. The values from every tween are gathered per object first
+        (so later tweens win over earlier ones), and then each object is updated once. Tweens of objects that are no
+        longer on the Screen are dropped.
+        :return: the tweens that are still playing
+        """
+
+        changes = {}  # id(obj) -> (obj, {property: value})
+        playing = []
+        finished = []
+        present = set(id(obj) for obj in tweens[0]._screen._objects) if len(tweens) > 0 else set()
+
+        for tween in tweens:
+            if tween._finished:
+                continue
+
+            if id(tween._object) not in present:
+                tween._finished = True
+                continue
+
+            t = 1.0 if tween._duration == 0 else min(1.0, (now - tween._start) / tween._duration)
+            eased = tween._easing(t)
+
+            values = changes.setdefault(id(tween._object), (tween._object, {}))[1]
+            for name, start, end in tween._properties:
+                if name == 'color':
+                    values[name] = tuple(max(0, min(255, round(a + (b - a) * eased))) for a, b in zip(start, end))
+                else:
+                    values[name] = start + (end - start) * eased
+
+            if t >= 1:
+                tween._finished = True
+                finished.append(tween)
+            else:
+                playing.append(tween)
+
+        for obj, values in changes.values():
+            Tween._commit(obj, values)
+
+        for tween in finished:
+            if tween._callback is not None:
+                tween._callback()
+
+        return playing
+
+    # noinspection PyProtectedMember
+    @staticmethod
+    def _commit(obj: Object, values: dict) -> None:
+        color = values.pop('color', None)
+        if color is not None and color != obj._color.rgb():
+            obj.color(Color(*color))
+
+        if len(values) == 0:
+            return
+
+        if type(obj) in _BATCHED:
+            # Write everything straight into the object, and then move its item on the canvas just once.
+            obj._location.moveto(values.get('x', obj._location.x()), values.get('y', obj._location.y()))
+            obj._width = values.get('width', obj._width)
+            obj._height = values.get('height', obj._height)
+            obj._angle = values.get('rotation', obj._angle)
+
+            obj._update_coords()
+            obj._pen_follow()
+            return
+
+        for name, value in values.items():
+            getattr(obj, name)(value)
@@ -1,3 +1,4 @@
+from pydraw import config
 from pydraw.errors import *
 
 
@@ -26,6 +27,10 @@ def verify(*args):
     :param args: a list of objects and types, ex: (some_number, float, some_location, Location)
     :return: True if all args meet their expected types, throws an error if not.
     """
+    # Only in 'full', 'fast' keeps just the checks of methods decorated with validate() (see pydraw.config)
+    if config.validation != 'full':
+        return True
+
     if len(args) % 2 != 0:
         raise InvalidArgumentError('The verify() method must be passed an even number of arguments, '
                                    'Ex: (some_number, float, some_location, Location).')
@@ -37,3 +42,87 @@ def verify(*args):
 
         if not verify_type(obj, expected_type):
             raise InvalidArgumentError(f'Type does not match: {type(obj)} ({obj}) : {expected_type}')
+
+
+def validate(function):
+    """
+    Checks the arguments passed to a method against its annotations, like verify() does, but with the checks worked
+    out once (when the method is defined) instead of on every call. Numbers annotated as float also accept ints,
+    and None is always accepted (so getters are never held up). Respects `pydraw.config.validation`.
+    :param function: the function to decorate
+    :return: the decorated function
+    """
+
+    # Imported here, so that `from pydraw.util import *` doesn't hand these modules to everyone.
+    import functools
+    import inspect
+
+    checks = []
+    for index, parameter in enumerate(inspect.signature(function).parameters.values()):
+        if parameter.kind not in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            continue
+
+        allowed = _compile_annotation(parameter.annotation)
+        if allowed is not None:
+            checks.append((index, parameter.name) + allowed)
+
+    if len(checks) == 0:
+        return function
+
+    def check(args: tuple, kwargs: dict) -> None:
+        if config.validation == 'off':
+            return
+
+        for index, name, exact, classes in checks:
+            if index < len(args):
+                value = args[index]
+            elif name in kwargs:
+                value = kwargs[name]
+            else:
+                continue
+
+            if value is not None and type(value) not in exact and not isinstance(value, classes):
+                raise InvalidArgumentError(f'Type does not match: {type(value)} ({value}) : {name}')
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if len(args) > 1 or kwargs:
+            check(args, kwargs)
+
+        return function(*args, **kwargs)
+
+    wrapper._check = check  # So screen.threadsafe can run the checks itself, instead of wrapping us again.
+    return wrapper
+
+
+def _compile_annotation(annotation):
+    """
+    Turns an annotation into (exact types, classes): builtin types have to match exactly (so a bool is no int), while
+    instances of subclasses are fine for anything else. Returns None for annotations we can't check (e.g. strings).
+    """
+
+    import inspect
+    import typing
+
+    if annotation is inspect.Parameter.empty:
+        return None
+    if getattr(annotation, '__origin__', None) is typing.Union:
+        annotation = annotation.__args__
+
+    types = annotation if type(annotation) is tuple else (annotation,)
+    if len(types) == 0 or not all(isinstance(typ, type) for typ in types):
+        return None
+
+    exact = set()
+    classes = []
+    for typ in types:
+        if typ is type(None):
+            continue
+        elif typ is float:
+            exact.update((float, int))
+        elif typ.__module__ == 'builtins':
+            exact.add(typ)
+        else:
+            classes.append(typ)
+
+    return frozenset(exact), tuple(classes)
@@ -0,0 +1,107 @@
+"""
+Compound Test: Tests methods in the CompoundObject class
+"""
+
+import unittest
+from pydraw import *
+from pydraw import compound
+
+
+class CompoundTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def create_compound(self):
+        self.screen.clear()
+
+        self.rect = Rectangle(self.screen, 100, 100, 50, 50)
+        self.oval = Oval(self.screen, 200, 150, 50, 50)
+        self.line = Line(self.screen, 100, 300, 250, 300)
+
+        return compound.CompoundObject(self.rect, self.oval, self.line)
+
+    def test_bounds(self):
+        comp = self.create_compound()
+
+        self.assertEqual(comp.location(), Location(100, 100))
+        self.assertEqual(comp.width(), 150)
+        self.assertEqual(comp.height(), 200)
+
+    def test_move(self):
+        comp = self.create_compound()
+
+        comp.move(10, 20)
+        self.assertEqual(comp.location(), Location(110, 120))
+        self.assertEqual(self.rect.location(), Location(110, 120))
+        self.assertEqual(self.oval.location(), Location(210, 170))
+        self.assertEqual(self.line.pos1(), Location(110, 320))
+
+        # The canvas items have been moved along with the objects.
+        self.assertEqual(self.screen._canvas.coords(self.rect._ref)[:2],
+                         [self.rect.vertices()[0].x() - self.screen.width() / 2,
+                          self.rect.vertices()[0].y() - self.screen.height() / 2])
+
+        comp.moveto(0, 0)
+        self.assertEqual(self.rect.location(), Location(0, 0))
+        self.assertEqual(comp.width(), 150)
+
+    def test_move_image(self):
+        self.screen.clear()
+
+        image = Image(self.screen, '../images/cool_barry.jpg', 100, 100, 50, 50)
+        rect = Rectangle(self.screen, 200, 100, 50, 50)
+        comp = compound.CompoundObject(image, rect)
+
+        comp.move(10, 20)
+        self.assertEqual(image.location(), Location(110, 120))
+        self.assertEqual(image.vertices()[0], Location(110, 120))
+        self.assertEqual(self.screen._canvas.coords(image._ref),
+                         [110 + 25 - self.screen.width() / 2, 120 + 25 - self.screen.height() / 2])
+
+    def test_contains(self):
+        comp = self.create_compound()
+
+        self.assertTrue(comp.contains(125, 125))
+        self.assertFalse(comp.contains(500, 500))
+        self.assertFalse(comp.overlaps(Rectangle(self.screen, 600, 500, 10, 10)))
+        self.assertTrue(comp.overlaps(Rectangle(self.screen, 140, 140, 20, 20)))
+
+    def test_tags(self):
+        comp = self.create_compound()
+
+        comp.visible(False)
+        self.assertFalse(self.rect.visible())
+        self.assertEqual(self.screen._canvas.itemcget(self.oval._ref, 'state'), 'hidden')
+
+        comp.visible(True)
+        comp.back()
+        self.assertEqual(self.screen._canvas.find_all()[0], self.rect._ref)
+
+    def test_node(self):
+        self.screen.clear()
+
+        root = compound.Node(self.screen, 400, 300)
+        arm = compound.Node(self.screen, 100, 0)
+        rect = Rectangle(self.screen, 475, 275, 50, 50)  # centered at (500, 300)
+
+        root.add(arm)
+        arm.add(rect)
+
+        root.rotate(90)
+        root.update()
+        self.assertAlmostEqual(rect.center().x(), 400)
+        self.assertAlmostEqual(rect.center().y(), 400)
+        self.assertAlmostEqual(rect.rotation(), 90)
+
+        root.move(10, 0)
+        arm.scale(2)
+        root.update()
+        self.assertAlmostEqual(rect.center().x(), 410)
+        self.assertAlmostEqual(rect.center().y(), 400)
+        self.assertAlmostEqual(rect.width(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Dispatch Test: Tests the @overload dispatchers for methods and constructors
+"""
+
+import unittest
+from pydraw.overload import overload
+
+
+class Shape:
+    @overload(int, int)
+    def __init__(self, x, y):
+        self.args = ('int', x, y)
+
+    @overload((int, float), str)
+    def __init__(self, x, name):
+        self.args = ('name', x, name)
+
+
+class DispatchTest(unittest.TestCase):
+
+    def test_methods(self):
+        first = Shape(1, 2)
+        second = Shape(1.5, 'a')
+        self.assertEqual(first.args, ('int', 1, 2))
+        self.assertEqual(second.args, ('name', 1.5, 'a'))
+
+        # Bound dispatchers don't share their instance anymore.
+        bound = first.__init__
+        second.__init__(3, 4)
+        bound(5, 6)
+        self.assertEqual(first.args, ('int', 5, 6))
+        self.assertEqual(second.args, ('int', 3, 4))
+
+        self.assertRaises(NotImplementedError, lambda: Shape('x'))
+
+    def test_cache(self):
+        dispatcher = Shape.__dict__['__init__']
+
+        # Exact signatures are cached up front, others once they have been dispatched.
+        self.assertIn((int, int), dispatcher._cache)
+        self.assertNotIn((bool, str), dispatcher._cache)
+        Shape(True, 'b')
+        self.assertIn((bool, str), dispatcher._cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
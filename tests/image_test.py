@@ -2,6 +2,8 @@
 Image Test: Tests methods in the Image class
 """
 
+import os
+import tempfile
 import unittest
 from pydraw import *
 
@@ -22,6 +24,71 @@ class ImageTest(unittest.TestCase):
         image = Image(self.screen, '../cool_barry.jpg', screen.width() / 2, screen.height() / 2, 50, 50)
         image.rotation(30)
 
+    def test_sprite_sheet(self):
+        sheet = SpriteSheet('../images/cool_barry.jpg', {'face': (0, 0, 40, 30)}, cell=(20, 20), names=['first'])
+
+        self.assertEqual(sheet['face'].box(), (0, 0, 40, 30))
+        self.assertEqual(sheet['first'].box(), sheet[0, 0].box())
+        self.assertEqual(sheet[1, 0].box(), (20, 0, 20, 20))
+        self.assertIs(sheet['face'].image(), sheet['face'].image())  # sliced once, then cached
+
+        image = Image(self.screen, sheet['face'], 10, 10)
+        self.assertEqual(image.width(), 40)
+        self.assertEqual(image.height(), 30)
+
+        image.width(80)
+        self.assertEqual(sheet['face'].image().size, (40, 30))  # the cached slice is never modified
+
+        with self.assertRaises(InvalidArgumentError):
+            sheet['missing']
+
+        self.screen.clear()
+
+    def test_async_load(self):
+        image = Image(self.screen, '../images/cool_barry.jpg', 10, 10, 50, 50, async_load=True)
+        image.rotation(45)  # modified while loading, should still be applied once it arrives
+        image.move(10, 10)
+
+        self.assertEqual(image.width(), 50)
+        self.assertTrue(self.screen.wait_for_assets(10))
+        self.assertEqual(self.screen._canvas.type(image._ref), 'image')
+        self.assertEqual(image.rotation(), 45)
+        self.assertEqual(image.location(), Location(20, 20))
+
+        self.screen.clear()
+
+    def test_async_load_failure(self):
+        def fail():
+            raise OSError('corrupt')
+
+        def broken(future):
+            future.result()
+
+        loaded = []
+        self.screen._queue_asset(fail, (), broken)
+        self.screen._queue_asset(lambda: 'fine', (), lambda future: loaded.append(future.result()))
+
+        # The failing asset doesn't stop the other one in the same batch, and its error reaches the waiter.
+        with self.assertRaises(OSError):
+            self.screen.wait_for_assets(10)
+        self.assertEqual(loaded, ['fine'])
+        self.assertTrue(self.screen.wait_for_assets(10))
+
+        # An image that can't be decoded keeps its placeholder.
+        from PIL import Image as PILImage
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'truncated.png')
+            PILImage.new('RGB', (64, 64), 'red').save(path)
+            with open(path, 'r+b') as file:
+                file.truncate(60)
+
+            image = Image(self.screen, path, 10, 10, 64, 64, async_load=True)
+            with self.assertRaises(PydrawError):
+                self.screen.wait_for_assets(10)
+            self.assertEqual(self.screen._canvas.type(image._ref), 'rectangle')
+
+        self.screen.clear()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+"""
+LargeImage Test: Tests the methods in the LargeImage class
+"""
+
+import os
+import tempfile
+import unittest
+from pydraw import *
+from pydraw import largeimage
+
+
+class LargeImageTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+        from PIL import Image as PILImage
+        cls.filename = os.path.join(tempfile.mkdtemp(), 'large.png')
+        PILImage.new('RGB', (4096, 2048), (40, 120, 200)).save(cls.filename)
+
+    def test_levels(self):
+        image = LargeImage(self.screen, self.filename, 0, 0, 4096, 2048)
+
+        self.assertEqual(image.resolution(), (4096, 2048))
+        self.assertEqual(image.levels(), 5)  # 4096 -> 2048 -> 1024 -> 512 -> 256
+        self.assertEqual(image._level_for(1), 0)
+        self.assertEqual(image._level_for(0.25), 2)
+        self.assertEqual(image._level_for(0.01), 4)
+
+        image.remove()
+
+    def test_tiles(self):
+        self.screen.camera.reset()
+        image = LargeImage(self.screen, self.filename, 0, 0, 4096, 2048)
+        image.update()
+
+        # Only the tiles under the 800x600 view are drawn, at full resolution.
+        self.assertEqual(len(image._items), 4 * 3)
+        self.assertTrue(all(key[0] == 0 for key in image._items))
+
+        self.screen.camera.zoom(0.125)
+        image.update()
+        self.assertTrue(all(key[0] == 3 for key in image._items))
+
+        self.screen.camera.reset()
+        image.remove()
+
+    def test_memory(self):
+        self.screen.camera.reset()
+        tile = largeimage.TILE_SIZE ** 2 * 4
+        image = LargeImage(self.screen, self.filename, 0, 0, 4096, 2048, memory=tile)
+        image.update()
+
+        # The image was decoded once and its whole pyramid written to disk, only the tiles in view stay in memory.
+        self.assertEqual(image._written, set(range(image.levels())))
+        self.assertEqual(len(image._cache), len(image._items))
+
+        written = sorted(os.listdir(image._directory))
+        image.moveto(-2048, 0)
+        image.update()
+        self.assertEqual(len(image._cache), len(image._items))
+        self.assertEqual(sorted(os.listdir(image._directory)), written)
+
+        directory = image._directory
+        image.remove()
+        self.assertFalse(os.path.exists(directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
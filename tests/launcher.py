@@ -1,9 +1,8 @@
 from pydraw import *
-import random
 
 PROJECTILE_SPEED = 10
 TARGET_SPEED = 5
-PARTICLE_SPEED = 15
+PARTICLE_SPEED = 450  # pixels per second
 
 screen = Screen(800, 600, "Projectile")
 
@@ -12,7 +11,7 @@ launcher.move(-launcher.width() / 2, -launcher.height() / 2)
 
 projectiles = []
 targets = []
-particles = []
+particles = ParticleSystem(screen, 200, size=5, lifetime=2)
 
 
 def setup_targets():
@@ -24,9 +23,7 @@ def setup_targets():
 
 def spawn_explosion(location):
     for i in range(10):
-        particle = Oval(screen, location.x(), location.y(), 5, 5, Color.random())
-        particle.rotation(random.random() * 360)
-        particles.append(particle)
+        particles.emit(location, speed=PARTICLE_SPEED, color=Color.random())
 
 
 def fire(location):
@@ -85,18 +82,6 @@ while running:
     for target in targets:
         target.move(dx=target_direction * TARGET_SPEED)
 
-    for particle in particles:
-        particle.forward(PARTICLE_SPEED)
-        if particle.x() < 0 or particle.x() + particle.width() > screen.width():
-            particles.remove(particle)
-            particle.remove()
-            del particle
-        elif particle.y() < 0 or particle.y() + particle.height() > screen.height():
-            particles.remove(particle)
-            particle.remove()
-            del particle
-            continue
-
     screen.update()
     screen.sleep(fps)
 
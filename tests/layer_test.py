@@ -0,0 +1,68 @@
+"""
+Layer Test: Tests baking objects into a Layer
+"""
+
+import unittest
+from pydraw import *
+
+
+class LayerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def test_bake(self):
+        self.screen.clear()
+        canvas = self.screen._canvas
+
+        squares = [Rectangle(self.screen, 50 * i, 50 * (i % 2), 50, 50, Color('black')) for i in range(8)]
+        label = Text(self.screen, 'Board', 10, 200)
+
+        layer = self.screen.bake(squares + [label])
+        self.assertTrue(layer.static())
+        self.assertEqual(canvas.itemcget(squares[0]._ref, 'state'), 'hidden')
+        self.assertEqual(canvas.itemcget(label._ref, 'state'), 'normal')  # Text is never baked
+        self.assertEqual(canvas.type(layer._ref), 'image')
+        self.assertTrue(squares[0].visible())
+
+        # Nothing changed, so nothing is baked again.
+        ref = layer._ref
+        self.screen.update()
+        self.assertEqual(layer._ref, ref)
+
+        squares[0].move(0, 100)
+        self.screen.update()
+        self.assertNotEqual(layer._ref, ref)
+
+        # Any change to an object marks the layer, and it's baked once more.
+        ref = layer._ref
+        squares[1].color(Color('red'))
+        self.assertTrue(layer._dirty)
+        self.screen.update()
+        self.assertFalse(layer._dirty)
+        self.assertNotEqual(layer._ref, ref)
+
+        layer.static(False)
+        self.assertEqual(canvas.itemcget(squares[0]._ref, 'state'), 'normal')
+        self.assertIsNone(layer._ref)
+
+        layer.clear()
+        self.assertIsNone(squares[0]._layer)
+
+    def test_clear(self):
+        self.screen.clear()
+
+        layer = self.screen.bake([Rectangle(self.screen, 0, 0, 50, 50)])
+        world = TileMap(self.screen, 10, 10, 32)
+        self.assertIn(layer, self.screen._layers)
+
+        # Clearing (or switching scenes) takes every layer with it.
+        self.screen.clear()
+        self.assertEqual(self.screen._layers, [])
+        self.assertIsNone(layer._ref)
+        self.assertEqual(self.screen._canvas.find_withtag(world._tag), ())
+
+
+if __name__ == '__main__':
+    unittest.main()
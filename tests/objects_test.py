@@ -5,6 +5,8 @@ Objects Test: Tests methods on the Object class.
 import unittest
 from pydraw.errors import *
 from pydraw import Screen, Location, Color, Rectangle, Oval, Triangle, Renderable, Polygon
+from pydraw import config
+from pydraw.util import verify
 
 
 class ObjectsTest(unittest.TestCase):
@@ -70,6 +72,104 @@ class ObjectsTest(unittest.TestCase):
 
             start.move(100, 100)
 
+    def test_pen(self):
+        self.screen.clear()
+
+        rect = Rectangle(self.screen, 100, 100, 50, 50)
+        pen = rect.pen(Color('red'), 3, max_points=100, simplify_tolerance=1)
+        self.assertTrue(pen.drawing())
+        self.assertEqual(pen.coordinates()[0], Location(125, 125))
+
+        for i in range(1000):
+            rect.move(1, 0 if i % 2 == 0 else 1)
+
+        self.assertLessEqual(len(pen.coordinates()), 125)
+        self.assertEqual(pen.coordinates()[-1], rect.center())
+
+        rect.pen_stop()
+        rect.move(10, 10)
+        self.assertNotEqual(pen.coordinates()[-1], rect.center())
+
+        rect.pen_clear()
+        self.assertEqual(len(pen.coordinates()), 0)
+
+    def test_native_items(self):
+        self.screen.clear()
+
+        canvas = self.screen._canvas
+        rect = Rectangle(self.screen, 100, 100, 50, 20)
+        oval = Oval(self.screen, 200, 100, 40, 40)
+        above = Rectangle(self.screen, 110, 110, 10, 10)
+
+        self.assertEqual(canvas.type(rect._ref), 'rectangle')
+        self.assertEqual(canvas.type(oval._ref), 'oval')
+        self.assertEqual(rect.vertices()[2], Location(150, 120))
+
+        rect.rotate(45)
+        oval.rotate(45)  # circles stay ovals
+        self.assertEqual(canvas.type(rect._ref), 'polygon')
+        self.assertEqual(canvas.type(oval._ref), 'oval')
+        self.assertLess(canvas.find_all().index(rect._ref), canvas.find_all().index(above._ref))
+
+        rect.rotation(0)
+        self.assertEqual(canvas.type(rect._ref), 'rectangle')
+        self.assertEqual(rect.vertices()[0], Location(100, 100))
+
+    def test_oval_tessellation(self):
+        self.screen.clear()
+
+        star = Oval(self.screen, 100, 100, 3, 3)
+        other = Oval(self.screen, 200, 100, 4, 4)
+        planet = Oval(self.screen, 200, 200, 300, 300)
+
+        self.assertEqual(len(star.vertices()), 8)
+        self.assertIs(star._shape, other._shape)
+        self.assertGreater(len(planet.vertices()), 40)
+
+        star.width(300)
+        star.height(300)
+        self.assertEqual(len(star.vertices()), len(planet.vertices()))
+
+        # The vertex count follows how big the Oval looks on screen.
+        egg = Oval(self.screen, 400, 200, 60, 40)
+        count = len(egg.vertices())
+        self.screen.camera.zoom(4)
+        self.assertGreater(len(egg.vertices()), count)
+        self.assertEqual(len(self.screen._canvas.coords(egg._ref)), len(egg.vertices()) * 2)
+
+        # Ovals made while zoomed in start out with the on-screen vertex count too.
+        hatched = Oval(self.screen, 400, 300, 60, 40)
+        self.assertIs(hatched._shape, egg._shape)
+
+        self.screen.camera.zoom(0.25)
+        self.assertLess(len(egg.vertices()), count)
+        self.screen.camera.reset()
+
+    def test_validation(self):
+        self.screen.clear()
+        rect = Rectangle(self.screen, 100, 100, 50, 50)
+
+        rect.x(120)
+        rect.width(60.5)
+        self.assertRaises(InvalidArgumentError, rect.x, '120')
+        self.assertRaises(InvalidArgumentError, rect.visible, 1)
+        self.assertRaises(InvalidArgumentError, rect.color, 'red')
+        self.assertTrue(rect.contains(130, 120))
+
+        try:
+            config.validation = 'fast'
+            self.assertRaises(InvalidArgumentError, rect.width, '60')
+            self.assertRaises(InvalidArgumentError, rect.border, None, '2')
+            self.assertRaises(InvalidArgumentError, rect.rotate, '90')
+            self.assertTrue(verify('not a number', int))
+
+            config.validation = 'off'
+            rect.fill(1)
+            self.assertEqual(rect.fill(), 1)
+        finally:
+            config.validation = 'full'
+            rect.fill(True)
+
     def create_objects(self):
         self.screen.clear()
 
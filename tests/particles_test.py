@@ -0,0 +1,58 @@
+"""
+Particles Test: Tests the methods in the ParticleSystem class
+"""
+
+import unittest
+from pydraw import *
+
+
+class ParticlesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def test_pool(self):
+        items = len(self.screen._canvas.find_all())
+        sparks = ParticleSystem(self.screen, 10, size=4, lifetime=1)
+        self.assertEqual(len(self.screen._canvas.find_all()), items + 10)
+
+        self.assertEqual(sparks.emit(Location(100, 100), count=6, speed=100, direction=90, spread=0), 6)
+        self.assertEqual(sparks.emit(100, 100, count=6), 4)  # the pool is full
+        self.assertEqual(sparks.count(), 10)
+
+        sparks.step(0.5)
+        self.assertAlmostEqual(sparks._x[0], 150)  # the first particle moved right at 100px/s
+
+        # Dead particles are hidden and reused, never deleted.
+        sparks.step(0.6)
+        self.assertEqual(sparks.count(), 0)
+        self.assertEqual(len(self.screen._canvas.find_all()), items + 10)
+        self.assertEqual(self.screen._canvas.itemcget(sparks._items[0], 'state'), 'hidden')
+
+        sparks.emit(0, 0, count=3)
+        self.assertEqual(sparks.count(), 3)
+        self.assertEqual(len(self.screen._canvas.find_all()), items + 10)
+
+        sparks.remove()
+        self.assertEqual(len(self.screen._canvas.find_all()), items)
+
+        # A removed system is simply empty.
+        sparks.step(0.1)
+        self.assertEqual(sparks.count(), 0)
+        self.assertEqual(sparks.emit(0, 0), 0)
+        self.assertNotIn(sparks, self.screen._layers)
+
+    def test_gravity(self):
+        dust = ParticleSystem(self.screen, 5, gravity=100, lifetime=10)
+        dust.emit(0, 0, speed=0)
+
+        dust.step(1)
+        index = [i for i in range(5) if dust._alive[i]][0]
+        self.assertAlmostEqual(dust._y[index], 100)
+
+        dust.remove()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,13 @@
 Screen Test: Tests the methods in the Screen class
 """
 
+import io
+import contextlib
+import threading
+import time
 import unittest
-from pydraw import Screen, Color, Rectangle
+from pydraw import Screen, Color, Rectangle, Location, Line
+from pydraw.errors import *
 
 
 class ScreenTest(unittest.TestCase):
@@ -16,6 +21,20 @@ class ScreenTest(unittest.TestCase):
         self.screen.color(Color('red'))
         self.assertEqual(self.screen.color(), Color('red'))
 
+    def test_grid(self):
+        self.screen.grid(cellsize=(100, 100))
+        self.assertEqual(len(self.screen.gridlines()), 12)
+        self.assertEqual(self.screen.gridlines()[0], (Location(0, 100), Location(800, 100)))
+
+        items = self.screen._canvas.find_withtag('pydraw-grid')
+        self.assertEqual(len(items), 24)  # the lines and their labels
+
+        self.screen.toggle_grid(False)
+        self.assertEqual(self.screen._canvas.itemcget(items[0], 'state'), 'hidden')
+
+        self.screen.toggle_grid(True)
+        self.assertEqual(self.screen._canvas.itemcget(items[-1], 'state'), 'normal')
+
     def test_helpers(self):
         self.screen.toggle_grid()
         self.screen.clear()
@@ -37,6 +56,221 @@ class ScreenTest(unittest.TestCase):
 
         self.screen.remove(rect)
 
+    def test_camera(self):
+        camera = self.screen.camera
+        rect = Rectangle(self.screen, 1000, 1000, 50, 50)
+        rect.border_width(3)
+        line = Line(self.screen, 1000, 1000, 1100, 1100, thickness=2)
+
+        camera.move(1000, 1000)
+        self.assertEqual(camera.location(), Location(1000, 1000))
+        self.assertEqual(rect.location(), Location(1000, 1000))  # objects keep their coordinates
+
+        camera.zoom(2)
+        self.assertEqual(camera.size(), (400, 300))
+        self.assertEqual(camera.center(), Location(1400, 1300))
+        self.assertEqual(self.screen.create_location(*self.screen.canvas_location(1100, 1200), canvas=True),
+                         Location(1100, 1200))
+
+        # Outlines and lines get thicker with the zoom, as Tk only scales coordinates.
+        self.assertEqual(float(self.screen._canvas.itemcget(rect._ref, 'width')), 6)
+        self.assertEqual(float(self.screen._canvas.itemcget(line._ref, 'width')), 4)
+
+        camera.reset()
+        self.assertEqual(camera.bounds(), (Location(0, 0), 800, 600))
+        self.assertEqual(float(self.screen._canvas.itemcget(rect._ref, 'width')), 3)
+        self.screen.remove(rect)
+        self.screen.remove(line)
+
+    def test_culling(self):
+        near = Rectangle(self.screen, 100, 100, 50, 50)
+        far = Rectangle(self.screen, 3000, 100, 50, 50)
+
+        self.screen.culling(True)
+        self.screen.update()
+        self.assertEqual(self.screen._canvas.itemcget(far._ref, 'state'), 'hidden')
+        self.assertEqual(self.screen._canvas.itemcget(near._ref, 'state'), 'normal')
+        self.assertTrue(far.visible())
+        self.assertIsNotNone(far._bounds)
+        self.assertFalse(self.screen._reshaped)
+
+        # Culled objects don't touch the canvas when they move, and only drop their cached extent.
+        coords = self.screen._canvas.coords(far._ref)
+        far.move(10, 0)
+        self.assertEqual(self.screen._canvas.coords(far._ref), coords)
+        self.assertIsNone(far._bounds)
+
+        far.move(-2810, 0)
+        self.screen.update()
+        self.assertEqual(self.screen._canvas.itemcget(far._ref, 'state'), 'normal')
+        self.assertEqual(self.screen._canvas.coords(far._ref)[0], self.screen._canvas_x(200))
+
+        self.screen.culling(False)
+        self.screen.remove(near)
+        self.screen.remove(far)
+
+    def test_input(self):
+        moves = []
+        drags = []
+
+        def mousedrag(button, location):  # the deprecated argument order still works
+            drags.append((button, location))
+
+        self.screen.registry['mousemove'] = lambda location: moves.append(location)
+        self.screen.registry['mousedrag'] = mousedrag
+
+        # A fast drag only reaches the handlers once, with the latest position.
+        for i in range(10):
+            self.screen._queue_move(100 + i, 100)
+            self.screen._queue_drag(1, i, 0)
+        self.screen._flush_input()
+
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0], self.screen._move_location(109, 100))
+        self.assertEqual(drags, [(1, self.screen.create_location(9, 0))])
+        self.assertIs(self.screen._handler('mousedrag'), self.screen._handler('mousedrag'))
+
+        self.screen.registry.clear()
+
+    def test_pressed(self):
+        class Event:
+            def __init__(self, char, keysym, keycode=0):
+                self.char = char
+                self.keysym = keysym
+                self.keycode = keycode
+
+        self.screen._keyhandler(Event('w', 'w'))
+        self.screen._keyhandler(Event(' ', 'space'))
+        self.assertTrue(self.screen.pressed('w'))
+        self.assertTrue(self.screen.pressed('space'))
+        self.assertFalse(self.screen.pressed('a'))
+
+        self.screen._keyuphandler(Event('w', 'w'))
+        self.assertFalse(self.screen.pressed('w'))
+        self.assertEqual(self.screen.pressed(), ('space',))
+
+        # Shift is pressed before '1' is let go, so it is released as '!' (but it's still the same key).
+        self.screen._keyhandler(Event('1', '1', 10))
+        self.screen._keyhandler(Event('', 'Shift_L', 50))
+        self.screen._keyuphandler(Event('!', 'exclam', 10))
+        self.screen._keyuphandler(Event('', 'Shift_L', 50))
+        self.assertFalse(self.screen.pressed('1'))
+        self.assertEqual(self.screen.pressed(), ('space',))
+
+        self.screen._mousedown(1, Location(10, 10))
+        self.screen._mousedown(3, Location(10, 10))
+        self.screen._mouseup(1, Location(10, 10))
+        self.assertEqual(self.screen.buttons(), (3,))
+
+        self.screen._release_all()
+        self.assertEqual(self.screen.pressed(), ())
+        self.assertEqual(self.screen.buttons(), ())
+
+    def test_async(self):
+        frames = []
+
+        async def main():
+            for i in range(3):
+                frames.append(await self.screen.next_frame(120))
+            return 'done'
+
+        self.assertEqual(self.screen.run_async(main()), 'done')
+        self.assertEqual(len(frames), 3)
+        self.assertGreater(frames[-1], 0)
+
+        self.assertRaises(InvalidArgumentError, lambda: self.screen.run_async(main))
+
+    def test_threads(self):
+        rect = Rectangle(self.screen, 100, 100, 50, 50)
+        results = {}
+
+        def work():
+            results['move'] = rect.moveto(300, 200)
+            rect.color(Color('blue'))
+            results['width'] = rect.width()  # getters don't need to wait
+            results['future'] = self.screen.call(Rectangle, self.screen, 0, 0, 10, 10)
+            results['broken'] = rect.moveto(1, 2, 3)
+
+            # Mistakes in the arguments are raised right where they were made.
+            try:
+                rect.width('wide')
+            except InvalidArgumentError:
+                results['checked'] = True
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        # Nothing has touched Tk yet, it all happens on the next update.
+        self.assertEqual(results['width'], 50)
+        self.assertEqual(rect.location(), Location(100, 100))
+        self.assertFalse(results['future'].done())
+        self.assertFalse(results['move'].done())
+        self.assertTrue(results['checked'])
+
+        self.screen.update()
+        self.assertEqual(rect.location(), Location(300, 200))
+        self.assertTrue(results['move'].done())
+        self.assertIsInstance(results['broken'].exception(), InvalidArgumentError)  # kept out of update()
+        self.assertEqual(rect.color(), Color('blue'))
+        self.assertIsInstance(results['future'].result(), Rectangle)
+
+        self.screen.remove(rect)
+        self.screen.remove(results['future'].result())
+
+        # What a call from another thread returns is documented on every such method.
+        self.assertIn('Future', Rectangle.width.__doc__)
+        self.assertIn('Future', Rectangle.front.__doc__)
+
+    def test_timers(self):
+        calls = []
+
+        once = self.screen.after(0, calls.append, 'once')
+        repeating = self.screen.every(0.01, calls.append, 'every')
+        cancelled = self.screen.after(0, calls.append, 'cancelled')
+        cancelled.cancel()
+        later = self.screen.after(60, calls.append, 'later')
+
+        self.screen.update()
+        self.assertEqual(calls, ['once'])
+        self.assertFalse(once.active())
+        self.assertGreater(later.remaining(), 59)
+
+        time.sleep(0.02)
+        self.screen.update()
+        self.assertEqual(calls, ['once', 'every'])
+
+        repeating.cancel()
+        later.cancel()
+        time.sleep(0.02)
+        self.screen.update()
+        self.assertEqual(calls, ['once', 'every'])
+
+        self.assertRaises(InvalidArgumentError, lambda: self.screen.every(0, print))
+
+        # Cancelled timers don't pile up in the heap.
+        for i in range(100):
+            self.screen.after(60, print).cancel()
+        self.assertLessEqual(len(self.screen._timers), 50)
+
+        # A repeating timer keeps going, even if its function raises, and so does the rest of the frame.
+        def fail():
+            calls.append('fail')
+            raise ValueError()
+
+        failing = self.screen.every(0.01, fail)
+        self.screen.after(0.01, calls.append, 'after')
+        time.sleep(0.02)
+
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            self.screen.update()
+        self.assertIn('ValueError', errors.getvalue())
+        self.assertEqual(calls[-2:], ['fail', 'after'])
+        self.assertTrue(failing.active())
+        self.assertTrue(failing._queued)
+        failing.cancel()
+
 
 if __name__ == '__main__':
     unittest.main()
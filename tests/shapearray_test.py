@@ -0,0 +1,56 @@
+"""
+ShapeArray Test: Tests the methods in the ShapeArray class
+"""
+
+import unittest
+from pydraw import *
+
+
+class ShapeArrayTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def test_columns(self):
+        import numpy
+
+        shapes = ShapeArray(self.screen, 100, 'rectangle', x=numpy.arange(100) * 10, y=50, width=10, height=20)
+        self.assertEqual(len(shapes), 100)
+        self.assertEqual(shapes.x()[3], 30)
+        self.assertEqual(shapes.height(5), 20)
+
+        shapes.move(5, 0, rows=slice(0, 10))
+        self.assertEqual(shapes.x(0), 5)
+        self.assertEqual(shapes.x(10), 100)
+
+        # Only the moved rows are waiting to be redrawn.
+        self.assertEqual(int(shapes._moved.sum()), 10)
+        self.screen.update()
+        self.assertEqual(int(shapes._moved.sum()), 0)
+        self.assertEqual(self.screen._canvas.coords(int(shapes._items[0]))[:2],
+                         [self.screen._canvas_x(5), self.screen._canvas_y(50)])
+
+        shapes.color(Color(255, 0, 0), rows=[1, 2])
+        self.assertEqual(shapes.color(rows=1)[0], Color(255, 0, 0))
+        self.screen.update()
+        self.assertEqual(self.screen._canvas.itemcget(int(shapes._items[2]), 'fill'), '#ff0000')
+
+        shapes.remove()
+
+    def test_contains(self):
+        shapes = ShapeArray(self.screen, 3, 'oval', x=[0, 100, 200], y=0, width=50, height=50)
+        self.assertEqual(shapes.contains(125, 25).tolist(), [False, True, False])
+        self.assertFalse(shapes.contains(101, 1).any())  # the corner of the box isn't in the oval
+        shapes.remove()
+
+        boxes = ShapeArray(self.screen, 2, 'rectangle', x=[0, 100], y=0, width=100, height=10)
+        boxes.rotate(90, rows=1)
+        self.assertEqual(boxes.contains(Location(150, 40)).tolist(), [False, True])
+        self.assertEqual(boxes.overlaps(140, 40, 5, 5).tolist(), [False, True])
+        self.assertEqual(boxes.overlaps(Rectangle(self.screen, 10, 0, 5, 5)).tolist(), [True, False])
+        boxes.remove()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+TileMap Test: Tests the methods in the TileMap class
+"""
+
+import unittest
+from pydraw import *
+
+
+class TileMapTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def test_cells(self):
+        world = TileMap(self.screen, 200, 200, 32, 100, 50)
+        world.tile(1, Color('green'))
+        world.tile(2, Color('blue'))
+
+        world.fill(1)
+        world.set(10, 4, 2)
+        self.assertEqual(world.get(10, 4), 2)
+        self.assertEqual(world.get(11, 4), 1)
+
+        self.assertEqual(world.cell_at(100 + 32 * 10 + 5, 50 + 32 * 4 + 5), (10, 4))
+        self.assertEqual(world.tile_at(100 + 32 * 10 + 5, 50 + 32 * 4 + 5), 2)
+        self.assertEqual(world.tile_at(0, 0), 0)
+
+        world.fill(0, 0, 0, 3, 3)
+        self.assertEqual(world.get(2, 2), 0)
+        self.assertEqual(world.get(3, 2), 1)
+
+        self.assertRaises(InvalidArgumentError, lambda: world.set(200, 0, 1))
+        world.remove()
+
+    def test_chunks(self):
+        world = TileMap(self.screen, 200, 200, 32)
+        world.tile(1, Color('green'))
+        world.fill(1)
+
+        world.update()
+        drawn = len(world._chunks)
+        self.assertGreater(drawn, 0)
+        self.assertLess(drawn, 100)  # only the chunks in view
+        self.assertEqual(len(self.screen._canvas.find_withtag(world._tag)), drawn + 1)
+
+        # Changing a cell in view only draws its chunk again.
+        ref = world._chunks[0][0]
+        other = world._chunks[1][0]
+        world.set(0, 0, 0)
+        world.update()
+        self.assertNotEqual(world._chunks[0][0], ref)
+        self.assertEqual(world._chunks[1][0], other)
+
+        # Changing a tile only draws the chunks that use it again.
+        world.tile(2, Color('blue'))
+        world.set(20, 0, 2)
+        world.update()
+        ref, other = world._chunks[0][0], world._chunks[1][0]
+        world.tile(2, Color('red'))
+        self.assertIn(1, world._dirty)
+        self.assertNotIn(0, world._dirty)
+        world.update()
+        self.assertEqual(world._chunks[0][0], ref)
+        self.assertNotEqual(world._chunks[1][0], other)
+
+        world.remove()
+
+    def test_zoom(self):
+        world = TileMap(self.screen, 40, 40, 32)
+        world.tile(1, Color('green'))
+        world.fill(1)
+
+        # At a zoom that doesn't give whole pixels per tile, neighbouring chunks still meet exactly.
+        self.screen.camera.zoom(0.7)
+        world.update()
+        canvas = self.screen._canvas
+        first = world._chunks[0]
+        second = world._chunks[1]
+        self.assertEqual(canvas.coords(first[0])[0] + first[1].width(), canvas.coords(second[0])[0])
+
+        self.screen.camera.reset()
+        world.remove()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tween Test: Tests animating objects with screen.animate()
+"""
+
+import time
+import unittest
+from pydraw import *
+from pydraw import tween
+
+
+class TweenTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.screen = Screen(800, 600)
+
+    def test_animate(self):
+        self.screen.clear()
+
+        rect = Rectangle(self.screen, 0, 0, 50, 50, Color(0, 0, 0))
+        finished = []
+        animation = self.screen.animate(rect, x=100, width=100, rotation=90, color=Color(255, 0, 0), duration=0.05,
+                                        easing='linear', callback=lambda: finished.append(True))
+
+        self.screen.update()
+        self.assertLess(rect.x(), 100)
+        self.assertFalse(animation.done())
+
+        time.sleep(0.06)
+        self.screen.update()
+        self.assertEqual(rect.x(), 100)
+        self.assertEqual(rect.width(), 100)
+        self.assertEqual(rect.rotation(), 90)
+        self.assertEqual(rect.color(), Color(255, 0, 0))
+        self.assertEqual(finished, [True])
+        self.assertTrue(animation.done())
+
+    def test_cancel(self):
+        self.screen.clear()
+
+        oval = Oval(self.screen, 0, 0, 50, 50)
+        animation = self.screen.animate(oval, y=300, duration=10)
+        animation.cancel()
+
+        self.screen.update()
+        self.assertEqual(oval.y(), 0)
+
+    def test_remove(self):
+        self.screen.clear()
+
+        text = Text(self.screen, 'Hello', 0, 0)
+        rect = Rectangle(self.screen, 0, 0, 50, 50)
+        typed = self.screen.animate(text, x=300, duration=10)
+        slid = self.screen.animate(rect, x=300, duration=10)
+
+        self.screen.update()
+        text.remove()
+        self.screen._objects.remove(rect)  # gone without going through remove()
+
+        self.screen.update()  # shouldn't try to update either of them
+        self.assertTrue(typed.done())
+        self.assertTrue(slid.done())
+        self.assertEqual(len(self.screen._tweens), 0)
+        self.screen._canvas.delete(rect._ref)
+
+    def test_easings(self):
+        for name, easing in tween.EASINGS.items():
+            self.assertAlmostEqual(easing(0), 0, 5, name)
+            self.assertAlmostEqual(easing(1), 1, 5, name)
+
+    def test_invalid(self):
+        self.screen.clear()
+
+        line = Line(self.screen, 0, 0, 100, 100)
+        self.assertRaises(InvalidArgumentError, lambda: self.screen.animate(line, width=10))
+        self.assertRaises(InvalidArgumentError, lambda: self.screen.animate(Rectangle(self.screen, 0, 0, 1, 1),
+                                                                           x=10, easing='wobbly'))
+
+
+if __name__ == '__main__':
+    unittest.main()